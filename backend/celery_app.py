@@ -10,13 +10,16 @@ This module configures Celery for distributed task processing:
 Architecture:
 - Broker: Redis (task queue)
 - Backend: Redis (result storage)
-- Worker: Celery worker process
+- Workers: gevent pool on the "io" queue, prefork pool on the "cpu" queue
 - Beat: Celery Beat scheduler for periodic tasks
 - Flower: Monitoring UI
 
 Usage:
-    # Start worker
-    celery -A celery_app worker --loglevel=info
+    # Start I/O worker (marketplace sync tasks, gevent pool)
+    celery -A celery_app worker -Q io -P gevent -c 200 --loglevel=info
+
+    # Start CPU worker (analytics/AI tasks, one task prefetched at a time)
+    celery -A celery_app worker -Q cpu --prefetch-multiplier=1 --loglevel=info
 
     # Start beat scheduler
     celery -A celery_app beat --loglevel=info
@@ -33,11 +36,21 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+RESULT_BACKEND_URL = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
+
+# Marketplace sync cadence, validated at import so a bad value fails at boot
+# rather than on the first beat tick
+SYNC_INTERVAL_HOURS = int(os.getenv("MARKETPLACE_SYNC_INTERVAL_HOURS", "6"))
+if not 1 <= SYNC_INTERVAL_HOURS <= 23:
+    raise ValueError(
+        f"MARKETPLACE_SYNC_INTERVAL_HOURS must be between 1 and 23, got {SYNC_INTERVAL_HOURS}"
+    )
+
 # Initialize Celery app
 app = Celery(
     "vintage_jeans_marketplace",
     broker=os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0"),
-    backend=os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0"),
+    backend=RESULT_BACKEND_URL,
     include=[
         "tasks.marketplace_tasks",  # Marketplace sync tasks
         "tasks.analytics_tasks",    # Analytics and AI tasks
@@ -47,9 +60,17 @@ app = Celery(
 # Celery configuration
 app.conf.update(
     # Task settings
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    # msgpack is smaller and faster than json on the wire; json is still
+    # accepted so messages enqueued by older producers keep working.
+    # Task args/results must stay msgpack-safe (no datetime objects - pass
+    # ISO strings across task boundaries).
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
+    result_serializer="msgpack",
+    # zstd-compress task messages and results (kombu registers the codec
+    # when the zstandard package is installed)
+    task_compression="zstd",
+    result_compression="zstd",
     timezone="UTC",
     enable_utc=True,
 
@@ -62,40 +83,28 @@ app.conf.update(
     task_acks_late=True,
     task_reject_on_worker_lost=True,
 
+    # Queue routing: network-bound marketplace syncs go to "io",
+    # long-running analytics/AI tasks go to "cpu"
+    task_routes={
+        "tasks.marketplace_tasks.*": {"queue": "io"},
+        "tasks.analytics_tasks.*": {"queue": "cpu"},
+    },
+
     # Worker settings
-    worker_prefetch_multiplier=1,  # One task at a time
+    # I/O-bound sync tasks benefit from prefetching while waiting on the
+    # network; start the cpu worker with --prefetch-multiplier=1
+    worker_prefetch_multiplier=int(os.getenv("CELERY_PREFETCH_MULTIPLIER", 4)),
     worker_max_tasks_per_child=100,  # Restart worker after 100 tasks (memory leak prevention)
 
     # Result backend settings
     result_expires=3600,  # Results expire after 1 hour
-    result_backend_transport_options={"master_name": "mymaster"},
 
     # Beat schedule (periodic tasks)
     beat_schedule={
-        # Sync eBay listings every 6 hours
-        "sync-ebay-listings": {
-            "task": "tasks.marketplace_tasks.sync_ebay_task",
-            "schedule": crontab(
-                hour=f"*/{os.getenv('MARKETPLACE_SYNC_INTERVAL_HOURS', 6)}"
-            ),
-            "args": ("vintage jeans", 100),
-        },
-
-        # Sync Etsy listings every 6 hours (offset by 2 hours)
-        "sync-etsy-listings": {
-            "task": "tasks.marketplace_tasks.sync_etsy_task",
-            "schedule": crontab(
-                hour=f"2-23/{os.getenv('MARKETPLACE_SYNC_INTERVAL_HOURS', 6)}"
-            ),
-            "args": ("vintage jeans", 100),
-        },
-
-        # Sync Reddit posts every 6 hours (offset by 4 hours)
-        "sync-reddit-posts": {
-            "task": "tasks.marketplace_tasks.sync_reddit_task",
-            "schedule": crontab(
-                hour=f"4-23/{os.getenv('MARKETPLACE_SYNC_INTERVAL_HOURS', 6)}"
-            ),
+        # Sync eBay, Etsy and Reddit every N hours (default 6) in a single task
+        "sync-all-marketplaces": {
+            "task": "tasks.marketplace_tasks.sync_all_marketplaces",
+            "schedule": crontab(minute=0, hour=f"*/{SYNC_INTERVAL_HOURS}"),
             "args": ("vintage jeans", 100),
         },
 
@@ -114,6 +123,13 @@ app.conf.update(
     },
 )
 
+# Sentinel master name only applies to sentinel:// backends; setting it on a
+# plain redis:// URL makes every connection attempt Sentinel discovery first
+if RESULT_BACKEND_URL.startswith("sentinel://"):
+    app.conf.result_backend_transport_options = {
+        "master_name": os.getenv("REDIS_SENTINEL_MASTER", "mymaster")
+    }
+
 # Optional: Configure logging
 app.conf.update(
     worker_log_format="[%(asctime)s: %(levelname)s/%(processName)s] %(message)s",
@@ -2,18 +2,28 @@
 Vintage Jeans Marketplace Platform API
 FastAPI backend with Supabase PostgreSQL database
 """
+from dotenv import load_dotenv
+
+# Load .env once, before any module below reads its configuration at import
+load_dotenv()
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import os
 
 from research.routers import research_router, seller_router, listing_router, blog_router, marketplace_router
 from research.db.supabase_client import health_check as supabase_health_check
+from research.db.pg_pool import init_pool, close_pool
+from research.db.cache import close_redis, get_redis
+from research.db.view_counts import run_view_flusher, flush_view_counts
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Check Supabase connection on startup."""
+    """Check Supabase connection and open the direct Postgres pool on startup."""
     # Verify Supabase connection
     health = supabase_health_check()
     if not health.get("connected"):
@@ -21,29 +31,61 @@ async def lifespan(app: FastAPI):
         print(f"Error: {health.get('error')}")
     else:
         print("✅ Supabase connected successfully")
+
+    # Direct Postgres pool for hot read paths (optional)
+    app.state.pg = await init_pool()
+    if app.state.pg is None:
+        print("ℹ️  SUPABASE_DB_URL not set, list endpoints will read via the Supabase client")
+    else:
+        print("✅ Postgres connection pool ready")
+
+    # Flush buffered view counts periodically (views are only buffered with Redis)
+    stop_view_flusher = asyncio.Event()
+    view_flusher = asyncio.create_task(run_view_flusher(stop_view_flusher)) if get_redis() is not None else None
+
     yield
 
+    if view_flusher is not None:
+        # Let an in-flight flush finish, then flush whatever is left
+        stop_view_flusher.set()
+        await view_flusher
+        await flush_view_counts()
+
+    await close_pool()
+    await close_redis()
+
 
 app = FastAPI(
     title="Vintage Jeans Marketplace Platform",
     description="AI-powered vintage jeans marketplace with seller onboarding, listing management, and market analytics.",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson encodes datetimes/UUIDs natively and is much faster than stdlib json
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for frontend
-# Read allowed origins from environment variable or use defaults
-ALLOWED_ORIGINS = os.getenv(
-    "ALLOWED_ORIGINS",
-    "http://localhost:5173,http://localhost:3000,https://*.vercel.app"
-).split(",")
+# Vercel preview/production deployments and local dev servers are matched by a
+# single precompiled regex; ALLOWED_ORIGINS can list extra exact origins
+# (e.g. custom domains), comma-separated.
+ALLOWED_ORIGIN_REGEX = os.getenv(
+    "ALLOWED_ORIGIN_REGEX",
+    r"https://.*\.vercel\.app|http://localhost:(3000|5173)"
+)
+ALLOWED_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "").split(",")
+    if origin.strip()
+]
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
+    allow_origin_regex=ALLOWED_ORIGIN_REGEX,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count"],
 )
 
 # Include routers
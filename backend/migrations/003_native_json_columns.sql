@@ -0,0 +1,43 @@
+-- Migration: Native JSONB/array columns for structured listing and blog data
+-- Date: 2025-11-05
+-- Description: Store structured fields as JSONB instead of JSON-encoded TEXT so
+-- PostgREST returns them parsed and they can be filtered/indexed server-side.
+-- tags and image_urls are already native TEXT[] columns.
+
+-- Listing features (sent by the listing create endpoint)
+ALTER TABLE listings
+ADD COLUMN IF NOT EXISTS features JSONB;
+
+-- Blog internal linking (related post IDs / listing IDs)
+ALTER TABLE blog_posts
+ADD COLUMN IF NOT EXISTS related_posts JSONB,
+ADD COLUMN IF NOT EXISTS related_listings JSONB;
+
+-- Convert any pre-existing TEXT columns holding JSON
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'listings' AND column_name = 'features' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE listings ALTER COLUMN features TYPE JSONB USING features::jsonb;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'blog_posts' AND column_name = 'related_posts' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE blog_posts ALTER COLUMN related_posts TYPE JSONB USING related_posts::jsonb;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'blog_posts' AND column_name = 'related_listings' AND data_type = 'text'
+    ) THEN
+        ALTER TABLE blog_posts ALTER COLUMN related_listings TYPE JSONB USING related_listings::jsonb;
+    END IF;
+END $$;
+
+-- Containment filters on tags (e.g. tags @> ARRAY['selvedge'])
+CREATE INDEX IF NOT EXISTS idx_listings_tags ON listings USING GIN(tags);
+CREATE INDEX IF NOT EXISTS idx_blog_posts_tags ON blog_posts USING GIN(tags);
@@ -0,0 +1,31 @@
+-- Migration: Composite indexes for listing, analytics and sync log queries
+-- Date: 2025-11-05
+-- Description: Listing queries combine status/brand/era filters with
+-- ORDER BY created_at DESC, and sellers page through their own listings.
+-- Single-column indexes can't serve these without a sort or bitmap merge.
+
+-- Listings: status + brand + era, newest first
+CREATE INDEX IF NOT EXISTS idx_listings_status_brand_era_created
+    ON listings(status, brand, era, created_at DESC);
+
+-- Listings: a seller's listings by status (seller dashboard, counters)
+CREATE INDEX IF NOT EXISTS idx_listings_seller_status
+    ON listings(seller_id, status);
+
+-- Listings: a seller's listings newest first (list endpoint for sellers)
+CREATE INDEX IF NOT EXISTS idx_listings_seller_created
+    ON listings(seller_id, created_at DESC);
+
+-- Analytics: per-seller analyses of a given type, newest first
+CREATE INDEX IF NOT EXISTS idx_analytics_seller_type_created
+    ON analytics(seller_id, analysis_type, created_at DESC);
+
+-- Sync logs: per-seller, per-platform history, newest first
+CREATE INDEX IF NOT EXISTS idx_sync_logs_seller_platform_started
+    ON sync_logs(seller_id, platform, started_at DESC);
+
+-- Redundant single-column indexes now covered by a composite's leading column
+DROP INDEX IF EXISTS idx_listings_brand;      -- covered by idx_listings_brand_era
+DROP INDEX IF EXISTS idx_listings_status;     -- covered by idx_listings_status_created
+DROP INDEX IF EXISTS idx_listings_seller_id;  -- covered by idx_listings_seller_status
+DROP INDEX IF EXISTS idx_sync_logs_seller_id; -- covered by idx_sync_logs_seller_platform_started
@@ -0,0 +1,23 @@
+-- Migration: Partial indexes for active listings and published blog posts
+-- Date: 2025-11-05
+-- Description: Public pages only ever show active listings and published
+-- posts. Over time these are a small fraction of each table, so partial
+-- indexes restricted to them stay small and hot in cache.
+
+-- Active listings, newest first (browse / Fresh Finds Flow)
+CREATE INDEX IF NOT EXISTS idx_listings_active_created
+    ON listings(created_at DESC)
+    WHERE status = 'active';
+
+-- Featured active listings, newest first
+CREATE INDEX IF NOT EXISTS idx_listings_featured_active_created
+    ON listings(created_at DESC)
+    WHERE is_featured = true AND status = 'active';
+
+-- Published blog posts, newest first (blog index / homepage)
+CREATE INDEX IF NOT EXISTS idx_blog_posts_published
+    ON blog_posts(published_at DESC)
+    WHERE status = 'published';
+
+-- Superseded by idx_listings_featured_active_created
+DROP INDEX IF EXISTS idx_listings_is_featured;
@@ -0,0 +1,31 @@
+-- Migration: Full-text search columns for listings and blog posts
+-- Date: 2025-11-05
+-- Description: Search matches title/body text through a stored tsvector
+-- column backed by a GIN index instead of ILIKE scans over every row.
+
+-- Listings: title, description, brand and model
+ALTER TABLE listings
+    ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english',
+            coalesce(title, '') || ' ' ||
+            coalesce(description, '') || ' ' ||
+            coalesce(brand, '') || ' ' ||
+            coalesce(model, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_listings_search_tsv
+    ON listings USING GIN (search_tsv);
+
+-- Blog posts: title, excerpt and content
+ALTER TABLE blog_posts
+    ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english',
+            coalesce(title, '') || ' ' ||
+            coalesce(excerpt, '') || ' ' ||
+            coalesce(content, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_blog_posts_search_tsv
+    ON blog_posts USING GIN (search_tsv);
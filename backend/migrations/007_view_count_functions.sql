@@ -0,0 +1,26 @@
+-- Migration: Atomic fetch-and-increment for view counters
+-- Date: 2025-11-05
+-- Description: Blog post and listing detail pages used to SELECT the row and
+-- then UPDATE view_count/views with a value computed in Python: two round
+-- trips, and concurrent views could overwrite each other. These functions do
+-- the increment in a single UPDATE ... RETURNING and are called via RPC.
+
+-- Increment a blog post's view_count by slug and return the updated row
+CREATE OR REPLACE FUNCTION get_blog_post_and_bump(post_slug TEXT)
+RETURNS SETOF blog_posts AS $$
+    UPDATE blog_posts
+    SET view_count = view_count + 1
+    WHERE slug = post_slug
+    RETURNING *;
+$$ LANGUAGE sql;
+
+-- Increment a listing's views and return the updated row. When viewer_uuid
+-- is given, only a listing owned by that seller is matched (admins pass NULL).
+CREATE OR REPLACE FUNCTION get_listing_and_bump(listing_uuid UUID, viewer_uuid UUID DEFAULT NULL)
+RETURNS SETOF listings AS $$
+    UPDATE listings
+    SET views = views + 1
+    WHERE id = listing_uuid
+      AND (viewer_uuid IS NULL OR seller_id = viewer_uuid)
+    RETURNING *;
+$$ LANGUAGE sql;
@@ -0,0 +1,49 @@
+-- Migration: Maintain seller listing counters with a trigger
+-- Date: 2025-11-05
+-- Description: sellers.total_listings and sellers.active_listings were
+-- updated by the API with a read-modify-write after each listing change,
+-- which costs extra round trips and loses updates under concurrency. This
+-- trigger adjusts them atomically whenever a listing is inserted, deleted
+-- or changes status.
+
+CREATE OR REPLACE FUNCTION update_seller_counters()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE sellers
+        SET total_listings = COALESCE(total_listings, 0) + 1,
+            active_listings = COALESCE(active_listings, 0) + (NEW.status = 'active')::INT
+        WHERE id = NEW.seller_id;
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE sellers
+        SET total_listings = GREATEST(0, COALESCE(total_listings, 0) - 1),
+            active_listings = GREATEST(0, COALESCE(active_listings, 0) - (OLD.status = 'active')::INT)
+        WHERE id = OLD.seller_id;
+        RETURN OLD;
+    ELSE
+        IF OLD.status IS DISTINCT FROM NEW.status THEN
+            UPDATE sellers
+            SET active_listings = GREATEST(0, COALESCE(active_listings, 0)
+                + (NEW.status = 'active')::INT
+                - (OLD.status = 'active')::INT)
+            WHERE id = NEW.seller_id;
+        END IF;
+        RETURN NEW;
+    END IF;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS listings_counter_trig ON listings;
+CREATE TRIGGER listings_counter_trig
+    AFTER INSERT OR UPDATE OF status OR DELETE ON listings
+    FOR EACH ROW EXECUTE FUNCTION update_seller_counters();
+
+-- Resync counters once so the trigger starts from correct values
+UPDATE sellers s
+SET total_listings = (
+        SELECT COUNT(*) FROM listings l WHERE l.seller_id = s.id
+    ),
+    active_listings = (
+        SELECT COUNT(*) FROM listings l WHERE l.seller_id = s.id AND l.status = 'active'
+    );
@@ -0,0 +1,20 @@
+-- Migration: Keyset pagination and trigram brand search for listings
+-- Date: 2025-11-05
+-- Description: The listings endpoint pages by (created_at, id) instead of
+-- OFFSET, and filters brand with ILIKE '%...%', which a btree can't serve.
+
+-- Keyset pagination: newest first with id as the tie-breaker
+CREATE INDEX IF NOT EXISTS idx_listings_created_id
+    ON listings(created_at DESC, id DESC);
+
+-- Seller dashboard pages through its own listings the same way
+CREATE INDEX IF NOT EXISTS idx_listings_seller_created_id
+    ON listings(seller_id, created_at DESC, id DESC);
+
+DROP INDEX IF EXISTS idx_listings_seller_created;  -- superseded by idx_listings_seller_created_id
+
+-- Substring brand matching (brand ILIKE '%levi%')
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_listings_brand_trgm
+    ON listings USING GIN (brand gin_trgm_ops);
@@ -0,0 +1,22 @@
+-- Migration: Fuzzy brand suggestions
+-- Date: 2025-11-05
+-- Description: Substring brand filtering is already served by the pg_trgm
+-- index from 009. This adds typo-tolerant matching ("levis" ~ "Levi's") via
+-- the trigram % operator, which PostgREST can't express, so it is exposed
+-- as a function and called via RPC.
+
+-- Distinct brands similar to term, best match first. When viewer_uuid is
+-- given, only that seller's listings are searched (admins pass NULL).
+CREATE OR REPLACE FUNCTION search_listing_brands(
+    term TEXT,
+    viewer_uuid UUID DEFAULT NULL,
+    max_results INT DEFAULT 10
+)
+RETURNS TABLE (brand TEXT, score REAL) AS $$
+    SELECT DISTINCT l.brand::TEXT, similarity(l.brand, term)
+    FROM listings l
+    WHERE l.brand % term
+      AND (viewer_uuid IS NULL OR l.seller_id = viewer_uuid)
+    ORDER BY 2 DESC, 1
+    LIMIT max_results;
+$$ LANGUAGE sql STABLE;
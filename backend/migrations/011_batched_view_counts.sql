@@ -0,0 +1,23 @@
+-- Migration: Batched view count increments
+-- Date: 2025-11-05
+-- Description: Detail endpoints buffer views in Redis and a background task
+-- flushes the accumulated deltas every ~30 seconds. These functions apply a
+-- whole batch in one UPDATE instead of one UPDATE per view.
+
+-- Add deltas[i] to the view_count of the blog post with slug row_keys[i]
+CREATE OR REPLACE FUNCTION add_blog_post_views(row_keys TEXT[], deltas INT[])
+RETURNS void AS $$
+    UPDATE blog_posts b
+    SET view_count = b.view_count + v.delta
+    FROM unnest(row_keys, deltas) AS v(slug, delta)
+    WHERE b.slug = v.slug;
+$$ LANGUAGE sql;
+
+-- Add deltas[i] to the views of the listing with id row_keys[i]
+CREATE OR REPLACE FUNCTION add_listing_views(row_keys UUID[], deltas INT[])
+RETURNS void AS $$
+    UPDATE listings l
+    SET views = l.views + v.delta
+    FROM unnest(row_keys, deltas) AS v(id, delta)
+    WHERE l.id = v.id;
+$$ LANGUAGE sql;
@@ -0,0 +1,38 @@
+-- Migration: Server-side market summary
+-- Date: 2025-11-05
+-- Description: /api/marketplace/trends/summary used to download every
+-- marketplace listing in the window and aggregate it in Python. This
+-- function computes the same summary in Postgres and returns it as JSON,
+-- scanning the window once via idx_marketplace_listings_created_at.
+
+-- Listing count, price stats (ignoring missing/zero prices), per-platform
+-- counts and the top 5 brands for listings created since `since`
+CREATE OR REPLACE FUNCTION get_trends_summary(since TIMESTAMPTZ)
+RETURNS JSON AS $$
+    WITH window_listings AS (
+        SELECT platform, price, brand
+        FROM marketplace_listings
+        WHERE created_at >= since
+    )
+    SELECT json_build_object(
+        'total_listings', (SELECT count(*) FROM window_listings),
+        'avg_price', (SELECT coalesce(round(avg(price), 2), 0) FROM window_listings WHERE price <> 0),
+        'min_price', (SELECT coalesce(min(price), 0) FROM window_listings WHERE price <> 0),
+        'max_price', (SELECT coalesce(max(price), 0) FROM window_listings WHERE price <> 0),
+        'platforms', (
+            SELECT coalesce(json_object_agg(platform, n), '{}'::json)
+            FROM (SELECT platform, count(*) AS n FROM window_listings GROUP BY platform) p
+        ),
+        'top_brands', (
+            SELECT coalesce(json_agg(json_build_object('brand', brand, 'count', n) ORDER BY n DESC, brand), '[]'::json)
+            FROM (
+                SELECT brand, count(*) AS n
+                FROM window_listings
+                WHERE brand <> ''
+                GROUP BY brand
+                ORDER BY n DESC, brand
+                LIMIT 5
+            ) b
+        )
+    );
+$$ LANGUAGE sql STABLE;
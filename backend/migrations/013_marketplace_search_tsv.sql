@@ -0,0 +1,34 @@
+-- Migration: Full-text search for marketplace listings
+-- Date: 2025-11-05
+-- Description: /api/marketplace/listings/search matched keywords with
+-- title/description/brand ILIKE '%...%' ORs, which can't use an index.
+-- Search now goes through a stored tsvector column (the query matches the
+-- indexed column exactly) and returns results ranked by relevance.
+
+-- Title, description and brand
+ALTER TABLE marketplace_listings
+    ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('english',
+            coalesce(title, '') || ' ' ||
+            coalesce(description, '') || ' ' ||
+            coalesce(brand, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_marketplace_listings_search_tsv
+    ON marketplace_listings USING GIN (search_tsv);
+
+-- Listings matching q, most relevant first, optionally for one platform
+CREATE OR REPLACE FUNCTION search_marketplace_listings(
+    q TEXT,
+    platform_filter TEXT DEFAULT NULL,
+    max_results INT DEFAULT 50
+)
+RETURNS SETOF marketplace_listings AS $$
+    SELECT m.*
+    FROM marketplace_listings m, plainto_tsquery('english', q) AS query
+    WHERE m.search_tsv @@ query
+      AND (platform_filter IS NULL OR m.platform = platform_filter)
+    ORDER BY ts_rank(m.search_tsv, query) DESC
+    LIMIT max_results;
+$$ LANGUAGE sql STABLE;
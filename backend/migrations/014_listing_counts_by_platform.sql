@@ -0,0 +1,12 @@
+-- Migration: Marketplace listing counts in one query
+-- Date: 2025-11-05
+-- Description: /api/marketplace/stats ran a separate count="exact" query per
+-- platform. This function returns every platform's count from a single
+-- GROUP BY, served by idx_marketplace_listings_platform.
+
+CREATE OR REPLACE FUNCTION listing_counts_by_platform()
+RETURNS TABLE (platform TEXT, n BIGINT) AS $$
+    SELECT platform::TEXT, count(*)
+    FROM marketplace_listings
+    GROUP BY platform;
+$$ LANGUAGE sql STABLE;
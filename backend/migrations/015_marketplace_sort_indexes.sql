@@ -0,0 +1,10 @@
+-- Migration: Sort index for platform-filtered marketplace listings
+-- Date: 2025-11-05
+-- Description: /api/marketplace/listings sorts by created_at, price or
+-- trend_score (now a fixed whitelist), most often filtered by platform.
+-- created_at, price and trend_score already have single-column indexes
+-- (002); this composite serves the common platform + newest-first page as
+-- an index scan instead of sorting every listing on the platform.
+
+CREATE INDEX IF NOT EXISTS idx_marketplace_listings_platform_created
+    ON marketplace_listings(platform, created_at DESC);
@@ -0,0 +1,16 @@
+-- Migration: Keyset pagination for marketplace listings
+-- Date: 2025-11-05
+-- Description: /api/marketplace/listings pages newest first by
+-- (created_at, id) via a cursor instead of OFFSET, so every page costs the
+-- same regardless of depth.
+
+-- Newest first with id as the tie-breaker
+CREATE INDEX IF NOT EXISTS idx_marketplace_listings_created_id
+    ON marketplace_listings(created_at DESC, id DESC);
+
+-- Same order within one platform
+CREATE INDEX IF NOT EXISTS idx_marketplace_listings_platform_created_id
+    ON marketplace_listings(platform, created_at DESC, id DESC);
+
+DROP INDEX IF EXISTS idx_marketplace_listings_platform_created;  -- superseded by idx_marketplace_listings_platform_created_id
+DROP INDEX IF EXISTS idx_marketplace_listings_created_at;  -- superseded by idx_marketplace_listings_created_id
@@ -0,0 +1,15 @@
+-- Migration: Filter indexes for marketplace listings and trends
+-- Date: 2025-11-05
+-- Description: /api/marketplace/listings filters brand with
+-- ILIKE '%...%', which a btree can't serve, and /api/marketplace/trends
+-- filters platform/category over a period_start range sorted newest first.
+
+-- Substring brand matching (pg_trgm is created in 009)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_marketplace_listings_brand_trgm
+    ON marketplace_listings USING GIN (brand gin_trgm_ops);
+
+-- Trends for a platform/category, newest period first
+CREATE INDEX IF NOT EXISTS idx_trends_platform_category_period
+    ON marketplace_trends(platform, category, period_start DESC);
@@ -0,0 +1,279 @@
+"""
+Redis read-through cache for public API responses.
+
+Keys follow a "<resource>:<kind>:<args>" convention (e.g. "blog:post:{slug}",
+"blog:list:{category}:{featured}:{q}:{skip}:{limit}"). Entries carry a TTL as
+a safety net; writers invalidate the affected keys on every mutation.
+
+The cache is optional: when REDIS_URL is not set, or Redis is unreachable,
+reads miss and writes are skipped so requests fall through to the database.
+"""
+
+import os
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+import redis.asyncio as redis
+from redis import Redis as SyncRedis
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+# Default TTL for cached responses (seconds)
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", 300))
+
+_redis: Optional[redis.Redis] = None
+_sync_redis: Optional[SyncRedis] = None
+
+
+def get_redis() -> Optional[redis.Redis]:
+    """Return the shared Redis client, or None if caching is not configured."""
+    global _redis
+
+    if _redis is None and REDIS_URL:
+        _redis = redis.from_url(REDIS_URL)
+
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the Redis connection pool on shutdown."""
+    global _redis
+
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """
+    Read a cached JSON value.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        The decoded value, or None on a miss or Redis error
+    """
+    client = get_redis()
+    if client is None:
+        return None
+
+    try:
+        raw = await client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+    return orjson.loads(raw) if raw is not None else None
+
+
+async def cache_set(key: str, value: Any, ttl: int = CACHE_TTL_SECONDS) -> None:
+    """
+    Store a JSON-serializable value with a TTL.
+
+    Args:
+        key: Cache key
+        value: Value to cache
+        ttl: Time to live in seconds
+    """
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        await client.setex(key, ttl, orjson.dumps(value))
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def cache_invalidate(*keys: str, pattern: Optional[str] = None) -> None:
+    """
+    Delete cached keys after a write.
+
+    Args:
+        *keys: Exact keys to delete
+        pattern: Optional glob pattern (e.g. "blog:list:*") to delete via SCAN
+    """
+    client = get_redis()
+    if client is None:
+        return
+
+    try:
+        if keys:
+            await client.delete(*keys)
+        if pattern:
+            async for key in client.scan_iter(match=pattern, count=500):
+                await client.delete(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache invalidation failed for {keys or pattern}: {e}")
+
+
+def get_sync_redis() -> Optional[SyncRedis]:
+    """Return the shared synchronous Redis client (Celery tasks), or None if not configured."""
+    global _sync_redis
+
+    if _sync_redis is None and REDIS_URL:
+        _sync_redis = SyncRedis.from_url(REDIS_URL)
+
+    return _sync_redis
+
+
+def cache_get_sync(key: str) -> Optional[Any]:
+    """
+    Read a cached JSON value from synchronous code.
+
+    Args:
+        key: Cache key
+
+    Returns:
+        The decoded value, or None on a miss or Redis error
+    """
+    client = get_sync_redis()
+    if client is None:
+        return None
+
+    try:
+        raw = client.get(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+    return orjson.loads(raw) if raw is not None else None
+
+
+def cache_set_sync(key: str, value: Any, ttl: int = CACHE_TTL_SECONDS) -> None:
+    """
+    Store a JSON-serializable value with a TTL from synchronous code.
+
+    Args:
+        key: Cache key
+        value: Value to cache
+        ttl: Time to live in seconds
+    """
+    client = get_sync_redis()
+    if client is None:
+        return
+
+    try:
+        client.setex(key, ttl, orjson.dumps(value))
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+def cache_lock_sync(key: str, ttl: int) -> bool:
+    """
+    Take a short-lived lock (SET NX EX) so only one worker refreshes a value.
+
+    Args:
+        key: Lock key
+        ttl: Seconds before the lock expires on its own
+
+    Returns:
+        True if the lock was taken, or if Redis is unavailable (no one to
+        coordinate with); False if another worker holds it
+    """
+    client = get_sync_redis()
+    if client is None:
+        return True
+
+    try:
+        return bool(client.set(key, b"1", nx=True, ex=ttl))
+    except redis.RedisError as e:
+        logger.warning(f"Lock failed for {key}: {e}")
+        return True
+
+
+def cache_invalidate_sync(*keys: str, pattern: Optional[str] = None) -> None:
+    """
+    Delete cached keys from synchronous code (e.g. Celery tasks).
+
+    Args:
+        *keys: Exact keys to delete
+        pattern: Optional glob pattern to delete via SCAN
+    """
+    client = get_sync_redis()
+    if client is None:
+        return
+
+    try:
+        if keys:
+            client.delete(*keys)
+        if pattern:
+            for key in client.scan_iter(match=pattern, count=500):
+                client.delete(key)
+    except redis.RedisError as e:
+        logger.warning(f"Cache invalidation failed for {keys or pattern}: {e}")
+
+
+async def counter_incr(key: str, field: str, amount: int = 1) -> bool:
+    """
+    Add to a counter field in a Redis hash (buffered counters).
+
+    Args:
+        key: Hash key (e.g. "views:blog_posts")
+        field: Counter name within the hash (e.g. a slug or id)
+        amount: Increment
+
+    Returns:
+        True if the increment was buffered, False if Redis is unavailable
+        and the caller should write through instead
+    """
+    client = get_redis()
+    if client is None:
+        return False
+
+    try:
+        await client.hincrby(key, field, amount)
+    except redis.RedisError as e:
+        logger.warning(f"Counter increment failed for {key}: {e}")
+        return False
+
+    return True
+
+
+async def counter_drain(key: str) -> Dict[str, int]:
+    """
+    Atomically read and clear a hash of buffered counters.
+
+    Args:
+        key: Hash key
+
+    Returns:
+        Mapping of field to accumulated count (empty on a miss or Redis error)
+    """
+    client = get_redis()
+    if client is None:
+        return {}
+
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            counts, _ = await pipe.hgetall(key).delete(key).execute()
+    except redis.RedisError as e:
+        logger.warning(f"Counter drain failed for {key}: {e}")
+        return {}
+
+    return {field.decode(): int(value) for field, value in counts.items()}
+
+
+async def counter_restore(key: str, counts: Dict[str, int]) -> None:
+    """
+    Add drained counters back to their hash after a failed flush.
+
+    Args:
+        key: Hash key
+        counts: Mapping of field to count, as returned by counter_drain
+    """
+    client = get_redis()
+    if client is None or not counts:
+        return
+
+    try:
+        async with client.pipeline(transaction=True) as pipe:
+            for field, amount in counts.items():
+                pipe.hincrby(key, field, amount)
+            await pipe.execute()
+    except redis.RedisError as e:
+        logger.warning(f"Counter restore failed for {key}, {len(counts)} counts lost: {e}")
@@ -0,0 +1,44 @@
+"""
+Opaque cursors for keyset pagination on (created_at, id).
+
+List endpoints ordered newest first hand out the last row's created_at and
+id as an X-Next-Cursor header. The pair is URL-safe base64 encoded: the raw
+"<timestamp>+00:00|<uuid>" form breaks when a client appends it to a query
+string without percent-encoding ("+" decodes to a space).
+"""
+
+import base64
+from datetime import datetime
+from typing import Any, Tuple
+from uuid import UUID
+
+
+def encode_cursor(created_at: Any, row_id: Any) -> str:
+    """
+    Build the cursor for the page after the row with this created_at and id.
+
+    Args:
+        created_at: The row's created_at (datetime from asyncpg, ISO string from PostgREST)
+        row_id: The row's id
+
+    Returns:
+        URL-safe cursor string
+    """
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    raw = f"{created_at}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Split a cursor into its created_at (ISO formatted) and id parts.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    created_at, _, row_id = raw.rpartition("|")
+    datetime.fromisoformat(created_at)
+    UUID(row_id)
+    return created_at, row_id
@@ -0,0 +1,159 @@
+"""
+Direct asyncpg connection pool for hot read paths.
+
+List endpoints (listings, blog) read straight from the Supabase Postgres
+database instead of going through PostgREST, which avoids an extra HTTP hop
+and JSON re-encoding and keeps the event loop free while waiting on the DB.
+supabase-py is still used for writes, auth and everything else.
+
+The pool is optional: when SUPABASE_DB_URL is not set, get_pool() returns
+None and callers fall back to the Supabase client.
+"""
+
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import UUID
+
+import asyncpg
+
+# Direct Postgres connection string (Supabase > Settings > Database)
+SUPABASE_DB_URL = os.getenv("SUPABASE_DB_URL", "")
+
+# Pool sizing
+PG_POOL_MIN_SIZE = int(os.getenv("PG_POOL_MIN_SIZE", 5))
+PG_POOL_MAX_SIZE = int(os.getenv("PG_POOL_MAX_SIZE", 20))
+
+# asyncpg prepares every query and reuses the prepared statement per
+# connection. Set to 0 when SUPABASE_DB_URL points at the Supavisor
+# transaction pooler (port 6543), which can't hold prepared statements.
+PG_STATEMENT_CACHE_SIZE = int(os.getenv("PG_STATEMENT_CACHE_SIZE", 100))
+
+# Rows fetched per round trip by db_stream()
+PG_CURSOR_PREFETCH = int(os.getenv("PG_CURSOR_PREFETCH", 500))
+
+_pool: Optional[asyncpg.Pool] = None
+
+
+async def init_pool() -> Optional[asyncpg.Pool]:
+    """
+    Create the connection pool if SUPABASE_DB_URL is configured.
+
+    Returns:
+        The pool, or None when no database URL is set
+    """
+    global _pool
+
+    if _pool is None and SUPABASE_DB_URL:
+        _pool = await asyncpg.create_pool(
+            dsn=SUPABASE_DB_URL,
+            min_size=PG_POOL_MIN_SIZE,
+            max_size=PG_POOL_MAX_SIZE,
+            statement_cache_size=PG_STATEMENT_CACHE_SIZE,
+        )
+
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the connection pool on shutdown."""
+    global _pool
+
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
+
+
+def get_pool() -> Optional[asyncpg.Pool]:
+    """Return the active pool, or None if direct DB access is not configured."""
+    return _pool
+
+
+def _to_json_value(value: Any) -> Any:
+    """Convert asyncpg column values to the shapes PostgREST returns."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+async def db_fetch(query: str, *args: Any) -> List[Dict[str, Any]]:
+    """
+    Run a read query on the pool and return rows as plain dicts.
+
+    Args:
+        query: SQL with $1, $2, ... placeholders
+        *args: Query parameters
+
+    Returns:
+        List of row dicts with UUIDs/timestamps/numerics converted to
+        str/ISO string/float, matching Supabase client responses
+    """
+    async with _pool.acquire() as conn:
+        records = await conn.fetch(query, *args)
+
+    return [
+        {key: _to_json_value(value) for key, value in record.items()}
+        for record in records
+    ]
+
+
+async def db_fetchrow(query: str, *args: Any) -> Optional[Dict[str, Any]]:
+    """
+    Run a single-row read query on the pool.
+
+    Args:
+        query: SQL with $1, $2, ... placeholders
+        *args: Query parameters
+
+    Returns:
+        The row as a dict (converted like db_fetch), or None if no row matched
+    """
+    async with _pool.acquire() as conn:
+        record = await conn.fetchrow(query, *args)
+
+    if record is None:
+        return None
+
+    return {key: _to_json_value(value) for key, value in record.items()}
+
+
+async def db_stream(query: str, *args: Any) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Run a read query on the pool and yield rows as they arrive.
+
+    Rows are read through a server-side cursor PG_CURSOR_PREFETCH at a time,
+    so the caller can start sending before the whole result is fetched. The
+    connection stays checked out until the generator is exhausted or closed.
+
+    Args:
+        query: SQL with $1, $2, ... placeholders
+        *args: Query parameters
+
+    Yields:
+        Row dicts, converted like db_fetch
+    """
+    async with _pool.acquire() as conn:
+        # Cursors only live inside a transaction
+        async with conn.transaction(readonly=True):
+            async for record in conn.cursor(query, *args, prefetch=PG_CURSOR_PREFETCH):
+                yield {key: _to_json_value(value) for key, value in record.items()}
+
+
+async def db_execute(query: str, *args: Any) -> str:
+    """
+    Run a write statement on the pool.
+
+    Args:
+        query: SQL with $1, $2, ... placeholders
+        *args: Query parameters
+
+    Returns:
+        The command status tag (e.g. "UPDATE 1")
+    """
+    async with _pool.acquire() as conn:
+        return await conn.execute(query, *args)
@@ -3,8 +3,13 @@ Supabase Client Configuration
 Replaces SQLModel/SQLite with Supabase PostgreSQL
 """
 
-from supabase import create_client, Client
+from supabase import (
+    create_client, Client, ClientOptions,
+    acreate_client, AsyncClient, AsyncClientOptions,
+)
+import httpx
 import os
+import time
 from functools import lru_cache
 from typing import Optional
 
@@ -12,50 +17,112 @@ from typing import Optional
 SUPABASE_URL = os.getenv("SUPABASE_URL", "")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY", "")  # Service role key for backend
 
-# Singleton pattern for Supabase client
-_supabase_client: Optional[Client] = None
+# Shared connection pool limits for the client's HTTP connections. Low
+# defaults cap HTTP/2 stream concurrency under load, so ops can raise them
+# per environment.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("SUPABASE_MAX_CONNECTIONS", 120)),
+    max_keepalive_connections=int(os.getenv("SUPABASE_MAX_KEEPALIVE", 80)),
+    keepalive_expiry=float(os.getenv("SUPABASE_KEEPALIVE_EXPIRY", 60)),
+)
 
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     """
     Get or create Supabase client instance (singleton).
 
+    The client is created on first call and cached by lru_cache. It owns
+    a single httpx.Client, so keep-alive connections to PostgREST are
+    reused across requests instead of opening a new TLS session each time.
+
     Returns:
         Client: Initialized Supabase client
 
     Raises:
         ValueError: If SUPABASE_URL or SUPABASE_KEY is not set
     """
-    global _supabase_client
-
     if not SUPABASE_URL or not SUPABASE_KEY:
         raise ValueError(
             "SUPABASE_URL and SUPABASE_KEY environment variables must be set. "
             "Check your .env file or environment configuration."
         )
 
-    if _supabase_client is None:
-        _supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
-
-    return _supabase_client
+    options = ClientOptions(httpx_client=httpx.Client(limits=HTTP_LIMITS, http2=True))
+    return create_client(SUPABASE_URL, SUPABASE_KEY, options=options)
 
 
 # Export the client getter function
 supabase = get_supabase_client
 
 
+_async_client: Optional[AsyncClient] = None
+
+
+async def get_async_supabase_client() -> AsyncClient:
+    """
+    Get or create the async Supabase client instance (singleton).
+
+    Used by async route handlers (typically via Depends) so PostgREST calls
+    are awaited instead of blocking the event loop. Services and Celery
+    tasks keep using the sync client from get_supabase_client().
+
+    Returns:
+        AsyncClient: Initialized async Supabase client
+
+    Raises:
+        ValueError: If SUPABASE_URL or SUPABASE_KEY is not set
+    """
+    global _async_client
+
+    if _async_client is None:
+        if not SUPABASE_URL or not SUPABASE_KEY:
+            raise ValueError(
+                "SUPABASE_URL and SUPABASE_KEY environment variables must be set. "
+                "Check your .env file or environment configuration."
+            )
+
+        options = AsyncClientOptions(
+            httpx_client=httpx.AsyncClient(limits=HTTP_LIMITS, http2=True)
+        )
+        _async_client = await acreate_client(SUPABASE_URL, SUPABASE_KEY, options=options)
+
+    return _async_client
+
+
+# Health check results are reused for this many seconds so frequent
+# load-balancer probes don't each issue a query against Supabase
+HEALTH_CHECK_TTL_SECONDS = 10
+
+_health_cache: Optional[tuple] = None  # (checked_at, result)
+
+
 def health_check() -> dict:
     """
     Check if Supabase connection is healthy.
 
+    The result is cached for HEALTH_CHECK_TTL_SECONDS.
+
     Returns:
         dict: Status information
     """
+    global _health_cache
+
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < HEALTH_CHECK_TTL_SECONDS:
+        return _health_cache[1]
+
+    result = _probe_database()
+    _health_cache = (now, result)
+    return result
+
+
+def _probe_database() -> dict:
+    """Run a minimal query against Supabase and report connection status."""
     try:
         client = get_supabase_client()
         # Perform a simple query to verify connection
-        result = client.table("sellers").select("id").limit(1).execute()
+        client.table("sellers").select("id").limit(1).execute()
         return {
             "status": "ok",
             "database": "supabase",
@@ -72,10 +139,13 @@ def health_check() -> dict:
 
 # Helper functions for common database operations
 
-def paginate_query(table_name: str, page: int = 1, page_size: int = 20, filters: dict = None, order_by: str = "created_at", ascending: bool = False):
+def paginate_query(table_name: str, page: int = 1, page_size: int = 20, filters: dict = None, order_by: str = "created_at", ascending: bool = False, count: Optional[str] = None):
     """
     Helper function to paginate Supabase queries.
 
+    Fetches one row beyond the page to determine has_next, so no COUNT(*)
+    is run unless the caller asks for totals via ``count``.
+
     Args:
         table_name: Name of the table to query
         page: Page number (1-indexed)
@@ -83,6 +153,8 @@ def paginate_query(table_name: str, page: int = 1, page_size: int = 20, filters:
         filters: Dictionary of filters to apply
         order_by: Column to order by
         ascending: Sort order (True for ascending, False for descending)
+        count: Optional count method ("exact", "planned" or "estimated");
+            when omitted total_count and total_pages are None
 
     Returns:
         dict: Paginated results with data and metadata
@@ -93,7 +165,7 @@ def paginate_query(table_name: str, page: int = 1, page_size: int = 20, filters:
     offset = (page - 1) * page_size
 
     # Build query
-    query = client.table(table_name).select("*", count="exact")
+    query = client.table(table_name).select("*", count=count) if count else client.table(table_name).select("*")
 
     # Apply filters if provided
     if filters:
@@ -101,23 +173,26 @@ def paginate_query(table_name: str, page: int = 1, page_size: int = 20, filters:
             if value is not None:
                 query = query.eq(key, value)
 
-    # Apply ordering and pagination
-    query = query.order(order_by, desc=not ascending).range(offset, offset + page_size - 1)
+    # Apply ordering and pagination (one extra row to detect a next page)
+    query = query.order(order_by, desc=not ascending).range(offset, offset + page_size)
 
     # Execute query
     response = query.execute()
 
-    # Calculate total pages
-    total_count = response.count if hasattr(response, 'count') else len(response.data)
-    total_pages = (total_count + page_size - 1) // page_size
+    rows = response.data or []
+    has_next = len(rows) > page_size
+
+    # Calculate total pages only when a count was requested
+    total_count = response.count if count else None
+    total_pages = (total_count + page_size - 1) // page_size if total_count is not None else None
 
     return {
-        "data": response.data,
+        "data": rows[:page_size],
         "page": page,
         "page_size": page_size,
         "total_count": total_count,
         "total_pages": total_pages,
-        "has_next": page < total_pages,
+        "has_next": has_next,
         "has_prev": page > 1
     }
 
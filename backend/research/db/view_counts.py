@@ -0,0 +1,69 @@
+"""
+Buffered view counters for blog posts and listings.
+
+Detail endpoints add each view to a Redis hash (see cache.counter_incr)
+instead of issuing an UPDATE per request. A background task started in the
+app lifespan drains the hashes every VIEW_FLUSH_INTERVAL_SECONDS and applies
+the accumulated deltas with one statement per table.
+
+Views buffered since the last flush are lost if Redis is flushed or the
+process is killed; that is acceptable for view analytics. If the database
+write fails, the drained deltas are added back to the hash for the next
+flush. On shutdown the flusher is stopped between flushes (never cancelled
+mid-write) and a final flush runs. Without Redis, endpoints fall back to
+incrementing the counter directly.
+"""
+
+import asyncio
+import os
+import logging
+
+from research.db.cache import counter_drain, counter_restore
+from research.db.pg_pool import get_pool, db_execute
+from research.db.supabase_client import get_async_supabase_client
+
+logger = logging.getLogger(__name__)
+
+# Redis hashes of pending view increments
+BLOG_VIEWS_KEY = "views:blog_posts"  # slug -> delta
+LISTING_VIEWS_KEY = "views:listings"  # id -> delta
+
+VIEW_FLUSH_INTERVAL_SECONDS = int(os.getenv("VIEW_FLUSH_INTERVAL_SECONDS", 30))
+
+
+async def flush_view_counts() -> None:
+    """Apply buffered blog post and listing views to Postgres."""
+    for key, function in (
+        (BLOG_VIEWS_KEY, "add_blog_post_views"),
+        (LISTING_VIEWS_KEY, "add_listing_views"),
+    ):
+        counts = await counter_drain(key)
+        if not counts:
+            continue
+
+        keys, deltas = list(counts), list(counts.values())
+        try:
+            if get_pool() is not None:
+                await db_execute(f"SELECT {function}($1, $2)", keys, deltas)
+            else:
+                supabase = await get_async_supabase_client()
+                await supabase.rpc(function, {"row_keys": keys, "deltas": deltas}).execute()
+        except Exception as e:
+            # Put the deltas back so the next flush retries them
+            logger.warning(f"Failed to flush {len(counts)} view counts for {key}, re-buffering: {e}")
+            await counter_restore(key, counts)
+
+
+async def run_view_flusher(stop: asyncio.Event) -> None:
+    """
+    Flush buffered views every VIEW_FLUSH_INTERVAL_SECONDS until stop is set.
+
+    Stopping is checked only between flushes, so a flush in progress always
+    finishes (or re-buffers its deltas) instead of being cancelled after
+    draining the hash.
+    """
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), VIEW_FLUSH_INTERVAL_SECONDS)
+        except asyncio.TimeoutError:
+            await flush_view_counts()
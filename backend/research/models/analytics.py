@@ -1,10 +1,16 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List, Dict, Any
 
 class Analytics(SQLModel, table=True):
     """Aggregated analytics and metrics storage."""
 
+    __table_args__ = (
+        Index("ix_analytics_metric_platform_period", "metric_type", "platform", "period_start"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # Scope of analytics
@@ -30,19 +36,19 @@ class Analytics(SQLModel, table=True):
     avg_sale_price: float = Field(default=0.0)
     highest_sale_price: float = Field(default=0.0)
 
-    # Brand/Category breakdown (JSON)
-    top_brands: Optional[str] = None  # JSON: [{"brand": "Levi's", "count": 45}, ...]
-    top_decades: Optional[str] = None  # JSON: [{"decade": "1950s", "count": 12}, ...]
-    top_models: Optional[str] = None  # JSON: [{"model": "501", "count": 32}, ...]
+    # Brand/Category breakdown (JSONB)
+    top_brands: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSONB))  # [{"brand": "Levi's", "count": 45}, ...]
+    top_decades: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSONB))  # [{"decade": "1950s", "count": 12}, ...]
+    top_models: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSONB))  # [{"model": "501", "count": 32}, ...]
 
     # ROI metrics
     avg_roi_percentage: float = Field(default=0.0)
     total_profit: float = Field(default=0.0)
-    high_roi_opportunities: Optional[str] = None  # JSON array of opportunities
+    high_roi_opportunities: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSONB))
 
     # Geographic metrics
-    top_buyer_countries: Optional[str] = None  # JSON: [{"country": "Japan", "count": 25}, ...]
-    top_seller_locations: Optional[str] = None
+    top_buyer_countries: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSONB))  # [{"country": "Japan", "count": 25}, ...]
+    top_seller_locations: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSONB))
 
     # Engagement metrics
     total_views: int = Field(default=0)
@@ -54,7 +60,10 @@ class Analytics(SQLModel, table=True):
     demand_trend: Optional[str] = None
 
     # Timestamps
-    calculated_at: datetime = Field(default_factory=datetime.utcnow)
+    calculated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
 
     class Config:
         json_schema_extra = {
@@ -90,10 +99,10 @@ class Insight(SQLModel, table=True):
     # Data backing the insight
     confidence_score: float = Field(ge=0.0, le=1.0)  # 0.0 to 1.0
     data_source: str  # "analytics", "gpt5", "manual"
-    supporting_data: Optional[str] = None  # JSON with backing metrics
+    supporting_data: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))  # Backing metrics
 
     # Actionability
-    action_items: Optional[str] = None  # JSON array of recommended actions
+    action_items: Optional[List[str]] = Field(default=None, sa_column=Column(JSONB))  # Recommended actions
     estimated_impact: Optional[str] = None  # "high", "medium", "low"
 
     # ROI opportunity specifics
@@ -111,7 +120,10 @@ class Insight(SQLModel, table=True):
     feedback: Optional[str] = None  # Seller feedback on usefulness
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
     expires_at: Optional[datetime] = None  # Some insights are time-sensitive
 
     class Config:
@@ -133,6 +145,10 @@ class Insight(SQLModel, table=True):
 class SyncLog(SQLModel, table=True):
     """Track API sync operations for marketplace integrations."""
 
+    __table_args__ = (
+        Index("ix_synclog_seller_platform_started", "seller_id", "platform", "started_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     seller_id: int = Field(foreign_key="seller.id", index=True)
 
@@ -152,10 +168,13 @@ class SyncLog(SQLModel, table=True):
 
     # Error tracking
     error_message: Optional[str] = None
-    error_details: Optional[str] = None  # JSON with detailed error info
+    error_details: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))  # Detailed error info
 
     # Performance
-    started_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    started_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+    )
     completed_at: Optional[datetime] = None
     duration_seconds: Optional[float] = None
 
@@ -164,7 +183,7 @@ class SyncLog(SQLModel, table=True):
     rate_limit_hit: bool = Field(default=False)
 
     # Metadata
-    sync_metadata: Optional[str] = None  # JSON with additional sync info
+    sync_metadata: Optional[Dict[str, Any]] = Field(default=None, sa_column=Column(JSONB))  # Additional sync info
 
     class Config:
         json_schema_extra = {
@@ -1,6 +1,8 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, DateTime, String, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 from enum import Enum
 
 class BlogStatus(str, Enum):
@@ -37,7 +39,7 @@ class BlogPost(SQLModel, table=True):
 
     # Organization
     category: BlogCategory = Field(index=True)
-    tags: Optional[str] = None  # JSON array of tags
+    tags: Optional[List[str]] = Field(default=None, sa_column=Column(ARRAY(String)))
     author: str = Field(default="Vintage Jeans Team")
     author_id: Optional[int] = Field(default=None, foreign_key="seller.id")
 
@@ -50,13 +52,19 @@ class BlogPost(SQLModel, table=True):
     view_count: int = Field(default=0)
     read_time_minutes: int = Field(default=5)  # Estimated read time
 
-    # Internal linking (JSON array of related post IDs or listing IDs)
-    related_posts: Optional[str] = None
-    related_listings: Optional[str] = None
+    # Internal linking (related post IDs or listing IDs)
+    related_posts: Optional[List[str]] = Field(default=None, sa_column=Column(JSONB))
+    related_listings: Optional[List[str]] = Field(default=None, sa_column=Column(JSONB))
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=func.now(), nullable=False)
+    )
 
     class Config:
         json_schema_extra = {
@@ -1,6 +1,8 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 from enum import Enum
 
 class PlatformEnum(str, Enum):
@@ -34,6 +36,13 @@ class ConditionGrade(str, Enum):
 class Listing(SQLModel, table=True):
     """Normalized listing model across all platforms."""
 
+    # Composite indexes matching the listing filters (status/brand/decade
+    # ordered by recency, and a seller's listings by status)
+    __table_args__ = (
+        Index("ix_listing_status_brand_decade_created", "status", "brand", "decade", "created_at"),
+        Index("ix_listing_seller_status", "seller_id", "status"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     seller_id: int = Field(foreign_key="seller.id", index=True)
 
@@ -47,8 +56,8 @@ class Listing(SQLModel, table=True):
     description: str
 
     # Product attributes
-    brand: str = Field(index=True)  # Levi's, Wrangler, Lee, etc.
-    decade: Optional[str] = Field(index=True)  # 1950s, 1960s, 1970s, etc.
+    brand: str  # Levi's, Wrangler, Lee, etc.
+    decade: Optional[str] = None  # 1950s, 1960s, 1970s, etc.
     year: Optional[int] = None
     model: Optional[str] = None  # 501, 505, etc.
 
@@ -64,7 +73,7 @@ class Listing(SQLModel, table=True):
     # Material and features
     material: Optional[str] = None  # "100% cotton denim", "selvedge denim"
     wash: Optional[str] = None  # "Dark wash", "Light wash", "Distressed"
-    features: Optional[str] = None  # JSON string of features
+    features: Optional[List[str]] = Field(default=None, sa_column=Column(JSONB))
 
     # Pricing
     price: float = Field(ge=0)
@@ -78,7 +87,7 @@ class Listing(SQLModel, table=True):
 
     # Images
     primary_image_url: Optional[str] = None
-    image_urls: Optional[str] = None  # JSON array of image URLs
+    image_urls: Optional[List[str]] = Field(default=None, sa_column=Column(ARRAY(String)))
 
     # Status and workflow
     status: ListingStatus = Field(default=ListingStatus.PENDING_APPROVAL, index=True)
@@ -98,12 +107,18 @@ class Listing(SQLModel, table=True):
     is_featured: bool = Field(default=False)  # Featured in Fresh Finds Flow
 
     # SEO and discovery
-    tags: Optional[str] = None  # JSON array of tags
+    tags: Optional[List[str]] = Field(default=None, sa_column=Column(ARRAY(String)))
     category: Optional[str] = None
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=func.now(), nullable=False)
+    )
     last_synced_at: Optional[datetime] = None  # Last sync from platform
 
     class Config:
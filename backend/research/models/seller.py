@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, DateTime, func
 from datetime import datetime
 from typing import Optional
 
@@ -44,8 +45,14 @@ class Seller(SQLModel, table=True):
     referred_by: Optional[int] = Field(default=None, foreign_key="seller.id")
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=func.now(), nullable=False)
+    )
     last_login_at: Optional[datetime] = None
 
     class Config:
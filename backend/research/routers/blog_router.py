@@ -1,11 +1,16 @@
 """Blog content management for SEO and marketing."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status, Query
+from pydantic import BaseModel, TypeAdapter
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
-from research.db.supabase_client import get_supabase_client
+from supabase import AsyncClient
+
+from research.db.supabase_client import get_async_supabase_client
+from research.db.pg_pool import get_pool, db_fetch, db_fetchrow, db_execute
+from research.db.cache import cache_get, cache_set, cache_invalidate, counter_incr
+from research.db.view_counts import BLOG_VIEWS_KEY
 from research.services.auth_service_supabase import get_current_admin
 
 router = APIRouter()
@@ -37,10 +42,10 @@ class BlogPostCreate(BaseModel):
     featured_image_url: Optional[str] = None
     featured_image_alt: Optional[str] = None
     category: str  # BlogCategory constant
-    tags: Optional[str] = None
+    tags: Optional[List[str]] = None
     read_time_minutes: int = 5
-    related_posts: Optional[str] = None
-    related_listings: Optional[str] = None
+    related_posts: Optional[List[str]] = None
+    related_listings: Optional[List[str]] = None
 
 class BlogPostUpdate(BaseModel):
     title: Optional[str] = None
@@ -51,7 +56,7 @@ class BlogPostUpdate(BaseModel):
     meta_keywords: Optional[str] = None
     featured_image_url: Optional[str] = None
     category: Optional[str] = None  # BlogCategory constant
-    tags: Optional[str] = None
+    tags: Optional[List[str]] = None
     status: Optional[str] = None  # BlogStatus constant
     featured: Optional[bool] = None
 
@@ -64,7 +69,7 @@ class BlogPostResponse(BaseModel):
     meta_title: Optional[str]
     meta_description: Optional[str]
     category: str
-    tags: Optional[str]
+    tags: Optional[List[str]]
     author: str
     author_id: Optional[str]  # UUID
     status: str
@@ -75,66 +80,133 @@ class BlogPostResponse(BaseModel):
     created_at: str
     updated_at: str
 
+# Columns needed to build a BlogPostResponse
+_BLOG_COLS = (
+    "id,title,slug,excerpt,content,meta_title,meta_description,category,tags,author,"
+    "author_id,status,published_at,featured,view_count,read_time_minutes,created_at,updated_at"
+)
+
+# Validates a whole page of rows in one call
+BlogPostListAdapter = TypeAdapter(List[BlogPostResponse])
+
 # Public endpoints
 
 @router.get("/", response_model=List[BlogPostResponse])
-def list_blog_posts(
+async def list_blog_posts(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     category: Optional[str] = None,
-    featured: Optional[bool] = None
+    featured: Optional[bool] = None,
+    q: Optional[str] = None,
+    include_total: bool = False,
+    supabase: AsyncClient = Depends(get_async_supabase_client)
 ):
-    """List published blog posts (public)."""
+    """
+    List published blog posts (public).
+
+    With include_total=true, the X-Total-Count response header carries the
+    planner's estimate of matching posts (PostgREST count="estimated").
+    """
+
+    cache_key = f"blog:list:{category}:{featured}:{q}:{skip}:{limit}"
+    rows = None if include_total else await cache_get(cache_key)
+    total = None
+
+    # Read directly from Postgres when the pool is configured
+    if rows is None and get_pool() is not None and not include_total:
+        conditions = ["status = $1"]
+        params: List[Any] = [BlogStatus.PUBLISHED]
+        if category:
+            params.append(category)
+            conditions.append(f"category = ${len(params)}")
+        if featured is not None:
+            params.append(featured)
+            conditions.append(f"featured = ${len(params)}")
+        if q:
+            params.append(q)
+            conditions.append(f"search_tsv @@ plainto_tsquery('english', ${len(params)})")
+        params.extend([skip, limit])
+
+        rows = await db_fetch(
+            f"SELECT {_BLOG_COLS} FROM blog_posts WHERE {' AND '.join(conditions)} "
+            f"ORDER BY published_at DESC OFFSET ${len(params) - 1} LIMIT ${len(params)}",
+            *params
+        )
+        await cache_set(cache_key, rows)
 
-    supabase = get_supabase_client()
-    query = supabase.table("blog_posts").select("*")
+    elif rows is None:
+        query = supabase.table("blog_posts").select(
+            _BLOG_COLS, count="estimated" if include_total else None
+        )
 
-    # Filter for published posts
-    query = query.eq("status", BlogStatus.PUBLISHED)
+        # Filter for published posts
+        query = query.eq("status", BlogStatus.PUBLISHED)
 
-    # Additional filters
-    if category:
-        query = query.eq("category", category)
-    if featured is not None:
-        query = query.eq("featured", featured)
+        # Additional filters
+        if category:
+            query = query.eq("category", category)
+        if featured is not None:
+            query = query.eq("featured", featured)
+        if q:
+            query = query.text_search("search_tsv", q, options={"type": "plain", "config": "english"})
 
-    # Pagination and ordering
-    end = skip + limit - 1
-    response = query.order("published_at", desc=True).range(skip, end).execute()
+        # Pagination and ordering
+        end = skip + limit - 1
+        response = await query.order("published_at", desc=True).range(skip, end).execute()
+        rows = response.data or []
+        total = response.count
 
-    if not response.data:
-        return []
+        await cache_set(cache_key, rows)
 
-    return [BlogPostResponse(**post) for post in response.data]
+    headers = {"X-Total-Count": str(total)} if total is not None else {}
+
+    # Serialize the validated page with pydantic-core directly
+    posts = BlogPostListAdapter.validate_python(rows)
+    return Response(BlogPostListAdapter.dump_json(posts), media_type="application/json", headers=headers)
 
 
 @router.get("/{slug}", response_model=BlogPostResponse)
-def get_blog_post(slug: str):
+async def get_blog_post(
+    slug: str,
+    background_tasks: BackgroundTasks,
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+):
     """Get blog post by slug (public)."""
 
-    supabase = get_supabase_client()
+    cache_key = f"blog:post:{slug}"
+    post = await cache_get(cache_key)
 
-    # Fetch post by slug
-    response = supabase.table("blog_posts").select("*").eq("slug", slug).execute()
+    if post is None:
+        # Fetch post by slug (straight from Postgres when the pool is configured)
+        if get_pool() is not None:
+            post = await db_fetchrow(f"SELECT {_BLOG_COLS} FROM blog_posts WHERE slug = $1", slug)
+        else:
+            response = await supabase.table("blog_posts").select(_BLOG_COLS).eq("slug", slug).execute()
+            post = response.data[0] if response.data else None
 
-    if not response.data or len(response.data) == 0:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Blog post not found"
-        )
+        if post is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Blog post not found"
+            )
+
+        await cache_set(cache_key, post)
 
-    post = response.data[0]
+    # Increment view count after the response is sent
+    background_tasks.add_task(_bump_blog_post_views, supabase, slug)
+    post["view_count"] += 1
 
-    # Increment view count
-    new_view_count = post["view_count"] + 1
-    supabase.table("blog_posts").update({
-        "view_count": new_view_count
-    }).eq("id", post["id"]).execute()
+    return BlogPostResponse.model_validate(post)
 
-    # Update the post dict with new view count for response
-    post["view_count"] = new_view_count
 
-    return BlogPostResponse(**post)
+async def _bump_blog_post_views(supabase: AsyncClient, slug: str) -> None:
+    """Buffer a view in Redis, or increment view_count directly without Redis."""
+    if await counter_incr(BLOG_VIEWS_KEY, slug):
+        return
+    if get_pool() is not None:
+        await db_execute("UPDATE blog_posts SET view_count = view_count + 1 WHERE slug = $1", slug)
+    else:
+        await supabase.rpc("get_blog_post_and_bump", {"post_slug": slug}).execute()
 
 
 # Admin endpoints
@@ -142,20 +214,11 @@ def get_blog_post(slug: str):
 @router.post("/", response_model=BlogPostResponse, status_code=status.HTTP_201_CREATED)
 async def create_blog_post(
     post_data: BlogPostCreate,
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_admin: Dict[str, Any] = Depends(get_current_admin)
 ):
     """Create new blog post (admin only)."""
 
-    supabase = get_supabase_client()
-
-    # Check if slug already exists
-    existing_response = supabase.table("blog_posts").select("id").eq("slug", post_data.slug).execute()
-    if existing_response.data and len(existing_response.data) > 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Slug already exists"
-        )
-
     # Create new blog post
     blog_post_data = {
         **post_data.model_dump(),
@@ -166,69 +229,69 @@ async def create_blog_post(
         "view_count": 0
     }
 
-    insert_response = supabase.table("blog_posts").insert(blog_post_data).execute()
+    # INSERT ... ON CONFLICT (slug) DO NOTHING: no row back means the slug is taken
+    insert_response = await supabase.table("blog_posts").upsert(
+        blog_post_data, on_conflict="slug", ignore_duplicates=True
+    ).execute()
 
     if not insert_response.data or len(insert_response.data) == 0:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create blog post"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Slug already exists"
         )
 
     new_post = insert_response.data[0]
+    await _invalidate_blog_cache(new_post["slug"])
 
-    return BlogPostResponse(**new_post)
+    return BlogPostResponse.model_validate(new_post)
 
 
 @router.patch("/{post_id}", response_model=BlogPostResponse)
 async def update_blog_post(
     post_id: str,  # UUID
     updates: BlogPostUpdate,
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_admin: Dict[str, Any] = Depends(get_current_admin)
 ):
     """Update blog post (admin only)."""
 
-    supabase = get_supabase_client()
-
-    # Check if post exists
-    post_response = supabase.table("blog_posts").select("*").eq("id", post_id).execute()
+    # Build update data with only provided fields
+    # (updated_at is set by the update_blog_posts_updated_at trigger)
+    update_data = updates.model_dump(exclude_unset=True)
 
-    if not post_response.data or len(post_response.data) == 0:
+    if not update_data:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Blog post not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields to update"
         )
 
-    # Build update data with only provided fields
-    update_data = updates.model_dump(exclude_unset=True)
-    update_data["updated_at"] = datetime.utcnow().isoformat()
-
-    # Update blog post
-    update_response = supabase.table("blog_posts").update(
+    # Update blog post (no rows returned means the post doesn't exist)
+    update_response = await supabase.table("blog_posts").update(
         update_data
     ).eq("id", post_id).execute()
 
     if not update_response.data or len(update_response.data) == 0:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to update blog post"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Blog post not found"
         )
 
     updated_post = update_response.data[0]
+    await _invalidate_blog_cache(updated_post["slug"])
 
-    return BlogPostResponse(**updated_post)
+    return BlogPostResponse.model_validate(updated_post)
 
 
 @router.post("/{post_id}/publish", response_model=BlogPostResponse)
 async def publish_blog_post(
     post_id: str,  # UUID
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_admin: Dict[str, Any] = Depends(get_current_admin)
 ):
     """Publish blog post (admin only)."""
 
-    supabase = get_supabase_client()
-
     # Check if post exists
-    post_response = supabase.table("blog_posts").select("*").eq("id", post_id).execute()
+    post_response = await supabase.table("blog_posts").select("published_at").eq("id", post_id).execute()
 
     if not post_response.data or len(post_response.data) == 0:
         raise HTTPException(
@@ -238,18 +301,15 @@ async def publish_blog_post(
 
     post = post_response.data[0]
 
-    # Update publish status
-    update_data = {
-        "status": BlogStatus.PUBLISHED,
-        "updated_at": datetime.utcnow().isoformat()
-    }
+    # Update publish status (updated_at is set by the update_blog_posts_updated_at trigger)
+    update_data = {"status": BlogStatus.PUBLISHED}
 
     # Set published_at if not already set
     if not post.get("published_at"):
-        update_data["published_at"] = datetime.utcnow().isoformat()
+        update_data["published_at"] = datetime.now(timezone.utc).isoformat()
 
     # Update blog post
-    update_response = supabase.table("blog_posts").update(
+    update_response = await supabase.table("blog_posts").update(
         update_data
     ).eq("id", post_id).execute()
 
@@ -260,29 +320,33 @@ async def publish_blog_post(
         )
 
     published_post = update_response.data[0]
+    await _invalidate_blog_cache(published_post["slug"])
 
-    return BlogPostResponse(**published_post)
+    return BlogPostResponse.model_validate(published_post)
 
 
 @router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_blog_post(
     post_id: str,  # UUID
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_admin: Dict[str, Any] = Depends(get_current_admin)
 ):
     """Delete blog post (admin only)."""
 
-    supabase = get_supabase_client()
+    # Delete blog post (no rows returned means the post doesn't exist)
+    delete_response = await supabase.table("blog_posts").delete().eq("id", post_id).execute()
 
-    # Check if post exists
-    post_response = supabase.table("blog_posts").select("id").eq("id", post_id).execute()
-
-    if not post_response.data or len(post_response.data) == 0:
+    if not delete_response.data or len(delete_response.data) == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Blog post not found"
         )
 
-    # Delete blog post
-    supabase.table("blog_posts").delete().eq("id", post_id).execute()
+    await _invalidate_blog_cache(delete_response.data[0]["slug"])
 
     return None
+
+
+async def _invalidate_blog_cache(slug: str) -> None:
+    """Drop the cached post and every cached list page after a write."""
+    await cache_invalidate(f"blog:post:{slug}", pattern="blog:list:*")
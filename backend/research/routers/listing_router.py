@@ -1,11 +1,19 @@
 """Listing management - CRUD operations for vintage jeans listings."""
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
+from uuid import UUID
+from datetime import datetime, timezone
 
-from research.db.supabase_client import get_supabase_client
+from supabase import AsyncClient
+
+from research.db.supabase_client import get_async_supabase_client
+from research.db.pg_pool import get_pool, db_fetch, db_fetchrow, db_execute
+from research.db.cache import counter_incr
+from research.db.keyset import encode_cursor, decode_cursor
+from research.db.view_counts import LISTING_VIEWS_KEY
 from research.services.auth_service_supabase import get_current_seller, get_current_admin
 
 # Enum values as constants (these are stored as strings in Supabase)
@@ -51,7 +59,7 @@ class ListingCreate(BaseModel):
     condition_notes: Optional[str] = None
     material: Optional[str] = None
     wash: Optional[str] = None
-    features: Optional[str] = None
+    features: Optional[List[str]] = None
     price: float
     currency: str = "USD"
     purchase_price: Optional[float] = None
@@ -59,9 +67,9 @@ class ListingCreate(BaseModel):
     ships_from: Optional[str] = None
     ships_to: Optional[str] = None
     primary_image_url: Optional[str] = None
-    image_urls: Optional[str] = None
+    image_urls: Optional[List[str]] = None
     provenance: Optional[str] = None
-    tags: Optional[str] = None
+    tags: Optional[List[str]] = None
     category: Optional[str] = None
 
 
@@ -81,34 +89,51 @@ class ListingResponse(BaseModel):
     title: str
     description: str
     brand: str
-    decade: Optional[str]
-    model: Optional[str]
-    waist_size: Optional[int]
-    inseam_length: Optional[int]
+    decade: Optional[str] = None
+    model: Optional[str] = None
+    waist_size: Optional[int] = None
+    inseam_length: Optional[int] = None
     condition: str
     price: float
     currency: str
-    purchase_price: Optional[float]
+    purchase_price: Optional[float] = None
     status: str
     views: int
     favorites: int
     is_featured: bool
-    primary_image_url: Optional[str]
+    primary_image_url: Optional[str] = None
     created_at: str
     updated_at: str
 
 
+class BrandMatch(BaseModel):
+    brand: str
+    score: float
+
+
+# Columns needed to build a ListingResponse (the table stores decade as "era")
+_LISTING_COLS = (
+    "id,seller_id,platform,title,description,brand,decade:era,model,waist_size,"
+    "inseam_length,condition,price,currency,purchase_price,status,views,favorites,"
+    "is_featured,primary_image_url,created_at,updated_at"
+)
+_LISTING_SQL_COLS = (
+    "id, seller_id, platform, title, description, brand, era AS decade, model, waist_size, "
+    "inseam_length, condition, price, currency, purchase_price, status, views, favorites, "
+    "is_featured, primary_image_url, created_at, updated_at"
+)
+
+
 # CRUD Endpoints
 
 @router.post("/", response_model=ListingResponse, status_code=status.HTTP_201_CREATED)
 async def create_listing(
     listing_data: ListingCreate,
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_seller: Dict[str, Any] = Depends(get_current_seller)
 ):
     """Create a new listing (manual entry by seller)."""
 
-    supabase = get_supabase_client()
-
     # Prepare listing data
     listing_insert_data = {
         "seller_id": current_seller["id"],
@@ -120,8 +145,8 @@ async def create_listing(
         "is_featured": False
     }
 
-    # Insert listing
-    insert_response = supabase.table("listings").insert(listing_insert_data).execute()
+    # Insert listing (seller counters are maintained by listings_counter_trig)
+    insert_response = await supabase.table("listings").insert(listing_insert_data).execute()
 
     if not insert_response.data or len(insert_response.data) == 0:
         raise HTTPException(
@@ -131,34 +156,7 @@ async def create_listing(
 
     new_listing = insert_response.data[0]
 
-    # Update seller's listing count
-    supabase.table("sellers").update({
-        "total_listings": current_seller["total_listings"] + 1
-    }).eq("id", current_seller["id"]).execute()
-
-    return ListingResponse(
-        id=new_listing["id"],
-        seller_id=new_listing["seller_id"],
-        platform=new_listing["platform"],
-        title=new_listing["title"],
-        description=new_listing["description"],
-        brand=new_listing["brand"],
-        decade=new_listing.get("decade"),
-        model=new_listing.get("model"),
-        waist_size=new_listing.get("waist_size"),
-        inseam_length=new_listing.get("inseam_length"),
-        condition=new_listing["condition"],
-        price=new_listing["price"],
-        currency=new_listing["currency"],
-        purchase_price=new_listing.get("purchase_price"),
-        status=new_listing["status"],
-        views=new_listing["views"],
-        favorites=new_listing["favorites"],
-        is_featured=new_listing["is_featured"],
-        primary_image_url=new_listing.get("primary_image_url"),
-        created_at=new_listing["created_at"],
-        updated_at=new_listing["updated_at"]
-    )
+    return ListingResponse.model_validate(new_listing)
 
 
 @router.get("/", response_model=List[ListingResponse])
@@ -170,86 +168,172 @@ async def list_listings(
     brand: Optional[str] = None,
     decade: Optional[str] = None,
     seller_id: Optional[str] = None,  # UUID
+    q: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_seller: Dict[str, Any] = Depends(get_current_seller)
 ):
-    """List listings with filters. Sellers see their own, admins see all."""
+    """
+    List listings with filters. Sellers see their own, admins see all.
 
-    supabase = get_supabase_client()
-
-    # Start building query
-    query = supabase.table("listings").select("*")
+    Results are ordered newest first. When a full page is returned, the
+    X-Next-Cursor response header holds the cursor for the next page; pass
+    it back as `cursor` (keyset pagination, replaces `skip`). With
+    include_total=true, X-Total-Count carries the planner's estimate of
+    matching listings (PostgREST count="estimated").
+    """
 
     # Non-admin sellers can only see their own listings
     if current_seller["role"] != "admin":
-        query = query.eq("seller_id", current_seller["id"])
-    elif seller_id:
-        query = query.eq("seller_id", seller_id)
-
-    # Apply filters
-    if platform:
-        query = query.eq("platform", platform)
-    if status_filter:
-        query = query.eq("status", status_filter)
-    if brand:
-        query = query.ilike("brand", f"%{brand}%")
-    if decade:
-        query = query.eq("decade", decade)
-
-    # Pagination and ordering
-    end = skip + limit - 1
-    response = query.order("created_at", desc=True).range(skip, end).execute()
-
-    if not response.data:
-        return []
-
-    return [
-        ListingResponse(
-            id=listing["id"],
-            seller_id=listing["seller_id"],
-            platform=listing["platform"],
-            title=listing["title"],
-            description=listing["description"],
-            brand=listing["brand"],
-            decade=listing.get("decade"),
-            model=listing.get("model"),
-            waist_size=listing.get("waist_size"),
-            inseam_length=listing.get("inseam_length"),
-            condition=listing["condition"],
-            price=listing["price"],
-            currency=listing["currency"],
-            purchase_price=listing.get("purchase_price"),
-            status=listing["status"],
-            views=listing["views"],
-            favorites=listing["favorites"],
-            is_featured=listing["is_featured"],
-            primary_image_url=listing.get("primary_image_url"),
-            created_at=listing["created_at"],
-            updated_at=listing["updated_at"]
+        seller_id = current_seller["id"]
+
+    cursor_created_at, cursor_id = _parse_cursor(cursor) if cursor else (None, None)
+    if cursor:
+        skip = 0
+
+    total = None
+
+    # Read directly from Postgres when the pool is configured (totals come
+    # from PostgREST's estimated count, so those requests use the client)
+    if get_pool() is not None and not include_total:
+        conditions = []
+        params: List[Any] = []
+        for column, value in (
+            ("seller_id", seller_id),
+            ("platform", platform),
+            ("status", status_filter),
+            ("era", decade),
+        ):
+            if value:
+                params.append(value)
+                conditions.append(f"{column} = ${len(params)}")
+        if brand:
+            params.append(f"%{brand}%")
+            conditions.append(f"brand ILIKE ${len(params)}")
+        if q:
+            params.append(q)
+            conditions.append(f"search_tsv @@ plainto_tsquery('english', ${len(params)})")
+        if cursor:
+            params.extend([datetime.fromisoformat(cursor_created_at), cursor_id])
+            conditions.append(f"(created_at, id) < (${len(params) - 1}, ${len(params)}::uuid)")
+        params.extend([skip, limit])
+
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        rows = await db_fetch(
+            f"SELECT {_LISTING_SQL_COLS} FROM listings {where}"
+            f"ORDER BY created_at DESC, id DESC OFFSET ${len(params) - 1} LIMIT ${len(params)}",
+            *params
+        )
+    else:
+        # Start building query
+        query = supabase.table("listings").select(
+            _LISTING_COLS, count="estimated" if include_total else None
         )
-        for listing in response.data
-    ]
+
+        if seller_id:
+            query = query.eq("seller_id", seller_id)
+
+        # Apply filters
+        if platform:
+            query = query.eq("platform", platform)
+        if status_filter:
+            query = query.eq("status", status_filter)
+        if brand:
+            query = query.ilike("brand", f"%{brand}%")
+        if decade:
+            query = query.eq("era", decade)
+        if q:
+            query = query.text_search("search_tsv", q, options={"type": "plain", "config": "english"})
+        if cursor:
+            query = query.or_(
+                f'created_at.lt."{cursor_created_at}",'
+                f'and(created_at.eq."{cursor_created_at}",id.lt.{cursor_id})'
+            )
+
+        # Pagination and ordering
+        end = skip + limit - 1
+        result = await query.order("created_at", desc=True).order("id", desc=True).range(skip, end).execute()
+        rows = result.data
+        total = result.count
+
+    headers = {}
+    if total is not None:
+        headers["X-Total-Count"] = str(total)
+    if rows and len(rows) == limit:
+        last = rows[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last["created_at"], last["id"])
+
+    # Rows already have the ListingResponse shape (_LISTING_COLS), so they
+    # are encoded in one orjson call without a validation pass. The page is
+    # fully fetched anyway (X-Next-Cursor needs the last row), so there is
+    # nothing to gain from streaming it.
+    return ORJSONResponse(rows or [], headers=headers)
+
+
+def _parse_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Split a listings cursor into its created_at and id parts.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+@router.get("/brands/search", response_model=List[BrandMatch])
+async def search_brands(
+    q: str = Query(..., min_length=2),
+    limit: int = Query(10, ge=1, le=50),
+    supabase: AsyncClient = Depends(get_async_supabase_client),
+    current_seller: Dict[str, Any] = Depends(get_current_seller)
+):
+    """
+    Suggest brands similar to `q`, tolerating typos (trigram similarity).
+
+    Sellers are matched against their own listings, admins against all.
+    """
+
+    viewer_id = None if current_seller["role"] == "admin" else current_seller["id"]
+
+    response = await supabase.rpc(
+        "search_listing_brands",
+        {"term": q, "viewer_uuid": viewer_id, "max_results": limit}
+    ).execute()
+
+    return response.data or []
 
 
 @router.get("/{listing_id}", response_model=ListingResponse)
 async def get_listing(
     listing_id: str,  # UUID
+    background_tasks: BackgroundTasks,
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_seller: Dict[str, Any] = Depends(get_current_seller)
 ):
     """Get a specific listing by ID."""
 
-    supabase = get_supabase_client()
-
-    # Fetch listing
-    response = supabase.table("listings").select("*").eq("id", listing_id).execute()
+    # Fetch listing (straight from Postgres when the pool is configured)
+    if get_pool() is not None:
+        listing = await db_fetchrow(
+            f"SELECT {_LISTING_SQL_COLS} FROM listings WHERE id = $1", _parse_listing_id(listing_id)
+        )
+    else:
+        response = await supabase.table("listings").select(_LISTING_COLS).eq("id", listing_id).execute()
+        listing = response.data[0] if response.data else None
 
-    if not response.data or len(response.data) == 0:
+    if listing is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Listing not found"
         )
 
-    listing = response.data[0]
-
     # Non-admin sellers can only access their own listings
     if current_seller["role"] != "admin" and listing["seller_id"] != current_seller["id"]:
         raise HTTPException(
@@ -257,51 +341,50 @@ async def get_listing(
             detail="Not authorized to access this listing"
         )
 
-    # Increment view count
-    new_views = listing["views"] + 1
-    supabase.table("listings").update({
-        "views": new_views
-    }).eq("id", listing_id).execute()
+    # Increment view count after the response is sent
+    background_tasks.add_task(_bump_listing_views, supabase, listing_id)
+    listing["views"] += 1
+
+    return ListingResponse.model_validate(listing)
 
-    listing["views"] = new_views
-
-    return ListingResponse(
-        id=listing["id"],
-        seller_id=listing["seller_id"],
-        platform=listing["platform"],
-        title=listing["title"],
-        description=listing["description"],
-        brand=listing["brand"],
-        decade=listing.get("decade"),
-        model=listing.get("model"),
-        waist_size=listing.get("waist_size"),
-        inseam_length=listing.get("inseam_length"),
-        condition=listing["condition"],
-        price=listing["price"],
-        currency=listing["currency"],
-        purchase_price=listing.get("purchase_price"),
-        status=listing["status"],
-        views=listing["views"],
-        favorites=listing["favorites"],
-        is_featured=listing["is_featured"],
-        primary_image_url=listing.get("primary_image_url"),
-        created_at=listing["created_at"],
-        updated_at=listing["updated_at"]
-    )
+
+async def _bump_listing_views(supabase: AsyncClient, listing_id: str) -> None:
+    """Buffer a view in Redis, or increment views directly without Redis."""
+    if await counter_incr(LISTING_VIEWS_KEY, listing_id):
+        return
+    if get_pool() is not None:
+        await db_execute("UPDATE listings SET views = views + 1 WHERE id = $1", UUID(listing_id))
+    else:
+        await supabase.rpc("get_listing_and_bump", {"listing_uuid": listing_id}).execute()
+
+
+def _parse_listing_id(listing_id: str) -> UUID:
+    """
+    Parse a listing id for a direct Postgres query.
+
+    Raises:
+        HTTPException: 404 if the id is not a UUID (no listing can match)
+    """
+    try:
+        return UUID(listing_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Listing not found"
+        )
 
 
 @router.patch("/{listing_id}", response_model=ListingResponse)
 async def update_listing(
     listing_id: str,  # UUID
     updates: ListingUpdate,
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_seller: Dict[str, Any] = Depends(get_current_seller)
 ):
     """Update a listing."""
 
-    supabase = get_supabase_client()
-
-    # Fetch listing to check authorization
-    response = supabase.table("listings").select("*").eq("id", listing_id).execute()
+    # Fetch owner to check authorization
+    response = await supabase.table("listings").select("seller_id").eq("id", listing_id).execute()
 
     if not response.data or len(response.data) == 0:
         raise HTTPException(
@@ -319,11 +402,17 @@ async def update_listing(
         )
 
     # Apply updates
+    # (updated_at is set by the update_listings_updated_at trigger)
     update_data = updates.model_dump(exclude_unset=True)
-    update_data["updated_at"] = datetime.utcnow().isoformat()
+
+    if not update_data:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No fields to update"
+        )
 
     # Update listing
-    update_response = supabase.table("listings").update(
+    update_response = await supabase.table("listings").update(
         update_data
     ).eq("id", listing_id).execute()
 
@@ -335,42 +424,19 @@ async def update_listing(
 
     updated_listing = update_response.data[0]
 
-    return ListingResponse(
-        id=updated_listing["id"],
-        seller_id=updated_listing["seller_id"],
-        platform=updated_listing["platform"],
-        title=updated_listing["title"],
-        description=updated_listing["description"],
-        brand=updated_listing["brand"],
-        decade=updated_listing.get("decade"),
-        model=updated_listing.get("model"),
-        waist_size=updated_listing.get("waist_size"),
-        inseam_length=updated_listing.get("inseam_length"),
-        condition=updated_listing["condition"],
-        price=updated_listing["price"],
-        currency=updated_listing["currency"],
-        purchase_price=updated_listing.get("purchase_price"),
-        status=updated_listing["status"],
-        views=updated_listing["views"],
-        favorites=updated_listing["favorites"],
-        is_featured=updated_listing["is_featured"],
-        primary_image_url=updated_listing.get("primary_image_url"),
-        created_at=updated_listing["created_at"],
-        updated_at=updated_listing["updated_at"]
-    )
+    return ListingResponse.model_validate(updated_listing)
 
 
 @router.delete("/{listing_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_listing(
     listing_id: str,  # UUID
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_seller: Dict[str, Any] = Depends(get_current_seller)
 ):
     """Delete a listing."""
 
-    supabase = get_supabase_client()
-
-    # Fetch listing
-    response = supabase.table("listings").select("*").eq("id", listing_id).execute()
+    # Fetch owner to check authorization
+    response = await supabase.table("listings").select("seller_id").eq("id", listing_id).execute()
 
     if not response.data or len(response.data) == 0:
         raise HTTPException(
@@ -387,23 +453,8 @@ async def delete_listing(
             detail="Not authorized to delete this listing"
         )
 
-    # Update seller's listing count
-    seller_response = supabase.table("sellers").select("*").eq("id", listing["seller_id"]).execute()
-    if seller_response.data and len(seller_response.data) > 0:
-        seller = seller_response.data[0]
-        new_total = max(0, seller["total_listings"] - 1)
-        new_active = seller["active_listings"]
-
-        if listing["status"] == ListingStatus.ACTIVE:
-            new_active = max(0, seller["active_listings"] - 1)
-
-        supabase.table("sellers").update({
-            "total_listings": new_total,
-            "active_listings": new_active
-        }).eq("id", listing["seller_id"]).execute()
-
-    # Delete listing
-    supabase.table("listings").delete().eq("id", listing_id).execute()
+    # Delete listing (seller counters are maintained by listings_counter_trig)
+    await supabase.table("listings").delete().eq("id", listing_id).execute()
 
     return None
 
@@ -413,128 +464,54 @@ async def delete_listing(
 @router.post("/{listing_id}/approve", response_model=ListingResponse)
 async def approve_listing(
     listing_id: str,  # UUID
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_admin: Dict[str, Any] = Depends(get_current_admin)
 ):
     """Approve a pending listing (admin only)."""
 
-    supabase = get_supabase_client()
-
-    # Fetch listing
-    response = supabase.table("listings").select("*").eq("id", listing_id).execute()
-
-    if not response.data or len(response.data) == 0:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Listing not found"
-        )
-
-    listing = response.data[0]
-
-    # Update listing status
-    update_response = supabase.table("listings").update({
+    # Update listing status (updated_at and seller counters are maintained by
+    # triggers; no rows returned means the listing doesn't exist)
+    update_response = await supabase.table("listings").update({
         "status": ListingStatus.ACTIVE,
         "approved_by": current_admin["id"],
-        "approved_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat()
+        "approved_at": datetime.now(timezone.utc).isoformat()
     }).eq("id", listing_id).execute()
 
     if not update_response.data or len(update_response.data) == 0:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to approve listing"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Listing not found"
         )
 
     approved_listing = update_response.data[0]
 
-    # Update seller's active listing count
-    seller_response = supabase.table("sellers").select("*").eq("id", listing["seller_id"]).execute()
-    if seller_response.data and len(seller_response.data) > 0:
-        seller = seller_response.data[0]
-        supabase.table("sellers").update({
-            "active_listings": seller["active_listings"] + 1
-        }).eq("id", listing["seller_id"]).execute()
-
-    return ListingResponse(
-        id=approved_listing["id"],
-        seller_id=approved_listing["seller_id"],
-        platform=approved_listing["platform"],
-        title=approved_listing["title"],
-        description=approved_listing["description"],
-        brand=approved_listing["brand"],
-        decade=approved_listing.get("decade"),
-        model=approved_listing.get("model"),
-        waist_size=approved_listing.get("waist_size"),
-        inseam_length=approved_listing.get("inseam_length"),
-        condition=approved_listing["condition"],
-        price=approved_listing["price"],
-        currency=approved_listing["currency"],
-        purchase_price=approved_listing.get("purchase_price"),
-        status=approved_listing["status"],
-        views=approved_listing["views"],
-        favorites=approved_listing["favorites"],
-        is_featured=approved_listing["is_featured"],
-        primary_image_url=approved_listing.get("primary_image_url"),
-        created_at=approved_listing["created_at"],
-        updated_at=approved_listing["updated_at"]
-    )
+    return ListingResponse.model_validate(approved_listing)
 
 
 @router.post("/{listing_id}/reject", response_model=ListingResponse)
 async def reject_listing(
     listing_id: str,  # UUID
     reason: str,
+    supabase: AsyncClient = Depends(get_async_supabase_client),
     current_admin: Dict[str, Any] = Depends(get_current_admin)
 ):
     """Reject a pending listing (admin only)."""
 
-    supabase = get_supabase_client()
-
-    # Fetch listing
-    response = supabase.table("listings").select("*").eq("id", listing_id).execute()
-
-    if not response.data or len(response.data) == 0:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Listing not found"
-        )
-
-    # Update listing status
-    update_response = supabase.table("listings").update({
+    # Update listing status (updated_at is set by trigger; no rows returned
+    # means the listing doesn't exist)
+    update_response = await supabase.table("listings").update({
         "status": ListingStatus.REJECTED,
         "rejection_reason": reason,
         "approved_by": current_admin["id"],
-        "approved_at": datetime.utcnow().isoformat(),
-        "updated_at": datetime.utcnow().isoformat()
+        "approved_at": datetime.now(timezone.utc).isoformat()
     }).eq("id", listing_id).execute()
 
     if not update_response.data or len(update_response.data) == 0:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to reject listing"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Listing not found"
         )
 
     rejected_listing = update_response.data[0]
 
-    return ListingResponse(
-        id=rejected_listing["id"],
-        seller_id=rejected_listing["seller_id"],
-        platform=rejected_listing["platform"],
-        title=rejected_listing["title"],
-        description=rejected_listing["description"],
-        brand=rejected_listing["brand"],
-        decade=rejected_listing.get("decade"),
-        model=rejected_listing.get("model"),
-        waist_size=rejected_listing.get("waist_size"),
-        inseam_length=rejected_listing.get("inseam_length"),
-        condition=rejected_listing["condition"],
-        price=rejected_listing["price"],
-        currency=rejected_listing["currency"],
-        purchase_price=rejected_listing.get("purchase_price"),
-        status=rejected_listing["status"],
-        views=rejected_listing["views"],
-        favorites=rejected_listing["favorites"],
-        is_featured=rejected_listing["is_featured"],
-        primary_image_url=rejected_listing.get("primary_image_url"),
-        created_at=rejected_listing["created_at"],
-        updated_at=rejected_listing["updated_at"]
-    )
+    return ListingResponse.model_validate(rejected_listing)
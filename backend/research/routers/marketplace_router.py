@@ -8,15 +8,30 @@ This router provides:
 - AI analysis triggers
 """
 
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+import asyncio
+from functools import lru_cache
+
+import orjson
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from datetime import date, datetime, time, timedelta, timezone
 from pydantic import BaseModel
 
-from research.db.supabase_client import get_supabase_client
+from supabase import AsyncClient
+
+from research.db.supabase_client import get_async_supabase_client
+from research.db.cache import cache_get, cache_set
+from research.db.pg_pool import get_pool, db_fetch, db_stream
+from research.db.keyset import encode_cursor, decode_cursor
 
 router = APIRouter()
 
+# Aggregate endpoints only change when a sync runs (syncs also invalidate
+# "marketplace:*"), so their responses are cached briefly
+MARKETPLACE_CACHE_TTL_SECONDS = 120
+
 
 # =====================================================
 # PYDANTIC MODELS
@@ -40,6 +55,7 @@ class ListingResponse(BaseModel):
     trend_score: Optional[float] = None
     image_urls: List[str] = []
     ai_tags: List[str] = []
+    created_at: Optional[datetime] = None
 
 
 class TrendResponse(BaseModel):
@@ -77,6 +93,30 @@ class TriggerSyncRequest(BaseModel):
     limit: int = 100
 
 
+# Columns needed to build each response model (skips raw_data, ai_insights, etc.).
+# List endpoints return rows directly as ORJSONResponse (or stream them):
+# returning plain lists would send every row through response validation and
+# jsonable_encoder first. response_model documents the shape.
+_LISTING_COLS = (
+    "id,platform,external_id,url,title,description,price,currency,condition,brand,"
+    "size,seller_username,listed_at,trend_score,image_urls,ai_tags,created_at"
+)
+_TREND_COLS = (
+    "id,category,platform,total_listings,avg_price,min_price,max_price,"
+    "engagement_score,period_start,period_end"
+)
+_SYNC_JOB_COLS = (
+    "id,platform,job_type,status,started_at,completed_at,duration_seconds,"
+    "listings_added,listings_updated,error_message"
+)
+
+# Sortable marketplace listing columns
+_LISTING_SORT_COLUMNS = {"created_at", "price", "trend_score"}
+
+# Brand trends are returned as-is, so they keep every metric but the AI blob
+_BRAND_TREND_COLS = _TREND_COLS + ",total_sales,search_volume"
+
+
 # =====================================================
 # LISTING ENDPOINTS
 # =====================================================
@@ -91,9 +131,11 @@ async def get_listings(
     condition: Optional[str] = Query(None, description="Filter by condition"),
     sort_by: str = Query("created_at", description="Sort field (created_at, price, trend_score)"),
     sort_order: str = Query("desc", description="Sort order (asc, desc)"),
-    limit: int = Query(50, le=200, description="Maximum results (max 200)"),
-    offset: int = Query(0, description="Pagination offset")
-) -> List[Dict[str, Any]]:
+    limit: int = Query(50, ge=1, le=200, description="Maximum results (max 200)"),
+    offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page (newest-first order only)"),
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+) -> Response:
     """
     Get marketplace listings with filtering and pagination.
 
@@ -105,12 +147,67 @@ async def get_listings(
     - Condition
 
     Returns paginated results sorted by your preference.
+
+    For the default newest-first order, a full page carries an X-Next-Cursor
+    response header; pass it back as `cursor` to fetch the next page without
+    OFFSET (keyset pagination on created_at, id).
     """
-    supabase = get_supabase_client()
+    if sort_by not in _LISTING_SORT_COLUMNS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sort_by: {sort_by} (use one of {', '.join(sorted(_LISTING_SORT_COLUMNS))})"
+        )
+    if sort_order.lower() not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail=f"Invalid sort_order: {sort_order} (use asc or desc)")
+
+    # Keyset pagination applies to the newest-first order (created_at, id)
+    keyset = sort_by == "created_at" and sort_order.lower() == "desc"
+    if cursor and not keyset:
+        raise HTTPException(status_code=400, detail="cursor requires sort_by=created_at and sort_order=desc")
+
+    cursor_created_at, cursor_id = _parse_cursor(cursor) if cursor else (None, None)
+    if cursor:
+        offset = 0
 
     try:
+        # Read directly from Postgres when the pool is configured
+        if get_pool() is not None:
+            conditions = []
+            params: List[Any] = []
+            for clause, value in (
+                ("platform = ${}", platform.lower() if platform else None),
+                ("brand ILIKE ${}", f"%{brand}%" if brand else None),
+                ("price >= ${}", min_price),
+                ("price <= ${}", max_price),
+                ("size = ${}", size or None),
+                ("condition ILIKE ${}", f"%{condition}%" if condition else None),
+            ):
+                if value is not None:
+                    params.append(value)
+                    conditions.append(clause.format(len(params)))
+            if cursor:
+                params.extend([datetime.fromisoformat(cursor_created_at), cursor_id])
+                conditions.append(f"(created_at, id) < (${len(params) - 1}, ${len(params)}::uuid)")
+            params.extend([offset, limit])
+
+            # sort_by was checked against _LISTING_SORT_COLUMNS above
+            order = "created_at DESC, id DESC" if keyset else f"{sort_by} {sort_order.upper()}"
+            where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+            sql = (
+                f"SELECT {_LISTING_COLS} FROM marketplace_listings {where}"
+                f"ORDER BY {order} OFFSET ${len(params) - 1} LIMIT ${len(params)}"
+            )
+
+            # The X-Next-Cursor header needs the page's last row before
+            # anything is sent, so only the other orders are streamed
+            if not keyset:
+                return await _stream_rows(sql, *params)
+
+            rows = await db_fetch(sql, *params)
+            return ORJSONResponse(rows, headers=_next_cursor_header(rows, limit, keyset))
+
         # Build query
-        query = supabase.table("marketplace_listings").select("*")
+        query = supabase.table("marketplace_listings").select(_LISTING_COLS)
 
         # Apply filters
         if platform:
@@ -131,8 +228,16 @@ async def get_listings(
         if condition:
             query = query.ilike("condition", f"%{condition}%")
 
-        # Apply sorting
-        if sort_order.lower() == "desc":
+        if cursor:
+            query = query.or_(
+                f'created_at.lt."{cursor_created_at}",'
+                f'and(created_at.eq."{cursor_created_at}",id.lt.{cursor_id})'
+            )
+
+        # Apply sorting (id breaks created_at ties so cursors are stable)
+        if keyset:
+            query = query.order("created_at", desc=True).order("id", desc=True)
+        elif sort_order.lower() == "desc":
             query = query.order(sort_by, desc=True)
         else:
             query = query.order(sort_by)
@@ -141,16 +246,64 @@ async def get_listings(
         query = query.range(offset, offset + limit - 1)
 
         # Execute query
-        result = query.execute()
+        result = await query.execute()
+        rows = result.data or []
 
-        return result.data if result.data else []
+        return ORJSONResponse(rows, headers=_next_cursor_header(rows, limit, keyset))
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch listings: {str(e)}")
 
 
+def _parse_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Split a listings cursor into its created_at and id parts.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _next_cursor_header(rows: List[Dict[str, Any]], limit: int, keyset: bool) -> Dict[str, str]:
+    """Build the X-Next-Cursor header when a full newest-first page was returned."""
+    if not keyset or not rows or len(rows) < limit:
+        return {}
+    last = rows[-1]
+    return {"X-Next-Cursor": encode_cursor(last["created_at"], last["id"])}
+
+
+async def _stream_rows(query: str, *args: Any) -> StreamingResponse:
+    """
+    Stream a query's rows from the pool as a JSON array.
+
+    The first row is fetched before returning so query errors still surface
+    as a 500 instead of a truncated 200 body.
+    """
+    rows = db_stream(query, *args)
+    try:
+        first = await rows.__anext__()
+    except StopAsyncIteration:
+        return ORJSONResponse([])
+    return StreamingResponse(_json_array(first, rows), media_type="application/json")
+
+
+async def _json_array(first: Dict[str, Any], rest: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[bytes]:
+    """Encode rows as a JSON array, yielding one row at a time."""
+    yield b"[" + orjson.dumps(first)
+    async for row in rest:
+        yield b"," + orjson.dumps(row)
+    yield b"]"
+
+
 @router.get("/listings/{listing_id}", response_model=ListingResponse)
-async def get_listing_by_id(listing_id: str) -> Dict[str, Any]:
+async def get_listing_by_id(
+    listing_id: str,
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+) -> ListingResponse:
     """
     Get a specific listing by ID.
 
@@ -160,15 +313,13 @@ async def get_listing_by_id(listing_id: str) -> Dict[str, Any]:
     - AI analysis tags
     - Raw API data
     """
-    supabase = get_supabase_client()
-
     try:
-        result = supabase.table("marketplace_listings").select("*").eq("id", listing_id).execute()
+        result = await supabase.table("marketplace_listings").select(_LISTING_COLS).eq("id", listing_id).execute()
 
         if not result.data or len(result.data) == 0:
             raise HTTPException(status_code=404, detail="Listing not found")
 
-        return result.data[0]
+        return ListingResponse.model_validate(result.data[0])
 
     except HTTPException:
         raise
@@ -180,8 +331,9 @@ async def get_listing_by_id(listing_id: str) -> Dict[str, Any]:
 async def search_listings(
     keywords: str,
     platform: Optional[str] = None,
-    limit: int = Query(50, le=200)
-) -> List[Dict[str, Any]]:
+    limit: int = Query(50, ge=1, le=200),
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+) -> Response:
     """
     Search listings by keywords.
 
@@ -189,28 +341,26 @@ async def search_listings(
     - Title
     - Description
     - Brand
-    - AI tags
 
     Returns relevance-ranked results.
     """
-    supabase = get_supabase_client()
-
     try:
-        # Build search query using PostgreSQL full-text search
-        query = supabase.table("marketplace_listings").select("*")
-
-        if platform:
-            query = query.eq("platform", platform.lower())
-
-        # Search in title, description, and brand
-        # Note: This is a simple implementation. For production, use PostgreSQL full-text search
-        query = query.or_(f"title.ilike.%{keywords}%,description.ilike.%{keywords}%,brand.ilike.%{keywords}%")
-
-        query = query.limit(limit)
-
-        result = query.execute()
-
-        return result.data if result.data else []
+        # Stream straight from Postgres when the pool is configured
+        if get_pool() is not None:
+            return await _stream_rows(
+                f"SELECT {_LISTING_COLS} FROM search_marketplace_listings($1, $2, $3)",
+                keywords, platform.lower() if platform else None, limit
+            )
+
+        # Full-text search on the indexed search_tsv column, ranked by ts_rank;
+        # only the listing columns, as on the pool path
+        result = await supabase.rpc("search_marketplace_listings", {
+            "q": keywords,
+            "platform_filter": platform.lower() if platform else None,
+            "max_results": limit
+        }).select(_LISTING_COLS).execute()
+
+        return ORJSONResponse(result.data or [])
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
@@ -224,8 +374,9 @@ async def search_listings(
 async def get_trends(
     platform: Optional[str] = Query(None, description="Filter by platform"),
     category: Optional[str] = Query(None, description="Filter by category"),
-    days: int = Query(7, le=90, description="Number of days to look back (max 90)")
-) -> List[Dict[str, Any]]:
+    days: int = Query(7, ge=1, le=90, description="Number of days to look back (max 90)"),
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+) -> ORJSONResponse:
     """
     Get market trend data.
 
@@ -237,15 +388,29 @@ async def get_trends(
 
     Grouped by platform and category over time.
     """
-    supabase = get_supabase_client()
-
     try:
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        start_date, _ = _window(days)
+
+        # Read directly from Postgres when the pool is configured
+        if get_pool() is not None:
+            conditions = ["period_start >= $1"]
+            params: List[Any] = [start_date]
+            if platform:
+                params.append(platform.lower())
+                conditions.append(f"platform = ${len(params)}")
+            if category:
+                params.append(category)
+                conditions.append(f"category = ${len(params)}")
+
+            rows = await db_fetch(
+                f"SELECT {_TREND_COLS} FROM marketplace_trends WHERE {' AND '.join(conditions)} "
+                f"ORDER BY period_start DESC",
+                *params
+            )
+            return ORJSONResponse(rows)
 
         # Build query
-        query = supabase.table("marketplace_trends").select("*").gte(
+        query = supabase.table("marketplace_trends").select(_TREND_COLS).gte(
             "period_start", start_date.isoformat()
         )
 
@@ -257,9 +422,9 @@ async def get_trends(
 
         query = query.order("period_start", desc=True)
 
-        result = query.execute()
+        result = await query.execute()
 
-        return result.data if result.data else []
+        return ORJSONResponse(result.data or [])
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch trends: {str(e)}")
@@ -267,9 +432,10 @@ async def get_trends(
 
 @router.get("/trends/brands")
 async def get_brand_trends(
-    days: int = Query(7, le=90),
-    limit: int = Query(10, le=50)
-) -> List[Dict[str, Any]]:
+    days: int = Query(7, ge=1, le=90),
+    limit: int = Query(10, ge=1, le=50),
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+) -> ORJSONResponse:
     """
     Get trending brands.
 
@@ -280,15 +446,16 @@ async def get_brand_trends(
 
     Useful for identifying popular brands in the market.
     """
-    supabase = get_supabase_client()
+    cache_key = f"marketplace:brands:{days}:{limit}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
 
     try:
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        start_date, _ = _window(days)
 
         # Get brand trends
-        result = supabase.table("marketplace_trends").select("*").gte(
+        result = await supabase.table("marketplace_trends").select(_BRAND_TREND_COLS).gte(
             "period_start", start_date.isoformat()
         ).neq(
             "category", "platform"
@@ -298,14 +465,20 @@ async def get_brand_trends(
             "total_listings", desc=True
         ).limit(limit).execute()
 
-        return result.data if result.data else []
+        brands = result.data if result.data else []
+        await cache_set(cache_key, brands, ttl=MARKETPLACE_CACHE_TTL_SECONDS)
+
+        return ORJSONResponse(brands)
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch brand trends: {str(e)}")
 
 
 @router.get("/trends/summary")
-async def get_trends_summary(days: int = Query(7, le=90)) -> Dict[str, Any]:
+async def get_trends_summary(
+    days: int = Query(7, ge=1, le=90),
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+) -> Dict[str, Any]:
     """
     Get high-level market summary.
 
@@ -316,70 +489,49 @@ async def get_trends_summary(days: int = Query(7, le=90)) -> Dict[str, Any]:
     - Trending brands
     - Price trends
     """
-    supabase = get_supabase_client()
+    cache_key = f"marketplace:summary:{days}"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-
-        # Get listings in date range
-        listings_result = supabase.table("marketplace_listings").select(
-            "platform, price, brand, created_at"
-        ).gte(
-            "created_at", start_date.isoformat()
-        ).execute()
+        start_date, end_date = _window(days)
 
-        listings = listings_result.data if listings_result.data else []
+        # Aggregate in Postgres (see migrations/012_trends_summary_function.sql)
+        result = await supabase.rpc("get_trends_summary", {"since": start_date.isoformat()}).execute()
 
-        if not listings:
-            return {
-                "period": f"Last {days} days",
-                "total_listings": 0,
-                "avg_price": 0,
-                "platforms": {},
-                "top_brands": []
-            }
-
-        # Calculate summary stats
-        total_listings = len(listings)
-        prices = [l["price"] for l in listings if l.get("price")]
-        avg_price = sum(prices) / len(prices) if prices else 0
-
-        # Group by platform
-        platforms = {}
-        for listing in listings:
-            platform = listing.get("platform", "unknown")
-            if platform not in platforms:
-                platforms[platform] = 0
-            platforms[platform] += 1
-
-        # Count brands
-        brand_counts = {}
-        for listing in listings:
-            brand = listing.get("brand")
-            if brand:
-                brand_counts[brand] = brand_counts.get(brand, 0) + 1
-
-        # Get top 5 brands
-        top_brands = sorted(brand_counts.items(), key=lambda x: x[1], reverse=True)[:5]
-
-        return {
+        summary = {
             "period": f"Last {days} days",
             "period_start": start_date.isoformat(),
             "period_end": end_date.isoformat(),
-            "total_listings": total_listings,
-            "avg_price": round(avg_price, 2),
-            "min_price": min(prices) if prices else 0,
-            "max_price": max(prices) if prices else 0,
-            "platforms": platforms,
-            "top_brands": [{"brand": brand, "count": count} for brand, count in top_brands]
+            **result.data
         }
+        await cache_set(cache_key, summary, ttl=MARKETPLACE_CACHE_TTL_SECONDS)
+
+        return summary
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate summary: {str(e)}")
 
 
+def _window(days: int) -> Tuple[datetime, datetime]:
+    """
+    Get the (start, end) of a look-back window of `days` ending today (UTC).
+
+    Windows are aligned to whole days, so every request on the same day
+    gets the same bounds (and the same cache keys).
+    """
+    return _day_window(datetime.now(timezone.utc).date(), days)
+
+
+@lru_cache(maxsize=256)
+def _day_window(day: date, days: int) -> Tuple[datetime, datetime]:
+    """Window from midnight `days` days before `day` to the end of `day` (UTC)."""
+    end = datetime.combine(day, time.max, tzinfo=timezone.utc)
+    start = datetime.combine(day - timedelta(days=days), time.min, tzinfo=timezone.utc)
+    return start, end
+
+
 # =====================================================
 # SYNC JOB ENDPOINTS
 # =====================================================
@@ -388,8 +540,9 @@ async def get_trends_summary(days: int = Query(7, le=90)) -> Dict[str, Any]:
 async def get_sync_jobs(
     platform: Optional[str] = Query(None, description="Filter by platform"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    limit: int = Query(20, le=100)
-) -> List[Dict[str, Any]]:
+    limit: int = Query(20, ge=1, le=100),
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+) -> ORJSONResponse:
     """
     Get sync job history.
 
@@ -400,10 +553,8 @@ async def get_sync_jobs(
 
     Useful for monitoring data pipeline health.
     """
-    supabase = get_supabase_client()
-
     try:
-        query = supabase.table("marketplace_sync_jobs").select("*")
+        query = supabase.table("marketplace_sync_jobs").select(_SYNC_JOB_COLS)
 
         if platform:
             query = query.eq("platform", platform.lower())
@@ -413,9 +564,9 @@ async def get_sync_jobs(
 
         query = query.order("created_at", desc=True).limit(limit)
 
-        result = query.execute()
+        result = await query.execute()
 
-        return result.data if result.data else []
+        return ORJSONResponse(result.data or [])
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch sync jobs: {str(e)}")
@@ -436,27 +587,16 @@ async def trigger_sync(request: TriggerSyncRequest, background_tasks: Background
 
     Returns task ID for tracking.
     """
-    from tasks.marketplace_tasks import (
-        sync_ebay_task,
-        sync_etsy_task,
-        sync_reddit_task,
-        sync_all_marketplaces_task
-    )
-
     platform = request.platform.lower()
 
     try:
-        if platform == "ebay":
-            task = sync_ebay_task.apply_async(args=[request.keywords, request.limit])
-        elif platform == "etsy":
-            task = sync_etsy_task.apply_async(args=[request.keywords, request.limit])
-        elif platform == "reddit":
-            task = sync_reddit_task.apply_async(args=[request.keywords, request.limit])
-        elif platform == "all":
-            task = sync_all_marketplaces_task.apply_async(args=[request.keywords, request.limit])
-        else:
+        sync_task = _sync_tasks().get(platform)
+        if sync_task is None:
             raise HTTPException(status_code=400, detail=f"Invalid platform: {platform}")
 
+        # Manually triggered syncs keep their result so /sync/status can report it
+        task = sync_task.apply_async(args=[request.keywords, request.limit], ignore_result=False)
+
         return {
             "status": "triggered",
             "platform": platform,
@@ -472,6 +612,75 @@ async def trigger_sync(request: TriggerSyncRequest, background_tasks: Background
         raise HTTPException(status_code=500, detail=f"Failed to trigger sync: {str(e)}")
 
 
+@lru_cache(maxsize=1)
+def _sync_tasks() -> Dict[str, Any]:
+    """
+    Map each trigger_sync platform to its Celery task.
+
+    Built on first use so importing the router doesn't load the Celery app.
+    """
+    from tasks.marketplace_tasks import (
+        sync_ebay_task,
+        sync_etsy_task,
+        sync_reddit_task,
+        sync_all_marketplaces_task
+    )
+
+    return {
+        "ebay": sync_ebay_task,
+        "etsy": sync_etsy_task,
+        "reddit": sync_reddit_task,
+        "all": sync_all_marketplaces_task,
+    }
+
+
+@router.get("/sync/status")
+async def get_sync_statuses(
+    task_ids: List[str] = Query(..., description="Celery task IDs (repeat the parameter)")
+) -> List[Dict[str, Any]]:
+    """
+    Get the status of several sync tasks in one call.
+
+    All results are read from the Celery result backend with a single MGET
+    instead of one lookup per task. Each entry has the same shape as
+    /sync/status/{task_id}.
+    """
+    from celery import states
+    from celery_app import app
+
+    def fetch_metas() -> List[Dict[str, Any]]:
+        backend = app.backend
+        values = backend.mget([backend.get_key_for_task(task_id) for task_id in task_ids])
+        return [
+            backend.decode_result(value) if value else {"status": states.PENDING, "result": None}
+            for value in values
+        ]
+
+    try:
+        metas = await asyncio.to_thread(fetch_metas)
+
+        statuses = []
+        for task_id, meta in zip(task_ids, metas):
+            response = {
+                "task_id": task_id,
+                "state": meta["status"],
+                "status": meta["status"]
+            }
+
+            if meta["status"] == states.SUCCESS:
+                response["result"] = meta["result"]
+            elif meta["status"] == states.FAILURE:
+                # Same message as str(AsyncResult.info) on the single-task endpoint
+                response["error"] = str(app.backend.exception_to_python(meta["result"]))
+
+            statuses.append(response)
+
+        return statuses
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get task statuses: {str(e)}")
+
+
 @router.get("/sync/status/{task_id}")
 async def get_sync_status(task_id: str) -> Dict[str, Any]:
     """
@@ -511,7 +720,11 @@ async def get_sync_status(task_id: str) -> Dict[str, Any]:
 # =====================================================
 
 @router.post("/analyze/{listing_id}")
-async def analyze_listing(listing_id: str, background_tasks: BackgroundTasks) -> Dict[str, Any]:
+async def analyze_listing(
+    listing_id: str,
+    background_tasks: BackgroundTasks,
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+) -> Dict[str, Any]:
     """
     Trigger AI analysis for a specific listing.
 
@@ -526,10 +739,11 @@ async def analyze_listing(listing_id: str, background_tasks: BackgroundTasks) ->
 
     try:
         # Verify listing exists
-        supabase = get_supabase_client()
-        result = supabase.table("marketplace_listings").select("id").eq("id", listing_id).execute()
+        result = await supabase.table("marketplace_listings").select("id", count="exact", head=True).eq(
+            "id", listing_id
+        ).execute()
 
-        if not result.data or len(result.data) == 0:
+        if not result.count:
             raise HTTPException(status_code=404, detail="Listing not found")
 
         # Trigger AI analysis
@@ -549,7 +763,9 @@ async def analyze_listing(listing_id: str, background_tasks: BackgroundTasks) ->
 
 
 @router.get("/stats")
-async def get_marketplace_stats() -> Dict[str, Any]:
+async def get_marketplace_stats(
+    supabase: AsyncClient = Depends(get_async_supabase_client)
+) -> Dict[str, Any]:
     """
     Get overall marketplace statistics.
 
@@ -558,29 +774,35 @@ async def get_marketplace_stats() -> Dict[str, Any]:
     - Last sync times
     - Database health
     """
-    supabase = get_supabase_client()
+    cache_key = "marketplace:stats"
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return cached
 
     try:
-        # Get total listings by platform
-        ebay_count = supabase.table("marketplace_listings").select("id", count="exact").eq("platform", "ebay").execute()
-        etsy_count = supabase.table("marketplace_listings").select("id", count="exact").eq("platform", "etsy").execute()
-        reddit_count = supabase.table("marketplace_listings").select("id", count="exact").eq("platform", "reddit").execute()
-
-        # Get last sync jobs
-        last_syncs = supabase.table("marketplace_sync_jobs").select("platform, completed_at, status").order(
-            "completed_at", desc=True
-        ).limit(3).execute()
+        # Listing totals by platform (one GROUP BY) and the last sync jobs are
+        # independent, so run both queries concurrently
+        platform_counts, last_syncs = await asyncio.gather(
+            supabase.rpc("listing_counts_by_platform").execute(),
+            supabase.table("marketplace_sync_jobs").select("platform, completed_at, status").order(
+                "completed_at", desc=True
+            ).limit(3).execute(),
+        )
+        counts = {row["platform"]: row["n"] for row in platform_counts.data or []}
 
-        return {
+        stats = {
             "total_listings": {
-                "ebay": ebay_count.count if ebay_count else 0,
-                "etsy": etsy_count.count if etsy_count else 0,
-                "reddit": reddit_count.count if reddit_count else 0,
-                "total": (ebay_count.count or 0) + (etsy_count.count or 0) + (reddit_count.count or 0)
+                "ebay": counts.get("ebay", 0),
+                "etsy": counts.get("etsy", 0),
+                "reddit": counts.get("reddit", 0),
+                "total": sum(counts.values())
             },
             "last_syncs": last_syncs.data if last_syncs.data else [],
             "database_status": "healthy"
         }
+        await cache_set(cache_key, stats, ttl=MARKETPLACE_CACHE_TTL_SECONDS)
+
+        return stats
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}")
@@ -1,15 +1,20 @@
-from fastapi import APIRouter, UploadFile, Form
-from research.services.ai_summary_service import analyze_document
-from research.services.db_service import save_research_summary
+from fastapi import APIRouter, UploadFile, Form, HTTPException, status
 
 router = APIRouter()
 
-@router.post("/upload")
+@router.post("/upload", status_code=status.HTTP_202_ACCEPTED)
 async def upload_research_file(
     client_name: str = Form(...),
     file: UploadFile = None
 ):
+    from tasks.analytics_tasks import analyze_document_task
+
     contents = await file.read()
-    summary = await analyze_document(contents.decode("utf-8"))
-    record = save_research_summary(client_name, summary)
-    return {"client": client_name, "summary": summary, "record_id": record.get("id")}
+
+    try:
+        # Summarize and save in a worker; poll /api/marketplace/sync/status/{task_id}
+        task = analyze_document_task.apply_async(args=[client_name, contents.decode("utf-8")])
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to trigger analysis: {str(e)}")
+
+    return {"status": "triggered", "client": client_name, "task_id": task.id}
@@ -1,10 +1,12 @@
 """Seller registration, authentication, and profile management."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import Optional, Dict, Any
-from datetime import timedelta, datetime
+from datetime import timedelta
+
+from postgrest.exceptions import APIError
 
 from research.db.supabase_client import get_supabase_client
 from research.services.auth_service_supabase import (
@@ -15,11 +17,15 @@ from research.services.auth_service_supabase import (
     get_current_admin,
     generate_referral_code,
     update_last_login,
+    invalidate_seller,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
 
 router = APIRouter()
 
+# Inserts tried before giving up on a colliding referral code
+REFERRAL_CODE_ATTEMPTS = 3
+
 # Pydantic models for request/response
 
 
@@ -33,16 +39,19 @@ class SellerRegister(BaseModel):
     referred_by_code: Optional[str] = None
 
 class SellerResponse(BaseModel):
+    # Built straight from sellers rows; extra columns (hashed_password, ...) are dropped
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
     id: str  # UUID
     email: str
     full_name: str
-    business_name: Optional[str]
+    business_name: Optional[str] = None
     location: str
     is_verified: bool
     role: str
     total_listings: int
     active_listings: int
-    referral_code: Optional[str]
+    referral_code: Optional[str] = None
     created_at: str
 
 class SellerUpdate(BaseModel):
@@ -65,15 +74,6 @@ def register_seller(seller_data: SellerRegister):
 
     supabase = get_supabase_client()
 
-    # Check if seller already exists
-    existing_response = supabase.table("sellers").select("id").eq("email", seller_data.email).execute()
-
-    if existing_response.data and len(existing_response.data) > 0:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
-        )
-
     # Handle referral code if provided
     referred_by_id = None
     if seller_data.referred_by_code:
@@ -100,43 +100,32 @@ def register_seller(seller_data: SellerRegister):
         "active_listings": 0
     }
 
-    insert_response = supabase.table("sellers").insert(seller_insert_data).execute()
+    # INSERT ... ON CONFLICT (email) DO NOTHING: no row back means the email is taken.
+    # A referral code collision raises a unique violation; retry with a new code.
+    for attempt in range(REFERRAL_CODE_ATTEMPTS):
+        seller_insert_data["referral_code"] = generate_referral_code()
+        try:
+            insert_response = supabase.table("sellers").upsert(
+                seller_insert_data, on_conflict="email", ignore_duplicates=True
+            ).execute()
+            break
+        except APIError as e:
+            if e.code != "23505" or attempt == REFERRAL_CODE_ATTEMPTS - 1:
+                raise
 
     if not insert_response.data or len(insert_response.data) == 0:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create seller account"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
         )
 
     new_seller = insert_response.data[0]
 
-    # Generate and update referral code after we have the seller UUID
-    referral_code = generate_referral_code(new_seller["id"], new_seller["full_name"])
-
-    update_response = supabase.table("sellers").update({
-        "referral_code": referral_code
-    }).eq("id", new_seller["id"]).execute()
-
-    if update_response.data and len(update_response.data) > 0:
-        new_seller = update_response.data[0]
-
-    return SellerResponse(
-        id=new_seller["id"],
-        email=new_seller["email"],
-        full_name=new_seller["full_name"],
-        business_name=new_seller.get("business_name"),
-        location=new_seller["location"],
-        is_verified=new_seller["is_verified"],
-        role=new_seller["role"],
-        total_listings=new_seller["total_listings"],
-        active_listings=new_seller["active_listings"],
-        referral_code=new_seller.get("referral_code"),
-        created_at=new_seller["created_at"]
-    )
+    return SellerResponse.model_validate(new_seller)
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(form_data: OAuth2PasswordRequestForm = Depends()):
+def login(background_tasks: BackgroundTasks, form_data: OAuth2PasswordRequestForm = Depends()):
     """Authenticate seller and return access token."""
 
     seller = authenticate_seller(form_data.username, form_data.password)
@@ -148,8 +137,8 @@ def login(form_data: OAuth2PasswordRequestForm = Depends()):
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Update last login timestamp
-    update_last_login(seller["id"])
+    # Update last login timestamp after the response is sent
+    background_tasks.add_task(update_last_login, seller["id"], seller.get("last_login_at"))
 
     # Create access token (sub should be string UUID)
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -161,19 +150,7 @@ def login(form_data: OAuth2PasswordRequestForm = Depends()):
     return TokenResponse(
         access_token=access_token,
         token_type="bearer",
-        seller=SellerResponse(
-            id=seller["id"],
-            email=seller["email"],
-            full_name=seller["full_name"],
-            business_name=seller.get("business_name"),
-            location=seller["location"],
-            is_verified=seller["is_verified"],
-            role=seller["role"],
-            total_listings=seller["total_listings"],
-            active_listings=seller["active_listings"],
-            referral_code=seller.get("referral_code"),
-            created_at=seller["created_at"]
-        )
+        seller=SellerResponse.model_validate(seller)
     )
 
 
@@ -185,19 +162,7 @@ async def get_current_seller_profile(
 ):
     """Get current seller's profile."""
 
-    return SellerResponse(
-        id=current_seller["id"],
-        email=current_seller["email"],
-        full_name=current_seller["full_name"],
-        business_name=current_seller.get("business_name"),
-        location=current_seller["location"],
-        is_verified=current_seller["is_verified"],
-        role=current_seller["role"],
-        total_listings=current_seller["total_listings"],
-        active_listings=current_seller["active_listings"],
-        referral_code=current_seller.get("referral_code"),
-        created_at=current_seller["created_at"]
-    )
+    return SellerResponse.model_validate(current_seller)
 
 
 @router.patch("/me", response_model=SellerResponse)
@@ -220,8 +185,9 @@ async def update_seller_profile(
     if updates.location is not None:
         update_data["location"] = updates.location
 
-    # Add updated_at timestamp
-    update_data["updated_at"] = datetime.utcnow().isoformat()
+    # Nothing to change; updated_at is set by the update_sellers_updated_at trigger
+    if not update_data:
+        return SellerResponse.model_validate(current_seller)
 
     # Update seller in Supabase
     update_response = supabase.table("sellers").update(
@@ -235,20 +201,9 @@ async def update_seller_profile(
         )
 
     updated_seller = update_response.data[0]
+    await invalidate_seller(updated_seller["id"])
 
-    return SellerResponse(
-        id=updated_seller["id"],
-        email=updated_seller["email"],
-        full_name=updated_seller["full_name"],
-        business_name=updated_seller.get("business_name"),
-        location=updated_seller["location"],
-        is_verified=updated_seller["is_verified"],
-        role=updated_seller["role"],
-        total_listings=updated_seller["total_listings"],
-        active_listings=updated_seller["active_listings"],
-        referral_code=updated_seller.get("referral_code"),
-        created_at=updated_seller["created_at"]
-    )
+    return SellerResponse.model_validate(updated_seller)
 
 
 # Admin endpoints
@@ -272,22 +227,7 @@ async def list_all_sellers(
     if not response.data:
         return []
 
-    return [
-        SellerResponse(
-            id=seller["id"],
-            email=seller["email"],
-            full_name=seller["full_name"],
-            business_name=seller.get("business_name"),
-            location=seller["location"],
-            is_verified=seller["is_verified"],
-            role=seller["role"],
-            total_listings=seller["total_listings"],
-            active_listings=seller["active_listings"],
-            referral_code=seller.get("referral_code"),
-            created_at=seller["created_at"]
-        )
-        for seller in response.data
-    ]
+    return [SellerResponse.model_validate(seller) for seller in response.data]
 
 
 @router.patch("/{seller_id}/verify", response_model=SellerResponse)
@@ -299,39 +239,19 @@ async def verify_seller(
 
     supabase = get_supabase_client()
 
-    # Check if seller exists
-    seller_response = supabase.table("sellers").select("*").eq("id", seller_id).execute()
-
-    if not seller_response.data or len(seller_response.data) == 0:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Seller not found"
-        )
-
-    # Update seller verification status
+    # Update seller verification status (updated_at is set by the sellers
+    # trigger; no rows returned means the seller doesn't exist)
     update_response = supabase.table("sellers").update({
-        "is_verified": True,
-        "updated_at": datetime.utcnow().isoformat()
+        "is_verified": True
     }).eq("id", seller_id).execute()
 
     if not update_response.data or len(update_response.data) == 0:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to verify seller"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Seller not found"
         )
 
     verified_seller = update_response.data[0]
+    await invalidate_seller(verified_seller["id"])
 
-    return SellerResponse(
-        id=verified_seller["id"],
-        email=verified_seller["email"],
-        full_name=verified_seller["full_name"],
-        business_name=verified_seller.get("business_name"),
-        location=verified_seller["location"],
-        is_verified=verified_seller["is_verified"],
-        role=verified_seller["role"],
-        total_listings=verified_seller["total_listings"],
-        active_listings=verified_seller["active_listings"],
-        referral_code=verified_seller.get("referral_code"),
-        created_at=verified_seller["created_at"]
-    )
+    return SellerResponse.model_validate(verified_seller)
@@ -1,9 +1,9 @@
 import os
-from openai import OpenAI
-from dotenv import load_dotenv
+from openai import AsyncOpenAI
 
-load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# One client per process so requests share its httpx connection pool
+client = AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4-turbo")
 
 async def analyze_document(text: str):
     prompt = f"""
@@ -13,8 +13,8 @@ async def analyze_document(text: str):
     Text:
     {text}
     """
-    completion = client.chat.completions.create(
-        model="gpt-5",
+    completion = await client.chat.completions.create(
+        model=OPENAI_MODEL,
         messages=[{"role": "user", "content": prompt}]
     )
     return completion.choices[0].message.content
@@ -3,48 +3,178 @@ Authentication and authorization service for Supabase.
 Replaces SQLModel-based auth with Supabase client.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+import base64
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Tuple
+import bcrypt
+import jwt
+from jwt import InvalidTokenError
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 import os
-from dotenv import load_dotenv
+from cachetools import TTLCache
 
-from research.db.supabase_client import get_supabase_client
-
-load_dotenv()
+from research.db.supabase_client import get_supabase_client, get_async_supabase_client
+from research.db.cache import cache_get, cache_set, cache_invalidate
 
 # Configuration
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-change-this-in-production")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "43200"))  # 30 days
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Repeat logins within this window don't rewrite sellers.last_login_at
+LAST_LOGIN_DEBOUNCE_SECONDS = 60
+
+if ALGORITHM not in ("HS256", "EdDSA"):
+    raise ValueError(f"JWT_ALGORITHM must be HS256 or EdDSA, got {ALGORITHM}")
+
+
+def _load_signing_keys() -> Tuple[Any, Any]:
+    """
+    Return the (signing, verifying) keys for ALGORITHM.
+
+    HS256 signs and verifies with JWT_SECRET_KEY. EdDSA signs with the Ed25519
+    JWT_PRIVATE_KEY and verifies with JWT_PUBLIC_KEY (PEM; literal "\\n" is
+    accepted for newlines), so verify-only workers can run without the
+    private key. PEMs are parsed once here rather than on every token.
+    """
+    if ALGORITHM == "HS256":
+        return SECRET_KEY, SECRET_KEY
+
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key, load_pem_public_key
+
+    private_pem = os.getenv("JWT_PRIVATE_KEY", "").replace("\\n", "\n")
+    public_pem = os.getenv("JWT_PUBLIC_KEY", "").replace("\\n", "\n")
+    if not public_pem:
+        raise ValueError("JWT_PUBLIC_KEY is required when JWT_ALGORITHM=EdDSA")
+
+    private_key = load_pem_private_key(private_pem.encode(), password=None) if private_pem else None
+    return private_key, load_pem_public_key(public_pem.encode())
+
+
+_SIGNING_KEY, _VERIFYING_KEY = _load_signing_keys()
+
+# Password hashing. With PASSWORD_PEPPER set, passwords are pre-hashed with
+# HMAC-SHA256(pepper) before bcrypt, so a leaked sellers table can't be
+# cracked without the pepper and bcrypt can run at a lower cost. Peppered
+# hashes are stored with _PEPPERED_PREFIX; older plain bcrypt hashes still
+# verify and are re-hashed on the next successful login.
+PASSWORD_PEPPER = os.getenv("PASSWORD_PEPPER", "")
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "10" if PASSWORD_PEPPER else "12"))
+_PEPPERED_PREFIX = "$hmac-sha256$"
 
 # OAuth2 scheme
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/sellers/login")
+class _BearerToken(OAuth2PasswordBearer):
+    """
+    OAuth2PasswordBearer that reads the header with a plain prefix check.
+
+    Keeps the OpenAPI security scheme (the docs' Authorize button) while
+    skipping the generic scheme parsing on every authenticated request.
+    """
+
+    async def __call__(self, request: Request) -> str:
+        authorization = request.headers.get("authorization", "")
+        if authorization[:7].lower() == "bearer " and authorization[7:]:
+            return authorization[7:]
+
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+oauth2_scheme = _BearerToken(tokenUrl="/api/sellers/login")
+
+AUTH_CACHE_TTL_SECONDS = int(os.getenv("AUTH_CACHE_TTL_SECONDS", "30"))
+
+# Resolved sellers keyed by seller id, so back-to-back authenticated calls
+# skip the sellers lookup. Behind it, Redis holds the row per seller id (see
+# seller_cache_key) so other workers skip it too. Writes to a seller go
+# through invalidate_seller, which clears both; changes made elsewhere
+# apply within the TTL.
+_seller_cache: TTLCache = TTLCache(maxsize=1024, ttl=AUTH_CACHE_TTL_SECONDS)
+
+# Verified JWT payloads keyed by token digest, so repeat requests skip the
+# HS256 check. Entries are also dropped once the token's own exp passes.
+_payload_cache: TTLCache = TTLCache(maxsize=8192, ttl=int(os.getenv("JWT_CACHE_TTL_SECONDS", "60")))
+
+# bcrypt results keyed by HMAC(SECRET_KEY, password + hash), so repeated logins
+# skip the deliberately slow hash without keeping plaintext in memory. The
+# stored hash is part of the key, so a password change misses the cache.
+# Logins run in the threadpool, hence the lock.
+_password_cache: TTLCache = TTLCache(maxsize=4096, ttl=int(os.getenv("PASSWORD_CACHE_TTL_SECONDS", "300")))
+_password_cache_lock = threading.Lock()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)
+    key = hmac.new(
+        SECRET_KEY.encode(), f"{plain_password}\0{hashed_password}".encode(), hashlib.sha256
+    ).digest()
+
+    with _password_cache_lock:
+        cached = _password_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if hashed_password.startswith(_PEPPERED_PREFIX):
+        verified = _bcrypt_verify(_pepper(plain_password), hashed_password[len(_PEPPERED_PREFIX):])
+    else:
+        verified = _bcrypt_verify(plain_password, hashed_password)
+
+    with _password_cache_lock:
+        _password_cache[key] = verified
+    return verified
 
 
 def get_password_hash(password: str) -> str:
     """
     Hash a password for storing.
 
-    Note: bcrypt has a 72-byte limit. Passwords longer than 72 bytes
-    are truncated to prevent errors.
+    Note: bcrypt has a 72-byte limit. Without a pepper, passwords longer
+    than 72 bytes are truncated to prevent errors.
     """
+    if PASSWORD_PEPPER:
+        return _PEPPERED_PREFIX + _bcrypt_hash(_pepper(password))
+
     # Truncate password to 72 bytes for bcrypt compatibility
     if len(password.encode('utf-8')) > 72:
         password = password.encode('utf-8')[:72].decode('utf-8', errors='ignore')
 
-    return pwd_context.hash(password)
+    return _bcrypt_hash(password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Whether a stored hash predates the current pepper/cost settings."""
+    peppered = hashed_password.startswith(_PEPPERED_PREFIX)
+    if bool(PASSWORD_PEPPER) != peppered:
+        return True
+
+    # "$2b$12$<salt+hash>": rehash other variants ($2a$, $2y$) and other costs
+    _, ident, rounds, _ = (hashed_password[len(_PEPPERED_PREFIX):] if peppered else hashed_password).split("$", 3)
+    return ident != "2b" or int(rounds) != BCRYPT_ROUNDS
+
+
+def _bcrypt_hash(secret: str) -> str:
+    """bcrypt-hash a secret at BCRYPT_ROUNDS (calls the bcrypt C binding directly)."""
+    return bcrypt.hashpw(secret.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+
+
+def _bcrypt_verify(secret: str, hashed: str) -> bool:
+    """Check a secret against a $2a$/$2b$/$2y$ bcrypt hash."""
+    return bcrypt.checkpw(secret.encode(), hashed.encode())
+
+
+def _pepper(password: str) -> str:
+    """HMAC-SHA256 the password with the pepper (base64: 44 chars, no NUL bytes for bcrypt)."""
+    digest = hmac.new(PASSWORD_PEPPER.encode(), password.encode(), hashlib.sha256).digest()
+    return base64.b64encode(digest).decode()
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -60,12 +190,15 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     """
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    if _SIGNING_KEY is None:
+        raise RuntimeError("JWT_PRIVATE_KEY is not set; this instance can only verify tokens")
+
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
@@ -73,6 +206,9 @@ def decode_access_token(token: str) -> dict:
     """
     Decode and verify a JWT access token.
 
+    Verified payloads are cached for JWT_CACHE_TTL_SECONDS or until the
+    token expires, whichever comes first.
+
     Args:
         token: JWT token to decode
 
@@ -82,10 +218,16 @@ def decode_access_token(token: str) -> dict:
     Raises:
         HTTPException: If token is invalid
     """
+    cache_key = _token_key(token)
+    payload = _payload_cache.get(cache_key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return dict(payload)
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
+        payload = jwt.decode(token, _VERIFYING_KEY, algorithms=[ALGORITHM])
+        _payload_cache[cache_key] = payload
+        return dict(payload)
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -119,6 +261,15 @@ def authenticate_seller(email: str, password: str) -> Optional[Dict[str, Any]]:
         if not verify_password(password, seller["hashed_password"]):
             return None
 
+        # Lazily move the stored hash to the current pepper/cost
+        if password_needs_rehash(seller["hashed_password"]):
+            try:
+                supabase.table("sellers").update({
+                    "hashed_password": get_password_hash(password)
+                }).eq("id", seller["id"]).execute()
+            except Exception as e:
+                print(f"Error re-hashing password: {e}")
+
         return seller
 
     except Exception as e:
@@ -130,6 +281,10 @@ async def get_current_seller(token: str = Depends(oauth2_scheme)) -> Dict[str, A
     """
     Get the current authenticated seller from the token using Supabase.
 
+    The seller row is cached per seller id for AUTH_CACHE_TTL_SECONDS; the
+    token itself is still checked (from the payload cache) on every call, so
+    an expired token is rejected even while its seller is cached.
+
     Args:
         token: JWT token from Authorization header
 
@@ -150,19 +305,30 @@ async def get_current_seller(token: str = Depends(oauth2_scheme)) -> Dict[str, A
         seller_id: str = payload.get("sub")  # UUID as string
         if seller_id is None:
             raise credentials_exception
-    except JWTError:
+    except InvalidTokenError:
         raise credentials_exception
 
+    cached = _seller_cache.get(seller_id)
+    if cached is not None:
+        return dict(cached)
+
     try:
-        supabase = get_supabase_client()
+        seller = await cache_get(seller_cache_key(seller_id))
 
-        # Fetch seller by ID
-        response = supabase.table("sellers").select("*").eq("id", seller_id).execute()
+        if seller is None:
+            supabase = get_supabase_client()
 
-        if not response.data or len(response.data) == 0:
-            raise credentials_exception
+            # Fetch seller by ID
+            response = supabase.table("sellers").select("*").eq("id", seller_id).execute()
 
-        seller = response.data[0]
+            if not response.data or len(response.data) == 0:
+                raise credentials_exception
+
+            seller = response.data[0]
+
+            # Never cache (or hand to routes) the password hash
+            seller.pop("hashed_password", None)
+            await cache_set(seller_cache_key(seller_id), seller, ttl=AUTH_CACHE_TTL_SECONDS)
 
         # Check if seller is active
         if not seller.get("is_active", True):
@@ -171,13 +337,41 @@ async def get_current_seller(token: str = Depends(oauth2_scheme)) -> Dict[str, A
                 detail="Seller account is inactive"
             )
 
-        return seller
+        _seller_cache[seller_id] = seller
+        return dict(seller)
 
     except Exception as e:
         print(f"Error fetching seller: {e}")
         raise credentials_exception
 
 
+async def invalidate_seller(seller_id: str) -> None:
+    """
+    Drop a seller's cached row (this process and Redis) after a write.
+
+    Args:
+        seller_id: Seller's UUID
+    """
+    _seller_cache.pop(seller_id, None)
+    await cache_invalidate(seller_cache_key(seller_id))
+
+
+def seller_cache_key(seller_id: str) -> str:
+    """Redis key for a seller row cached by get_current_seller."""
+    return f"seller:row:{seller_id}"
+
+
+def _token_key(token: str) -> bytes:
+    """
+    Cache key for a raw JWT.
+
+    Dict lookups compare keys with an early-exit equality check; comparing
+    digests instead of the tokens themselves means lookup timing can't be used
+    to guess a cached token byte by byte.
+    """
+    return hashlib.sha256(token.encode()).digest()
+
+
 async def get_current_active_seller(
     current_seller: Dict[str, Any] = Depends(get_current_seller)
 ) -> Dict[str, Any]:
@@ -224,40 +418,43 @@ async def get_current_admin(
     return current_seller
 
 
-def generate_referral_code(seller_id: str, full_name: str) -> str:
+def generate_referral_code() -> str:
     """
-    Generate a unique referral code for a seller.
+    Generate a random referral code for a seller.
 
-    Args:
-        seller_id: Seller's UUID (as string)
-        full_name: Seller's full name
+    Codes are 8 random hex characters; the sellers.referral_code unique
+    constraint catches the rare collision, and callers retry with a new code.
 
     Returns:
-        Unique referral code (e.g., "VJABCD1234")
+        Referral code (e.g., "VJ1A2B3C4D")
     """
-    import hashlib
-    import time
-
-    # Create a unique string from seller info and timestamp
-    unique_string = f"{seller_id}-{full_name}-{time.time()}"
-    hash_object = hashlib.sha256(unique_string.encode())
-    hash_hex = hash_object.hexdigest()[:8].upper()
+    return f"VJ{secrets.token_hex(4).upper()}"
 
-    return f"VJ{hash_hex}"
 
-
-def update_last_login(seller_id: str) -> None:
+async def update_last_login(seller_id: str, previous_login_at: Optional[str] = None) -> None:
     """
     Update the last_login_at timestamp for a seller.
 
+    Meant to run after the login response (BackgroundTasks). Logins within
+    LAST_LOGIN_DEBOUNCE_SECONDS of the previous one are not written.
+
     Args:
         seller_id: Seller's UUID
+        previous_login_at: The seller's current last_login_at (ISO string), if known
     """
+    now = datetime.now(timezone.utc)
+
     try:
-        supabase = get_supabase_client()
-        supabase.table("sellers").update({
-            "last_login_at": datetime.utcnow().isoformat()
+        if previous_login_at and (
+            now - datetime.fromisoformat(previous_login_at)
+        ).total_seconds() < LAST_LOGIN_DEBOUNCE_SECONDS:
+            return
+
+        supabase = await get_async_supabase_client()
+        await supabase.table("sellers").update({
+            "last_login_at": now.isoformat()
         }).eq("id", seller_id).execute()
+        await invalidate_seller(seller_id)
     except Exception as e:
         print(f"Error updating last login: {e}")
         # Non-critical error, don't raise
@@ -3,14 +3,18 @@ Database service for research summaries using Supabase.
 Migrated from SQLModel to Supabase PostgreSQL.
 """
 from research.db.supabase_client import get_supabase_client
-from datetime import datetime
+from research.db.pg_pool import get_pool, db_fetchrow
+from datetime import datetime, timezone
 from typing import Dict, Any
 
 
-def save_research_summary(client_name: str, summary: str) -> Dict[str, Any]:
+async def save_research_summary(client_name: str, summary: str) -> Dict[str, Any]:
     """
     Save a research summary to Supabase.
 
+    Writes straight to Postgres when the asyncpg pool is configured, and
+    through PostgREST otherwise.
+
     Args:
         client_name: Name of the client
         summary: Research summary text
@@ -18,13 +22,25 @@ def save_research_summary(client_name: str, summary: str) -> Dict[str, Any]:
     Returns:
         Dictionary with the saved record data
     """
+    created_at = datetime.now(timezone.utc)
+
+    if get_pool() is not None:
+        record = await db_fetchrow(
+            "INSERT INTO research_summaries (client_name, summary, created_at) "
+            "VALUES ($1, $2, $3) RETURNING *",
+            client_name, summary, created_at
+        )
+        if record is None:
+            raise Exception("Failed to save research summary")
+        return record
+
     supabase = get_supabase_client()
 
     # Insert into research_summaries table
     data = {
         "client_name": client_name,
         "summary": summary,
-        "created_at": datetime.utcnow().isoformat()
+        "created_at": created_at.isoformat()
     }
 
     result = supabase.table("research_summaries").insert(data).execute()
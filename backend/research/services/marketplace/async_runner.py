@@ -0,0 +1,37 @@
+"""
+Run the async marketplace syncs from synchronous Celery tasks.
+
+The io worker runs a gevent pool (-P gevent) where every task is a greenlet
+on one OS thread. asyncio tracks the running loop per OS thread, so calling
+asyncio.run() from a greenlet fails with "cannot be called from a running
+event loop" whenever another greenlet's sync is mid-run. Under gevent each
+coroutine therefore runs in gevent's native threadpool, one real thread and
+event loop per call, while the calling greenlet yields. Without gevent
+(prefork or solo pools) asyncio.run() is called directly.
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    from gevent import get_hub
+    from gevent.monkey import is_module_patched
+except ImportError:
+    get_hub = None
+
+T = TypeVar("T")
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Args:
+        coro: Coroutine to run on a fresh event loop
+
+    Returns:
+        The coroutine's result (exceptions propagate to the caller)
+    """
+    if get_hub is not None and is_module_patched("threading"):
+        return get_hub().threadpool.apply(asyncio.run, (coro,))
+    return asyncio.run(coro)
@@ -8,18 +8,104 @@ This service uses the eBay REST API to:
 - Analyze market data
 
 API Documentation: https://developer.ebay.com/
-Package: ebay-rest v1.0.14
+Calls the Browse and OAuth REST endpoints directly over httpx.AsyncClient.
 """
 
 import os
+import asyncio
+import base64
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
 
+import httpx
+import orjson
+
 from research.db.supabase_client import get_supabase_client
+from research.db.cache import cache_get_sync, cache_set_sync, cache_lock_sync, cache_invalidate_sync
+from research.services.marketplace.async_runner import run_coroutine
+from research.services.marketplace.listing_store import upsert_listings
 
 logger = logging.getLogger(__name__)
 
+EBAY_API_BASE_URLS = {
+    "sandbox": "https://api.sandbox.ebay.com",
+    "production": "https://api.ebay.com",
+}
+EBAY_OAUTH_SCOPE = "https://api.ebay.com/oauth/api_scope"
+EBAY_MARKETPLACE_ID = os.getenv("EBAY_MARKETPLACE_ID", "EBAY_US")
+
+# Browse API search paging: at most 200 results per request and 10,000 total
+EBAY_PAGE_SIZE = 200
+EBAY_MAX_OFFSET = 10000
+
+# Search pages fetched at once during a sync
+EBAY_CONCURRENCY = int(os.getenv("EBAY_CONCURRENCY", 8))
+
+# Keep-alive pool for one sync's requests (the OAuth call and every page)
+EBAY_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+EBAY_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# Application token shared by every eBayService in this process. It is also
+# kept in Redis under "ebay:token:{environment}" so other workers and
+# restarted processes reuse it instead of requesting their own.
+_access_token: Optional[str] = None
+_token_expires_at: Optional[datetime] = None
+
+# Refresh lock TTL and how long other workers wait for the refreshed token
+EBAY_TOKEN_LOCK_SECONDS = 30
+EBAY_TOKEN_WAIT_SECONDS = 5
+
+# Standardized listing fields with their defaults; _parse_ebay_listing copies
+# this and fills in what the item provides
+_LISTING_TEMPLATE: Dict[str, Any] = {
+    "platform": "ebay",
+    "external_id": "",
+    "url": None,
+    "title": "",
+    "description": None,  # Description requires separate API call
+    "price": None,
+    "currency": "USD",
+    "condition": None,
+    "size": None,  # Needs parsing from title/description
+    "brand": None,  # Needs parsing from title/description
+    "waist_size": None,
+    "inseam_length": None,
+    "style": None,
+    "wash": None,
+    "era": None,
+    "image_urls": None,
+    "thumbnail_url": None,
+    "seller_username": None,
+    "seller_rating": None,
+    "seller_location": None,
+    "status": "active",
+    "listed_at": None,
+    "view_count": 0,
+    "watch_count": 0,
+    "favorite_count": 0,
+    "ai_tags": None,
+    "ai_summary": None,
+    "trend_score": None,
+    "raw_data": None,
+}
+
+
+# Item summary fields that _parse_ebay_listing maps onto listing columns
+_COLUMN_ITEM_FIELDS = frozenset({
+    "itemId", "title", "price", "condition", "image", "additionalImages",
+    "seller", "itemLocation", "itemWebUrl",
+})
+
+
+def _attrs(obj: Any) -> Dict[str, Any]:
+    """Snapshot an API object's fields as a dict (dicts pass through, None gives {})."""
+    if obj is None:
+        return {}
+    if isinstance(obj, dict):
+        return obj
+    return getattr(obj, "__dict__", {})
+
 
 class eBayService:
     """Service for interacting with eBay API."""
@@ -35,57 +121,116 @@ class eBayService:
         if not self.client_id or not self.client_secret:
             logger.warning("eBay credentials not configured. Set EBAY_CLIENT_ID and EBAY_CLIENT_SECRET.")
 
-        self.access_token = None
-        self.token_expires_at = None
+        # Client Credentials header, built once
+        credentials = f"{self.client_id}:{self.client_secret}".encode()
+        self.basic_auth = f"Basic {base64.b64encode(credentials).decode()}"
+
+        self.base_url = EBAY_API_BASE_URLS.get(self.environment, EBAY_API_BASE_URLS["sandbox"])
+        self.http: Optional[httpx.AsyncClient] = None
         self.supabase = get_supabase_client()
 
-    def _get_access_token(self) -> str:
+    def _client(self) -> httpx.AsyncClient:
+        """
+        Return this service's HTTP client, creating it on first use.
+
+        The client is bound to the event loop that first uses it, so one is
+        kept per service (i.e. per sync run) rather than per process; all
+        requests within a sync share its connections. Close it with aclose().
+        """
+        if self.http is None:
+            self.http = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                limits=EBAY_HTTP_LIMITS,
+                timeout=EBAY_HTTP_TIMEOUT,
+            )
+        return self.http
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its connections."""
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
+
+    async def _get_access_token(self) -> str:
         """
         Get OAuth access token for eBay API.
 
         Uses Client Credentials flow for application-level access.
-        Caches token until expiration.
+        Caches token (in process and in Redis) until shortly before it
+        expires. Only one worker refreshes at a time; the others wait briefly
+        for its token before falling back to fetching their own.
 
         Returns:
             str: Valid access token
         """
+        global _access_token, _token_expires_at
+
         # Check if cached token is still valid
-        if self.access_token and self.token_expires_at:
-            if datetime.now() < self.token_expires_at:
-                return self.access_token
+        if _access_token and _token_expires_at and datetime.now() < _token_expires_at:
+            return _access_token
 
-        # Import here to avoid errors if package not installed
-        try:
-            from ebay_rest import API, Environment
-        except ImportError:
-            raise ImportError(
-                "ebay-rest package not installed. Run: pip install ebay-rest>=1.0.14"
-            )
+        cache_key = f"ebay:token:{self.environment}"
+        lock_key = f"{cache_key}:lock"
 
-        try:
-            # Initialize eBay API client
-            env = Environment.SANDBOX if self.environment == "sandbox" else Environment.PRODUCTION
-            api = API(
-                application_id=self.client_id,
-                application_secret=self.client_secret,
-                environment=env
-            )
+        if self._load_shared_token(cache_key):
+            return _access_token
 
-            # Get application token (no user auth required)
-            api.get_application_token()
-            self.access_token = api.access_token
+        locked = cache_lock_sync(lock_key, EBAY_TOKEN_LOCK_SECONDS)
+        if not locked:
+            for _ in range(EBAY_TOKEN_WAIT_SECONDS * 2):
+                await asyncio.sleep(0.5)
+                if self._load_shared_token(cache_key):
+                    return _access_token
 
-            # Cache token for 2 hours (eBay tokens typically expire in 2 hours)
-            self.token_expires_at = datetime.now() + timedelta(hours=2)
+        try:
+            response = await self._client().post(
+                "/identity/v1/oauth2/token",
+                headers={"Authorization": self.basic_auth},
+                data={"grant_type": "client_credentials", "scope": EBAY_OAUTH_SCOPE},
+            )
+            response.raise_for_status()
+            token_data = response.json()
+
+            # eBay application tokens last 2 hours; refresh a minute early
+            expires_in = int(token_data.get("expires_in", 7200))
+            _access_token = token_data["access_token"]
+            _token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+            cache_set_sync(
+                cache_key,
+                {"access_token": _access_token, "expires_at": _token_expires_at.isoformat()},
+                ttl=expires_in - 60
+            )
 
-            logger.info(f"eBay access token obtained, expires at {self.token_expires_at}")
-            return self.access_token
+            logger.info(f"eBay access token obtained, expires at {_token_expires_at}")
+            return _access_token
 
         except Exception as e:
             logger.error(f"Failed to get eBay access token: {e}")
             raise
 
-    def search_vintage_jeans(
+        finally:
+            if locked:
+                cache_invalidate_sync(lock_key)
+
+    def _load_shared_token(self, cache_key: str) -> bool:
+        """
+        Adopt a token another worker cached in Redis.
+
+        Returns:
+            True if a token was found and is now the process-wide token
+        """
+        global _access_token, _token_expires_at
+
+        cached = cache_get_sync(cache_key)
+        if not cached:
+            return False
+
+        _access_token = cached["access_token"]
+        _token_expires_at = datetime.fromisoformat(cached["expires_at"])
+        return True
+
+    async def search_vintage_jeans(
         self,
         keywords: str = "vintage jeans",
         limit: int = 100,
@@ -94,63 +239,64 @@ class eBayService:
         """
         Search for vintage jeans listings on eBay.
 
+        Results beyond the first page (eBay returns at most 200 per request)
+        are fetched concurrently, at most EBAY_CONCURRENCY pages at a time.
+
         Args:
             keywords: Search keywords (default: "vintage jeans")
-            limit: Maximum number of results (default: 100, max: 200)
+            limit: Maximum number of results (default: 100)
             filters: Optional filters (price_min, price_max, condition, size, brand)
 
         Returns:
             List of listing dictionaries with standardized fields
         """
-        try:
-            from ebay_rest import API, Environment
-        except ImportError:
-            logger.error("ebay-rest package not installed")
-            return []
-
         try:
             # Get access token
-            token = self._get_access_token()
-
-            # Initialize API
-            env = Environment.SANDBOX if self.environment == "sandbox" else Environment.PRODUCTION
-            api = API(
-                application_id=self.client_id,
-                application_secret=self.client_secret,
-                environment=env
-            )
-            api.access_token = token
+            token = await self._get_access_token()
 
             # Build search query
             filters = filters or {}
-
-            # Search parameters
-            search_params = {
-                "q": keywords,
-                "limit": min(limit, 200),  # eBay max is 200
-                "filter": []
-            }
+            filter_parts = []
 
             # Add price filter
             if filters.get("price_min") or filters.get("price_max"):
                 price_filter = "price:["
                 price_filter += str(filters.get("price_min", "")) + ".."
                 price_filter += str(filters.get("price_max", "")) + "]"
-                search_params["filter"].append(price_filter)
+                filter_parts.append(price_filter)
 
             # Add condition filter (NEW, USED_EXCELLENT, USED_GOOD, etc.)
             if filters.get("condition"):
-                search_params["filter"].append(f"condition:{filters['condition']}")
+                filter_parts.append(f"condition:{filters['condition']}")
 
-            # Execute search using Browse API
-            response = api.buy_browse.search(**search_params)
+            # Search parameters
+            search_params = {"q": keywords}
+            if filter_parts:
+                search_params["filter"] = ",".join(filter_parts)
+
+            # The first page also reports how many results exist
+            first_page = await self._search_page(token, search_params, 0, min(limit, EBAY_PAGE_SIZE))
+            items = first_page.get("itemSummaries") or []
+
+            wanted = min(limit, first_page.get("total", 0), EBAY_MAX_OFFSET)
+            if wanted > EBAY_PAGE_SIZE:
+                semaphore = asyncio.Semaphore(EBAY_CONCURRENCY)
+
+                async def fetch(offset: int) -> Dict[str, Any]:
+                    async with semaphore:
+                        return await self._search_page(
+                            token, search_params, offset, min(EBAY_PAGE_SIZE, wanted - offset)
+                        )
+
+                pages = await asyncio.gather(
+                    *[fetch(offset) for offset in range(EBAY_PAGE_SIZE, wanted, EBAY_PAGE_SIZE)]
+                )
+                for page in pages:
+                    items.extend(page.get("itemSummaries") or [])
 
             # Parse results
-            listings = []
-            if response and hasattr(response, "itemSummaries"):
-                for item in response.itemSummaries or []:
-                    listing = self._parse_ebay_listing(item)
-                    listings.append(listing)
+            fetched_at = datetime.now().isoformat()
+            listings = [self._parse_ebay_listing(item, fetched_at) for item in items]
 
             logger.info(f"Found {len(listings)} eBay listings for '{keywords}'")
             return listings
@@ -159,140 +305,110 @@ class eBayService:
             logger.error(f"eBay search failed: {e}")
             return []
 
-    def _parse_ebay_listing(self, item: Any) -> Dict[str, Any]:
+    async def _search_page(
+        self,
+        token: str,
+        search_params: Dict[str, Any],
+        offset: int,
+        limit: int
+    ) -> Dict[str, Any]:
+        """
+        Fetch one page of Browse API search results.
+
+        Args:
+            token: Application access token
+            search_params: Query and filter parameters shared by every page
+            offset: Index of the first result
+            limit: Page size (at most EBAY_PAGE_SIZE)
+
+        Returns:
+            The decoded search response
+        """
+        response = await self._client().get(
+            "/buy/browse/v1/item_summary/search",
+            params={**search_params, "offset": offset, "limit": limit},
+            headers={
+                "Authorization": f"Bearer {token}",
+                "X-EBAY-C-MARKETPLACE-ID": EBAY_MARKETPLACE_ID,
+            },
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _parse_ebay_listing(self, item: Any, fetched_at: str) -> Dict[str, Any]:
         """
         Parse eBay item into standardized listing format.
 
         Args:
-            item: eBay item object from API response
+            item: eBay item object (or dict) from API response
+            fetched_at: When the search ran, ISO formatted (shared by the whole batch)
 
         Returns:
             Standardized listing dictionary
         """
-        # Extract basic info
-        item_id = getattr(item, "itemId", "")
-        title = getattr(item, "title", "")
-        price_obj = getattr(item, "price", None)
-        price = float(price_obj.value) if price_obj and hasattr(price_obj, "value") else None
-        currency = price_obj.currency if price_obj and hasattr(price_obj, "currency") else "USD"
+        # One attribute snapshot per object instead of getattr/hasattr pairs
+        attrs = _attrs(item)
+        price_attrs = _attrs(attrs.get("price"))
+        image_attrs = _attrs(attrs.get("image"))
+        seller_attrs = _attrs(attrs.get("seller"))
+
+        item_id = attrs.get("itemId", "")
+        title = attrs.get("title", "")
+        price = float(price_attrs["value"]) if "value" in price_attrs else None
+        currency = price_attrs.get("currency", "USD")
 
         # Extract image URLs
-        image = getattr(item, "image", None)
-        thumbnail_url = image.imageUrl if image and hasattr(image, "imageUrl") else None
-        additional_images = getattr(item, "additionalImages", [])
-        image_urls = [img.imageUrl for img in additional_images if hasattr(img, "imageUrl")]
+        thumbnail_url = image_attrs.get("imageUrl")
+        image_urls = [
+            url for url in (_attrs(img).get("imageUrl") for img in attrs.get("additionalImages") or [])
+            if url
+        ]
         if thumbnail_url and thumbnail_url not in image_urls:
             image_urls.insert(0, thumbnail_url)
 
-        # Extract seller info
-        seller = getattr(item, "seller", None)
-        seller_username = seller.username if seller and hasattr(seller, "username") else None
-        seller_rating = seller.feedbackPercentage if seller and hasattr(seller, "feedbackPercentage") else None
-
-        # Extract condition
-        condition_obj = getattr(item, "condition", None)
-        condition = condition_obj.conditionDisplayName if condition_obj and hasattr(condition_obj, "conditionDisplayName") else None
+        seller_username = seller_attrs.get("username")
+        seller_rating = seller_attrs.get("feedbackPercentage")
+        condition = attrs.get("condition")  # Display name, e.g. "Used"; conditionId stays in raw_data
 
-        # Extract location
-        item_location = getattr(item, "itemLocation", None)
-        seller_location = None
-        if item_location and hasattr(item_location, "country"):
-            seller_location = getattr(item_location, "country", None)
-
-        # Build item URL
-        item_web_url = getattr(item, "itemWebUrl", f"https://www.ebay.com/itm/{item_id}")
-
-        # Return standardized format
-        return {
-            "platform": "ebay",
+        # Fields not present in search results keep their template defaults
+        listing = _LISTING_TEMPLATE.copy()
+        listing.update({
             "external_id": item_id,
-            "url": item_web_url,
+            "url": attrs.get("itemWebUrl") or f"https://www.ebay.com/itm/{item_id}",
             "title": title,
-            "description": None,  # Description requires separate API call
             "price": price,
             "currency": currency,
             "condition": condition,
-            "size": None,  # Needs parsing from title/description
-            "brand": None,  # Needs parsing from title/description
-            "waist_size": None,
-            "inseam_length": None,
-            "style": None,
-            "wash": None,
-            "era": None,
             "image_urls": image_urls,
             "thumbnail_url": thumbnail_url,
             "seller_username": seller_username,
             "seller_rating": float(seller_rating) / 100.0 if seller_rating else None,
-            "seller_location": seller_location,
-            "status": "active",
-            "listed_at": datetime.now(),  # eBay doesn't always provide listing date
-            "view_count": 0,
-            "watch_count": 0,
-            "favorite_count": 0,
+            "seller_location": _attrs(attrs.get("itemLocation")).get("country"),
+            "listed_at": fetched_at,  # eBay doesn't always provide listing date
             "ai_tags": [],
-            "ai_summary": None,
-            "trend_score": None,
-            "raw_data": {
-                "itemId": item_id,
-                "title": title,
-                "price": {"value": price, "currency": currency},
-                "condition": condition,
-                "seller": {
-                    "username": seller_username,
-                    "feedbackPercentage": seller_rating
-                }
-            }
-        }
+            # Only the API fields not already stored in their own columns
+            "raw_data": {key: value for key, value in attrs.items() if key not in _COLUMN_ITEM_FIELDS},
+        })
+        return listing
 
     def save_listings_to_db(self, listings: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         Save eBay listings to Supabase database.
 
+        Upserts in batches (see listing_store.upsert_listings).
+
         Args:
             listings: List of parsed listings
 
         Returns:
             Dictionary with counts: {"added": 5, "updated": 3, "errors": 0}
         """
-        added = 0
-        updated = 0
-        errors = 0
-
-        for listing in listings:
-            try:
-                # Check if listing already exists
-                existing = self.supabase.table("marketplace_listings").select("id").eq(
-                    "platform", "ebay"
-                ).eq(
-                    "external_id", listing["external_id"]
-                ).execute()
-
-                if existing.data and len(existing.data) > 0:
-                    # Update existing listing
-                    listing["updated_at"] = datetime.now().isoformat()
-                    listing["last_synced_at"] = datetime.now().isoformat()
-
-                    self.supabase.table("marketplace_listings").update(listing).eq(
-                        "id", existing.data[0]["id"]
-                    ).execute()
-                    updated += 1
-                else:
-                    # Insert new listing
-                    listing["created_at"] = datetime.now().isoformat()
-                    listing["updated_at"] = datetime.now().isoformat()
-                    listing["last_synced_at"] = datetime.now().isoformat()
-
-                    self.supabase.table("marketplace_listings").insert(listing).execute()
-                    added += 1
-
-            except Exception as e:
-                logger.error(f"Failed to save eBay listing {listing.get('external_id')}: {e}")
-                errors += 1
-
-        logger.info(f"eBay listings saved: {added} added, {updated} updated, {errors} errors")
-        return {"added": added, "updated": updated, "errors": errors}
-
-    def sync_listings(
+        stats = upsert_listings(self.supabase, "ebay", listings)
+
+        logger.info(f"eBay listings saved: {stats['added']} added, {stats['updated']} updated, {stats['errors']} errors")
+        return stats
+
+    async def sync_listings(
         self,
         keywords: str = "vintage jeans",
         limit: int = 100,
@@ -312,7 +428,7 @@ class eBayService:
         logger.info(f"Starting eBay sync for '{keywords}' (limit: {limit})")
 
         # Search listings
-        listings = self.search_vintage_jeans(keywords, limit, filters)
+        listings = await self.search_vintage_jeans(keywords, limit, filters)
 
         # Save to database
         stats = self.save_listings_to_db(listings)
@@ -327,6 +443,10 @@ def sync_ebay_listings(keywords: str = "vintage jeans", limit: int = 100) -> Dic
     """
     Convenience function to sync eBay listings.
 
+    Synchronous entry point for Celery tasks: runs the async sync on its own
+    event loop (see async_runner for the gevent io worker) and closes the
+    service's HTTP client afterwards.
+
     Args:
         keywords: Search keywords
         limit: Maximum results
@@ -334,5 +454,11 @@ def sync_ebay_listings(keywords: str = "vintage jeans", limit: int = 100) -> Dic
     Returns:
         Sync statistics
     """
-    service = eBayService()
-    return service.sync_listings(keywords, limit)
+    async def run() -> Dict[str, Any]:
+        service = eBayService()
+        try:
+            return await service.sync_listings(keywords, limit)
+        finally:
+            await service.aclose()
+
+    return run_coroutine(run())
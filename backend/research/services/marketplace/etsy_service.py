@@ -8,18 +8,142 @@ This service uses the Etsy API v3 to:
 - Analyze vintage clothing market
 
 API Documentation: https://developers.etsy.com/documentation/
-Package: etsyv3 v0.2.0
+Package: etsyv3 v0.2.0 (search falls back to the REST endpoint over httpx.AsyncClient)
 """
 
 import os
+import time
+import asyncio
+import random
+import threading
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 import logging
 
+import httpx
+import orjson
+from cachetools import TTLCache
+
 from research.db.supabase_client import get_supabase_client
+from research.services.marketplace.async_runner import run_coroutine
+from research.services.marketplace.listing_store import upsert_listings
+
+# Resolved once at import; methods check for None instead of re-importing per call
+try:
+    from etsyv3 import Etsy
+except ImportError:
+    Etsy = None
 
 logger = logging.getLogger(__name__)
 
+ETSY_API_BASE_URL = "https://openapi.etsy.com"
+
+# Active listing search returns at most 100 results per request
+ETSY_PAGE_SIZE = 100
+
+# Search pages fetched at once during a sync
+ETSY_CONCURRENCY = int(os.getenv("ETSY_CONCURRENCY", 4))
+
+# Keep-alive pool for one sync's requests
+ETSY_HTTP_LIMITS = httpx.Limits(max_connections=16, max_keepalive_connections=16)
+ETSY_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+
+# Parsed search results keyed by (keywords, filters, limit), so repeating a
+# query within ETSY_SEARCH_CACHE_TTL_SECONDS skips the API and its quota.
+# Empty results (including failed searches) are not cached. Syncs run on
+# gevent greenlets or threads, hence the lock.
+_search_cache: TTLCache = TTLCache(maxsize=1024, ttl=int(os.getenv("ETSY_SEARCH_CACHE_TTL_SECONDS", "300")))
+_search_cache_lock = threading.Lock()
+
+# Etsy allows 10 requests per second per API key; calls over the limit are
+# rejected with 429 and still count against the daily quota
+ETSY_RATE_LIMIT_PER_SECOND = float(os.getenv("ETSY_RATE_LIMIT_PER_SECOND", 10))
+
+
+# Standardized listing fields with their defaults; _parse_etsy_listing copies
+# this and fills in what the item provides
+_LISTING_TEMPLATE: Dict[str, Any] = {
+    "platform": "etsy",
+    "external_id": "",
+    "url": None,
+    "title": "",
+    "description": "",
+    "price": 0.0,
+    "currency": "USD",
+    "condition": "vintage",  # Etsy vintage category
+    "size": None,  # Needs parsing from title/description
+    "brand": None,  # Needs parsing from title/description
+    "waist_size": None,
+    "inseam_length": None,
+    "style": None,
+    "wash": None,
+    "era": None,
+    "image_urls": None,
+    "thumbnail_url": None,
+    "seller_username": None,
+    "seller_rating": None,  # Etsy doesn't provide rating in listing API
+    "seller_location": None,
+    "status": "active",
+    "listed_at": None,
+    "view_count": 0,
+    "watch_count": 0,
+    "favorite_count": 0,
+    "ai_tags": None,
+    "ai_summary": None,
+    "trend_score": None,
+    "raw_data": None,
+}
+
+# Listing fields that _parse_etsy_listing maps onto listing columns (images
+# and the included shop are reduced to their URL and name/city columns)
+_COLUMN_ITEM_FIELDS = frozenset({
+    "listing_id", "url", "title", "description", "price", "currency_code",
+    "images", "shop", "created_timestamp", "views", "num_favorers",
+})
+
+
+class _TokenBucket:
+    """
+    Token bucket pacing outgoing requests to `rate` per second.
+
+    Each request takes a token; when the bucket is empty the caller sleeps
+    until its token accrues. Tokens are reserved under a thread lock (never
+    held across an await), so one bucket serves every event loop in the
+    process. Workers each have their own bucket.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token; returns how long to wait before it may be used."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+_rate_limiter = _TokenBucket(ETSY_RATE_LIMIT_PER_SECOND)
+
+# Retries for rate-limited (429) and transient server errors: exponential
+# backoff from ETSY_RETRY_BACKOFF_SECONDS with up to 50% jitter, capped at
+# ETSY_RETRY_MAX_DELAY_SECONDS; a Retry-After header takes precedence
+ETSY_MAX_RETRIES = 8
+ETSY_RETRY_BACKOFF_SECONDS = 1.0
+ETSY_RETRY_MAX_DELAY_SECONDS = 60.0
+ETSY_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 
 class EtsyService:
     """Service for interacting with Etsy API v3."""
@@ -34,52 +158,51 @@ class EtsyService:
         if not self.api_key or not self.api_secret:
             logger.warning("Etsy credentials not configured. Set ETSY_API_KEY and ETSY_API_SECRET.")
 
-        self.access_token = None
-        self.token_expires_at = None
+        self.http: Optional[httpx.AsyncClient] = None
         self.supabase = get_supabase_client()
 
+    def _client(self) -> httpx.AsyncClient:
+        """
+        Return this service's HTTP client, creating it on first use.
+
+        The client is bound to the event loop that first uses it, so one is
+        kept per service (i.e. per sync run); every search page shares its
+        connections. Close it with aclose().
+        """
+        if self.http is None:
+            self.http = httpx.AsyncClient(
+                base_url=ETSY_API_BASE_URL,
+                headers={"x-api-key": self.api_key or ""},
+                http2=True,
+                limits=ETSY_HTTP_LIMITS,
+                timeout=ETSY_HTTP_TIMEOUT,
+            )
+        return self.http
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and its connections."""
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
+
     def _get_access_token(self) -> str:
         """
-        Get OAuth access token for Etsy API.
+        Get the credential for Etsy API calls.
 
-        Uses OAuth 2.0 for API access.
-        Caches token until expiration.
+        Read-only public data needs only the API key (sent as x-api-key);
+        there is no token exchange or validation call, so nothing is cached.
 
         Returns:
-            str: Valid access token
+            str: The configured API key
         """
-        # Check if cached token is still valid
-        if self.access_token and self.token_expires_at:
-            if datetime.now() < self.token_expires_at:
-                return self.access_token
-
-        # Import here to avoid errors if package not installed
-        try:
-            from etsyv3 import Etsy
-        except ImportError:
+        if Etsy is None:
             raise ImportError(
                 "etsyv3 package not installed. Run: pip install etsyv3>=0.2.0"
             )
 
-        try:
-            # Initialize Etsy client
-            etsy = Etsy(api_key=self.api_key)
-
-            # For public API access, Etsy v3 uses API key directly
-            # No OAuth required for read-only public data
-            self.access_token = self.api_key
-
-            # Set expiration to 1 year (API keys don't expire)
-            self.token_expires_at = datetime.now() + timedelta(days=365)
-
-            logger.info("Etsy API key validated")
-            return self.access_token
-
-        except Exception as e:
-            logger.error(f"Failed to validate Etsy API key: {e}")
-            raise
+        return self.api_key
 
-    def search_vintage_jeans(
+    async def search_vintage_jeans(
         self,
         keywords: str = "vintage jeans",
         limit: int = 100,
@@ -88,6 +211,9 @@ class EtsyService:
         """
         Search for vintage jeans listings on Etsy.
 
+        Results are served from the process-wide search cache when the same
+        query ran within ETSY_SEARCH_CACHE_TTL_SECONDS.
+
         Args:
             keywords: Search keywords (default: "vintage jeans")
             limit: Maximum number of results (default: 100, max: 100 per request)
@@ -96,12 +222,17 @@ class EtsyService:
         Returns:
             List of listing dictionaries with standardized fields
         """
-        try:
-            from etsyv3 import Etsy
-        except ImportError:
+        if Etsy is None:
             logger.error("etsyv3 package not installed")
             return []
 
+        cache_key = (keywords, frozenset((filters or {}).items()), limit)
+        with _search_cache_lock:
+            cached = _search_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Serving {len(cached)} cached Etsy listings for '{keywords}'")
+            return list(cached)
+
         try:
             # Get access token
             token = self._get_access_token()
@@ -124,29 +255,46 @@ class EtsyService:
             if filters.get("price_max"):
                 params["max_price"] = float(filters["price_max"]) * 100
 
-            # Execute search
-            response = etsy.find_all_active_listings_by_shop(**params)
+            # Execute search (the SDK is blocking; keep it off the event loop)
+            await _rate_limiter.acquire()
+            response = await asyncio.to_thread(etsy.find_all_active_listings_by_shop, **params)
 
             # Parse results
             listings = []
             if response and "results" in response:
-                for item in response["results"]:
-                    listing = self._parse_etsy_listing(item)
-                    listings.append(listing)
+                listings = self._parse_etsy_listings(response["results"])
 
                 logger.info(f"Found {len(listings)} Etsy listings for '{keywords}'")
             else:
                 # Fallback: Try different search method
                 logger.warning("find_all_active_listings_by_shop failed, trying alternative")
-                listings = self._search_listings_alternative(keywords, limit, filters)
+                listings = await self._search_listings_alternative(keywords, limit, filters)
 
-            return listings
+            if listings:
+                with _search_cache_lock:
+                    _search_cache[cache_key] = listings
+            return list(listings)
 
         except Exception as e:
             logger.error(f"Etsy search failed: {e}")
             return []
 
-    def _search_listings_alternative(
+    @staticmethod
+    def invalidate_cache(keywords: Optional[str] = None) -> None:
+        """
+        Drop cached search results so the next search hits the API.
+
+        Args:
+            keywords: Only drop results for these keywords (default: all)
+        """
+        with _search_cache_lock:
+            if keywords is None:
+                _search_cache.clear()
+            else:
+                for key in [key for key in _search_cache if key[0] == keywords]:
+                    _search_cache.pop(key, None)
+
+    async def _search_listings_alternative(
         self,
         keywords: str,
         limit: int,
@@ -156,6 +304,8 @@ class EtsyService:
         Alternative search method using direct API calls.
 
         This is a fallback when the etsyv3 package methods don't work as expected.
+        Every page (Etsy returns at most 100 per request) is requested at once,
+        at most ETSY_CONCURRENCY at a time.
 
         Args:
             keywords: Search keywords
@@ -165,19 +315,9 @@ class EtsyService:
         Returns:
             List of parsed listings
         """
-        import requests
-
         try:
-            # Etsy API v3 endpoint
-            url = "https://openapi.etsy.com/v3/application/listings/active"
-
-            headers = {
-                "x-api-key": self.api_key
-            }
-
             params = {
                 "keywords": keywords,
-                "limit": min(limit, 100),
                 "sort_on": "score",
                 "includes": "Images,Shop"
             }
@@ -189,16 +329,17 @@ class EtsyService:
                 if filters.get("price_max"):
                     params["max_price"] = float(filters["price_max"]) * 100
 
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
+            semaphore = asyncio.Semaphore(ETSY_CONCURRENCY)
 
-            data = response.json()
-            listings = []
+            async def fetch(offset: int) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._search_page(params, offset, min(ETSY_PAGE_SIZE, limit - offset))
 
-            if "results" in data:
-                for item in data["results"]:
-                    listing = self._parse_etsy_listing(item)
-                    listings.append(listing)
+            pages = await asyncio.gather(*[fetch(offset) for offset in range(0, limit, ETSY_PAGE_SIZE)])
+
+            listings = self._parse_etsy_listings(
+                [item for page in pages for item in page.get("results") or []]
+            )
 
             logger.info(f"Alternative search found {len(listings)} Etsy listings")
             return listings
@@ -207,36 +348,102 @@ class EtsyService:
             logger.error(f"Alternative Etsy search failed: {e}")
             return []
 
-    def _parse_etsy_listing(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    async def _search_page(self, params: Dict[str, Any], offset: int, limit: int) -> Dict[str, Any]:
+        """
+        Fetch one page of active listing search results.
+
+        Rate-limited and transient failures are retried up to ETSY_MAX_RETRIES
+        times with jittered exponential backoff.
+
+        Args:
+            params: Query and filter parameters shared by every page
+            offset: Index of the first result
+            limit: Page size (at most ETSY_PAGE_SIZE)
+
+        Returns:
+            The decoded search response
+        """
+        for attempt in range(ETSY_MAX_RETRIES + 1):
+            await _rate_limiter.acquire()
+            try:
+                response = await self._client().get(
+                    "/v3/application/listings/active",
+                    params={**params, "offset": offset, "limit": limit},
+                )
+            except httpx.TransportError:
+                if attempt == ETSY_MAX_RETRIES:
+                    raise
+                retry_after = None
+            else:
+                if response.status_code not in ETSY_RETRY_STATUSES or attempt == ETSY_MAX_RETRIES:
+                    response.raise_for_status()
+                    return orjson.loads(response.content)
+                retry_after = response.headers.get("Retry-After")
+
+            if retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = ETSY_RETRY_BACKOFF_SECONDS * 2 ** attempt
+                delay += random.uniform(0, delay / 2)
+            delay = min(delay, ETSY_RETRY_MAX_DELAY_SECONDS)
+
+            logger.warning(f"Etsy search page at offset {offset} failed, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    def _parse_etsy_listings(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of Etsy listings into standardized format.
+
+        The creation timestamps are converted in one pass over the batch, and
+        items without a usable timestamp get the time of the search.
+
+        Args:
+            items: Etsy listing dictionaries from API responses
+
+        Returns:
+            Standardized listing dictionaries, in the same order
+        """
+        fetched_at = datetime.now(timezone.utc).isoformat()
+
+        listed_at_column = []
+        for item in items:
+            try:
+                listed_at_column.append(
+                    datetime.fromtimestamp(int(item["created_timestamp"]), tz=timezone.utc).isoformat()
+                )
+            except (KeyError, TypeError, ValueError, OverflowError, OSError):
+                listed_at_column.append(fetched_at)
+
+        return [self._parse_etsy_listing(item, listed_at) for item, listed_at in zip(items, listed_at_column)]
+
+    def _parse_etsy_listing(self, item: Dict[str, Any], listed_at: str) -> Dict[str, Any]:
         """
         Parse Etsy listing into standardized format.
 
         Args:
             item: Etsy listing dictionary from API response
+            listed_at: Creation time, ISO formatted (see _parse_etsy_listings)
 
         Returns:
             Standardized listing dictionary
         """
-        # Extract basic info
         listing_id = item.get("listing_id", "")
-        title = item.get("title", "")
-        description = item.get("description", "")
 
         # Price info
-        price_data = item.get("price", {})
+        price_data = item.get("price")
         if isinstance(price_data, dict):
             price = float(price_data.get("amount", 0)) / price_data.get("divisor", 100)
             currency = price_data.get("currency_code", "USD")
         else:
-            price = float(item.get("price", 0))
+            price = float(price_data or 0)
             currency = item.get("currency_code", "USD")
 
         # Images
-        images = item.get("images", [])
+        images = item.get("images")
         image_urls = []
         thumbnail_url = None
 
-        if isinstance(images, list) and len(images) > 0:
+        if isinstance(images, list) and images:
             # Get first image as thumbnail
             first_image = images[0]
             if isinstance(first_image, dict):
@@ -247,104 +454,51 @@ class EtsyService:
                 image_urls = images
 
         # Shop info (seller)
-        shop_data = item.get("shop", {})
-        seller_username = shop_data.get("shop_name") if isinstance(shop_data, dict) else None
-        seller_location = shop_data.get("city") if isinstance(shop_data, dict) else None
-
-        # Build listing URL
-        url = item.get("url", f"https://www.etsy.com/listing/{listing_id}")
+        shop_data = item.get("shop")
+        if not isinstance(shop_data, dict):
+            shop_data = {}
 
-        # Parse creation date
-        listed_at = None
-        created_timestamp = item.get("created_timestamp")
-        if created_timestamp:
-            try:
-                listed_at = datetime.fromtimestamp(int(created_timestamp))
-            except:
-                listed_at = datetime.now()
-
-        # Return standardized format
-        return {
-            "platform": "etsy",
+        # Fields Etsy doesn't provide keep their template defaults
+        listing = _LISTING_TEMPLATE.copy()
+        listing.update({
             "external_id": str(listing_id),
-            "url": url,
-            "title": title,
-            "description": description,
+            "url": item.get("url") or f"https://www.etsy.com/listing/{listing_id}",
+            "title": item.get("title", ""),
+            "description": item.get("description", ""),
             "price": price,
             "currency": currency,
-            "condition": "vintage",  # Etsy vintage category
-            "size": None,  # Needs parsing from title/description
-            "brand": None,  # Needs parsing from title/description
-            "waist_size": None,
-            "inseam_length": None,
-            "style": None,
-            "wash": None,
-            "era": None,
             "image_urls": image_urls,
             "thumbnail_url": thumbnail_url,
-            "seller_username": seller_username,
-            "seller_rating": None,  # Etsy doesn't provide rating in listing API
-            "seller_location": seller_location,
-            "status": "active",
-            "listed_at": listed_at or datetime.now(),
+            "seller_username": shop_data.get("shop_name"),
+            "seller_location": shop_data.get("city"),
+            "listed_at": listed_at,
             "view_count": item.get("views", 0),
             "watch_count": item.get("num_favorers", 0),
             "favorite_count": item.get("num_favorers", 0),
             "ai_tags": [],
-            "ai_summary": None,
-            "trend_score": None,
-            "raw_data": item
-        }
+            # Only the API fields not already stored in their own columns
+            "raw_data": {key: value for key, value in item.items() if key not in _COLUMN_ITEM_FIELDS}
+        })
+        return listing
 
     def save_listings_to_db(self, listings: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         Save Etsy listings to Supabase database.
 
+        Upserts in batches (see listing_store.upsert_listings).
+
         Args:
             listings: List of parsed listings
 
         Returns:
             Dictionary with counts: {"added": 5, "updated": 3, "errors": 0}
         """
-        added = 0
-        updated = 0
-        errors = 0
+        stats = upsert_listings(self.supabase, "etsy", listings)
 
-        for listing in listings:
-            try:
-                # Check if listing already exists
-                existing = self.supabase.table("marketplace_listings").select("id").eq(
-                    "platform", "etsy"
-                ).eq(
-                    "external_id", listing["external_id"]
-                ).execute()
-
-                if existing.data and len(existing.data) > 0:
-                    # Update existing listing
-                    listing["updated_at"] = datetime.now().isoformat()
-                    listing["last_synced_at"] = datetime.now().isoformat()
-
-                    self.supabase.table("marketplace_listings").update(listing).eq(
-                        "id", existing.data[0]["id"]
-                    ).execute()
-                    updated += 1
-                else:
-                    # Insert new listing
-                    listing["created_at"] = datetime.now().isoformat()
-                    listing["updated_at"] = datetime.now().isoformat()
-                    listing["last_synced_at"] = datetime.now().isoformat()
-
-                    self.supabase.table("marketplace_listings").insert(listing).execute()
-                    added += 1
-
-            except Exception as e:
-                logger.error(f"Failed to save Etsy listing {listing.get('external_id')}: {e}")
-                errors += 1
-
-        logger.info(f"Etsy listings saved: {added} added, {updated} updated, {errors} errors")
-        return {"added": added, "updated": updated, "errors": errors}
-
-    def sync_listings(
+        logger.info(f"Etsy listings saved: {stats['added']} added, {stats['updated']} updated, {stats['errors']} errors")
+        return stats
+
+    async def sync_listings(
         self,
         keywords: str = "vintage jeans",
         limit: int = 100,
@@ -364,7 +518,7 @@ class EtsyService:
         logger.info(f"Starting Etsy sync for '{keywords}' (limit: {limit})")
 
         # Search listings
-        listings = self.search_vintage_jeans(keywords, limit, filters)
+        listings = await self.search_vintage_jeans(keywords, limit, filters)
 
         # Save to database
         stats = self.save_listings_to_db(listings)
@@ -379,6 +533,10 @@ def sync_etsy_listings(keywords: str = "vintage jeans", limit: int = 100) -> Dic
     """
     Convenience function to sync Etsy listings.
 
+    Synchronous entry point for Celery tasks: runs the async sync on its own
+    event loop (see async_runner for the gevent io worker) and closes the
+    service's HTTP client afterwards.
+
     Args:
         keywords: Search keywords
         limit: Maximum results
@@ -386,5 +544,11 @@ def sync_etsy_listings(keywords: str = "vintage jeans", limit: int = 100) -> Dic
     Returns:
         Sync statistics
     """
-    service = EtsyService()
-    return service.sync_listings(keywords, limit)
+    async def run() -> Dict[str, Any]:
+        service = EtsyService()
+        try:
+            return await service.sync_listings(keywords, limit)
+        finally:
+            await service.aclose()
+
+    return run_coroutine(run())
@@ -0,0 +1,103 @@
+"""
+Batched writes of parsed marketplace listings to marketplace_listings.
+
+Shared by the eBay and Etsy services: listings are upserted on
+(platform, external_id) in batches of UPSERT_BATCH_SIZE rows. The lookup
+that splits the counts into added vs updated is a GET with the ids in the
+URL, so it runs in smaller chunks of LOOKUP_BATCH_SIZE ids (eBay ids like
+"v1|123456789012|0" are ~25 bytes each once encoded) and is best-effort:
+if it fails, the batch is still written.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+import logging
+
+from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+# Listings written per upsert request
+UPSERT_BATCH_SIZE = 500
+
+# External ids per existence lookup (keeps the request URL a few KB)
+LOOKUP_BATCH_SIZE = 100
+
+
+def upsert_listings(supabase: Client, platform: str, listings: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Upsert parsed listings for one platform in batches.
+
+    A batch whose upsert fails is counted as errors and the remaining
+    batches are still written. If the existence lookup fails, the batch is
+    written anyway and counted as added.
+
+    Args:
+        supabase: Supabase client
+        platform: Platform the listings come from (e.g. "ebay")
+        listings: Parsed listings
+
+    Returns:
+        Dictionary with counts: {"added": 5, "updated": 3, "errors": 0}
+    """
+    added = 0
+    updated = 0
+    errors = 0
+
+    # One row per external_id (an upsert can't touch the same row twice)
+    by_external_id = {listing["external_id"]: listing for listing in listings}
+    synced_at = datetime.now().isoformat()
+    for listing in by_external_id.values():
+        listing["last_synced_at"] = synced_at
+
+    rows = list(by_external_id.values())
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start:start + UPSERT_BATCH_SIZE]
+        existing_count = _count_existing(supabase, platform, [listing["external_id"] for listing in batch])
+
+        try:
+            # INSERT ... ON CONFLICT (platform, external_id) DO UPDATE
+            # created_at keeps its value on update; updated_at is set by the trigger
+            supabase.table("marketplace_listings").upsert(
+                batch, on_conflict="platform,external_id"
+            ).execute()
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} {platform} listings: {e}")
+            errors += len(batch)
+            continue
+
+        updated += existing_count
+        added += len(batch) - existing_count
+
+    return {"added": added, "updated": updated, "errors": errors}
+
+
+def _count_existing(supabase: Client, platform: str, external_ids: List[str]) -> int:
+    """
+    Count how many of the given listings are already stored.
+
+    Only used for the added/updated stats; a failed lookup is logged and
+    counts as none existing.
+
+    Args:
+        supabase: Supabase client
+        platform: Platform the listings come from
+        external_ids: Platform ids of the listings
+
+    Returns:
+        Number of ids that already have a marketplace_listings row
+    """
+    count = 0
+    for start in range(0, len(external_ids), LOOKUP_BATCH_SIZE):
+        try:
+            existing = supabase.table("marketplace_listings").select("external_id").eq(
+                "platform", platform
+            ).in_(
+                "external_id", external_ids[start:start + LOOKUP_BATCH_SIZE]
+            ).execute()
+        except Exception as e:
+            logger.warning(f"Existing {platform} listing lookup failed, stats will be approximate: {e}")
+            continue
+        count += len(existing.data or [])
+
+    return count
@@ -19,6 +19,12 @@ import logging
 
 from research.db.supabase_client import get_supabase_client
 
+# Resolved once at import; methods check for None instead of re-importing per call
+try:
+    import praw
+except ImportError:
+    praw = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,10 +68,7 @@ class RedditService:
         if self.reddit:
             return self.reddit
 
-        # Import here to avoid errors if package not installed
-        try:
-            import praw
-        except ImportError:
+        if praw is None:
             raise ImportError(
                 "praw package not installed. Run: pip install praw>=7.7.1"
             )
@@ -411,6 +414,9 @@ class RedditService:
         updated = 0
         errors = 0
 
+        # One timestamp for the whole batch
+        synced_at = datetime.now().isoformat()
+
         for post in posts:
             try:
                 # Check if post already exists
@@ -422,8 +428,8 @@ class RedditService:
 
                 if existing.data and len(existing.data) > 0:
                     # Update existing post
-                    post["updated_at"] = datetime.now().isoformat()
-                    post["last_synced_at"] = datetime.now().isoformat()
+                    # updated_at is maintained by the BEFORE UPDATE trigger
+                    post["last_synced_at"] = synced_at
 
                     self.supabase.table("marketplace_listings").update(post).eq(
                         "id", existing.data[0]["id"]
@@ -431,10 +437,7 @@ class RedditService:
                     updated += 1
                 else:
                     # Insert new post
-                    post["created_at"] = datetime.now().isoformat()
-                    post["updated_at"] = datetime.now().isoformat()
-                    post["last_synced_at"] = datetime.now().isoformat()
-
+                    # created_at/updated_at/last_synced_at default to NOW() in Postgres
                     self.supabase.table("marketplace_listings").insert(post).execute()
                     added += 1
 
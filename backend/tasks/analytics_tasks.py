@@ -8,7 +8,10 @@ These tasks handle:
 - Market insights generation
 """
 
+import asyncio
 import logging
+from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 
@@ -41,8 +44,8 @@ def generate_daily_trends() -> Dict[str, Any]:
         end_date = datetime.now()
         start_date = end_date - timedelta(days=1)
 
-        # Get all listings from last 24 hours
-        listings_result = supabase.table("marketplace_listings").select("*").gte(
+        # Get all listings from last 24 hours (only the fields the stats use)
+        listings_result = supabase.table("marketplace_listings").select("platform,brand,price,trend_score").gte(
             "created_at", start_date.isoformat()
         ).lte(
             "created_at", end_date.isoformat()
@@ -91,20 +94,15 @@ def generate_daily_trends() -> Dict[str, Any]:
 def _calculate_platform_trends(listings: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """Calculate trends grouped by platform."""
     trends = {}
+    by_platform = _group_by(listings, "platform")
 
     for platform in ["ebay", "etsy", "reddit"]:
-        platform_listings = [l for l in listings if l.get("platform") == platform]
+        platform_listings = by_platform.get(platform)
 
         if platform_listings:
-            prices = [l.get("price", 0) for l in platform_listings if l.get("price")]
-
             trends[platform] = {
-                "total_listings": len(platform_listings),
-                "avg_price": sum(prices) / len(prices) if prices else 0,
-                "min_price": min(prices) if prices else 0,
-                "max_price": max(prices) if prices else 0,
+                **_summarize(platform_listings),
                 "total_sales": 0,  # Would need sold status tracking
-                "engagement_score": sum([l.get("trend_score", 0) for l in platform_listings]) / len(platform_listings)
             }
 
     return trends
@@ -113,43 +111,75 @@ def _calculate_platform_trends(listings: List[Dict[str, Any]]) -> Dict[str, Dict
 def _calculate_brand_trends(listings: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
     """Calculate trends grouped by brand."""
     trends = {}
-    brands = {}
-
-    # Group listings by brand
-    for listing in listings:
-        brand = listing.get("brand")
-        if brand:
-            if brand not in brands:
-                brands[brand] = []
-            brands[brand].append(listing)
+    brands = _group_by(listings, "brand")
 
     # Calculate stats for each brand
     for brand, brand_listings in brands.items():
-        prices = [l.get("price", 0) for l in brand_listings if l.get("price")]
-
-        trends[brand] = {
-            "total_listings": len(brand_listings),
-            "avg_price": sum(prices) / len(prices) if prices else 0,
-            "min_price": min(prices) if prices else 0,
-            "max_price": max(prices) if prices else 0,
-            "engagement_score": sum([l.get("trend_score", 0) for l in brand_listings]) / len(brand_listings)
-        }
+        trends[brand] = _summarize(brand_listings)
 
     return trends
 
 
+def _group_by(listings: List[Dict[str, Any]], key: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Group listings by a field in one pass, skipping listings without a value."""
+    groups = defaultdict(list)
+    for listing in listings:
+        value = listing.get(key)
+        if value:
+            groups[value].append(listing)
+    return groups
+
+
 def _calculate_overall_trends(listings: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Calculate overall market trends."""
-    prices = [l.get("price", 0) for l in listings if l.get("price")]
-    engagement_scores = [l.get("trend_score", 0) for l in listings if l.get("trend_score")]
+    return {
+        **_summarize(listings, engagement_scored_only=True),
+        "total_sales": 0
+    }
+
+
+def _summarize(listings: List[Dict[str, Any]], engagement_scored_only: bool = False) -> Dict[str, Any]:
+    """
+    Compute listing count, price stats and engagement in a single pass.
+
+    Listings without a price are left out of the price stats.
+
+    Args:
+        listings: Non-empty list of listings
+        engagement_scored_only: Average trend_score over scored listings only
+            instead of over all listings
+
+    Returns:
+        Dict with total_listings, avg_price, min_price, max_price and
+        engagement_score
+    """
+    price_count = scored_count = 0
+    price_sum = score_sum = 0.0
+    min_price = max_price = None
+
+    for listing in listings:
+        price = listing.get("price")
+        if price:
+            price_count += 1
+            price_sum += price
+            if min_price is None or price < min_price:
+                min_price = price
+            if max_price is None or price > max_price:
+                max_price = price
+
+        score = listing.get("trend_score")
+        if score:
+            scored_count += 1
+            score_sum += score
+
+    score_divisor = scored_count if engagement_scored_only else len(listings)
 
     return {
         "total_listings": len(listings),
-        "avg_price": sum(prices) / len(prices) if prices else 0,
-        "min_price": min(prices) if prices else 0,
-        "max_price": max(prices) if prices else 0,
-        "engagement_score": sum(engagement_scores) / len(engagement_scores) if engagement_scores else 0,
-        "total_sales": 0
+        "avg_price": price_sum / price_count if price_count else 0,
+        "min_price": min_price if min_price is not None else 0,
+        "max_price": max_price if max_price is not None else 0,
+        "engagement_score": score_sum / score_divisor if score_divisor else 0,
     }
 
 
@@ -173,9 +203,8 @@ def _save_trend_record(
         "total_sales": trend_data.get("total_sales", 0),
         "engagement_score": trend_data.get("engagement_score", 0),
         "period_start": start_date.isoformat(),
-        "period_end": end_date.isoformat(),
-        "created_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat()
+        "period_end": end_date.isoformat()
+        # created_at/updated_at come from column defaults and the update trigger
     }
 
     try:
@@ -303,3 +332,50 @@ Extract and return JSON with:
     except Exception as e:
         logger.error(f"AI analysis failed for listing {listing_id}: {e}")
         return {"status": "failed", "error": str(e)}
+
+
+@lru_cache(maxsize=None)
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop reused by every async call in this worker process.
+
+    The shared AsyncOpenAI client and the asyncpg pool keep their connections
+    bound to the loop that opened them, so a fresh asyncio.run() per task
+    would strand them.
+    """
+    return asyncio.new_event_loop()
+
+
+@app.task(name="tasks.analytics_tasks.analyze_document_task")
+def analyze_document_task(client_name: str, text: str) -> Dict[str, Any]:
+    """
+    Summarize an uploaded research document with AI and save the summary.
+
+    Args:
+        client_name: Name of the client the document belongs to
+        text: Decoded document contents
+
+    Returns:
+        Saved summary record details
+    """
+    from research.db.pg_pool import init_pool
+    from research.services.ai_summary_service import analyze_document
+    from research.services.db_service import save_research_summary
+
+    logger.info(f"Starting research document analysis for {client_name}")
+
+    async def summarize():
+        # The pool lives on this process's loop; init_pool() is a no-op once created
+        await init_pool()
+        summary = await analyze_document(text)
+        return summary, await save_research_summary(client_name, summary)
+
+    try:
+        summary, record = _event_loop().run_until_complete(summarize())
+
+        logger.info(f"Research summary {record.get('id')} saved for {client_name}")
+        return {"status": "completed", "client": client_name, "summary": summary, "record_id": record.get("id")}
+
+    except Exception as e:
+        logger.error(f"Research document analysis failed for {client_name}: {e}")
+        return {"status": "failed", "error": str(e)}
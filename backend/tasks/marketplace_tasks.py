@@ -10,11 +10,15 @@ These tasks handle:
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional
+
+from postgrest.types import ReturnMethod
 
 from celery_app import app
 from research.db.supabase_client import get_supabase_client
+from research.db.cache import cache_invalidate_sync
 from research.services.marketplace.ebay_service import sync_ebay_listings
 from research.services.marketplace.etsy_service import sync_etsy_listings
 from research.services.marketplace.reddit_service import sync_reddit_posts
@@ -22,34 +26,41 @@ from research.services.marketplace.reddit_service import sync_reddit_posts
 logger = logging.getLogger(__name__)
 
 
-@app.task(
-    bind=True,
-    name="tasks.marketplace_tasks.sync_ebay_task",
-    max_retries=int(os.getenv("CELERY_MAX_RETRIES", 3)),
-    default_retry_delay=int(os.getenv("CELERY_RETRY_DELAY", 60))
-)
-def sync_ebay_task(self, keywords: str = "vintage jeans", limit: int = 100) -> Dict[str, Any]:
+def _run_tracked_sync(
+    platform: str,
+    sync_fn: Callable[[str, int], Dict[str, Any]],
+    keywords: str,
+    limit: int,
+    celery_task_id: Optional[str],
+    processed_key: str = "listings_found"
+) -> Dict[str, Any]:
     """
-    Celery task to sync eBay listings.
+    Run one marketplace sync and record it in marketplace_sync_jobs.
 
     Args:
+        platform: Platform name (ebay, etsy, reddit)
+        sync_fn: Service sync function taking (keywords, limit)
         keywords: Search keywords
         limit: Maximum listings to sync
+        celery_task_id: ID of the Celery task running the sync
+        processed_key: Stats key holding the number of items found
 
     Returns:
         Sync statistics dictionary
-    """
-    logger.info(f"Starting eBay sync task: {keywords} (limit: {limit})")
 
+    Raises:
+        Exception: Re-raised after the failure is recorded on the job
+    """
     # Create sync job record
     supabase = get_supabase_client()
     job_data = {
-        "platform": "ebay",
+        "platform": platform,
         "job_type": "incremental_sync",
         "status": "running",
         "started_at": datetime.now().isoformat(),
-        "celery_task_id": self.request.id
+        "celery_task_id": celery_task_id
     }
+    job_id = None
 
     try:
         # Insert job record
@@ -58,7 +69,7 @@ def sync_ebay_task(self, keywords: str = "vintage jeans", limit: int = 100) -> D
 
         # Execute sync
         start_time = datetime.now()
-        stats = sync_ebay_listings(keywords, limit)
+        stats = sync_fn(keywords, limit)
         duration = (datetime.now() - start_time).total_seconds()
 
         # Update job record with results
@@ -67,18 +78,15 @@ def sync_ebay_task(self, keywords: str = "vintage jeans", limit: int = 100) -> D
                 "status": "completed",
                 "completed_at": datetime.now().isoformat(),
                 "duration_seconds": int(duration),
-                "listings_processed": stats.get("listings_found", 0),
+                "listings_processed": stats.get(processed_key, 0),
                 "listings_added": stats.get("added", 0),
                 "listings_updated": stats.get("updated", 0),
             }
             supabase.table("marketplace_sync_jobs").update(update_data).eq("id", job_id).execute()
 
-        logger.info(f"eBay sync completed: {stats}")
         return stats
 
     except Exception as e:
-        logger.error(f"eBay sync failed: {e}")
-
         # Update job record with error
         if job_id:
             error_data = {
@@ -89,6 +97,41 @@ def sync_ebay_task(self, keywords: str = "vintage jeans", limit: int = 100) -> D
             }
             supabase.table("marketplace_sync_jobs").update(error_data).eq("id", job_id).execute()
 
+        raise
+
+    finally:
+        # Cached marketplace summaries/stats are stale once the sync finishes
+        cache_invalidate_sync(pattern="marketplace:*")
+
+
+@app.task(
+    bind=True,
+    name="tasks.marketplace_tasks.sync_ebay_task",
+    ignore_result=True,  # Results live in marketplace_sync_jobs
+    max_retries=int(os.getenv("CELERY_MAX_RETRIES", 3)),
+    default_retry_delay=int(os.getenv("CELERY_RETRY_DELAY", 60))
+)
+def sync_ebay_task(self, keywords: str = "vintage jeans", limit: int = 100) -> Dict[str, Any]:
+    """
+    Celery task to sync eBay listings.
+
+    Args:
+        keywords: Search keywords
+        limit: Maximum listings to sync
+
+    Returns:
+        Sync statistics dictionary
+    """
+    logger.info(f"Starting eBay sync task: {keywords} (limit: {limit})")
+
+    try:
+        stats = _run_tracked_sync("ebay", sync_ebay_listings, keywords, limit, self.request.id)
+        logger.info(f"eBay sync completed: {stats}")
+        return stats
+
+    except Exception as e:
+        logger.error(f"eBay sync failed: {e}")
+
         # Retry task
         raise self.retry(exc=e)
 
@@ -96,6 +139,7 @@ def sync_ebay_task(self, keywords: str = "vintage jeans", limit: int = 100) -> D
 @app.task(
     bind=True,
     name="tasks.marketplace_tasks.sync_etsy_task",
+    ignore_result=True,  # Results live in marketplace_sync_jobs
     max_retries=int(os.getenv("CELERY_MAX_RETRIES", 3)),
     default_retry_delay=int(os.getenv("CELERY_RETRY_DELAY", 60))
 )
@@ -112,54 +156,14 @@ def sync_etsy_task(self, keywords: str = "vintage jeans", limit: int = 100) -> D
     """
     logger.info(f"Starting Etsy sync task: {keywords} (limit: {limit})")
 
-    # Create sync job record
-    supabase = get_supabase_client()
-    job_data = {
-        "platform": "etsy",
-        "job_type": "incremental_sync",
-        "status": "running",
-        "started_at": datetime.now().isoformat(),
-        "celery_task_id": self.request.id
-    }
-
     try:
-        # Insert job record
-        job_result = supabase.table("marketplace_sync_jobs").insert(job_data).execute()
-        job_id = job_result.data[0]["id"] if job_result.data else None
-
-        # Execute sync
-        start_time = datetime.now()
-        stats = sync_etsy_listings(keywords, limit)
-        duration = (datetime.now() - start_time).total_seconds()
-
-        # Update job record with results
-        if job_id:
-            update_data = {
-                "status": "completed",
-                "completed_at": datetime.now().isoformat(),
-                "duration_seconds": int(duration),
-                "listings_processed": stats.get("listings_found", 0),
-                "listings_added": stats.get("added", 0),
-                "listings_updated": stats.get("updated", 0),
-            }
-            supabase.table("marketplace_sync_jobs").update(update_data).eq("id", job_id).execute()
-
+        stats = _run_tracked_sync("etsy", sync_etsy_listings, keywords, limit, self.request.id)
         logger.info(f"Etsy sync completed: {stats}")
         return stats
 
     except Exception as e:
         logger.error(f"Etsy sync failed: {e}")
 
-        # Update job record with error
-        if job_id:
-            error_data = {
-                "status": "failed",
-                "completed_at": datetime.now().isoformat(),
-                "error_message": str(e),
-                "error_details": {"exception_type": type(e).__name__}
-            }
-            supabase.table("marketplace_sync_jobs").update(error_data).eq("id", job_id).execute()
-
         # Retry task
         raise self.retry(exc=e)
 
@@ -167,6 +171,7 @@ def sync_etsy_task(self, keywords: str = "vintage jeans", limit: int = 100) -> D
 @app.task(
     bind=True,
     name="tasks.marketplace_tasks.sync_reddit_task",
+    ignore_result=True,  # Results live in marketplace_sync_jobs
     max_retries=int(os.getenv("CELERY_MAX_RETRIES", 3)),
     default_retry_delay=int(os.getenv("CELERY_RETRY_DELAY", 60))
 )
@@ -183,62 +188,28 @@ def sync_reddit_task(self, keywords: str = "vintage jeans", limit: int = 100) ->
     """
     logger.info(f"Starting Reddit sync task: {keywords} (limit: {limit})")
 
-    # Create sync job record
-    supabase = get_supabase_client()
-    job_data = {
-        "platform": "reddit",
-        "job_type": "incremental_sync",
-        "status": "running",
-        "started_at": datetime.now().isoformat(),
-        "celery_task_id": self.request.id
-    }
-
     try:
-        # Insert job record
-        job_result = supabase.table("marketplace_sync_jobs").insert(job_data).execute()
-        job_id = job_result.data[0]["id"] if job_result.data else None
-
-        # Execute sync
-        start_time = datetime.now()
-        stats = sync_reddit_posts(keywords, limit)
-        duration = (datetime.now() - start_time).total_seconds()
-
-        # Update job record with results
-        if job_id:
-            update_data = {
-                "status": "completed",
-                "completed_at": datetime.now().isoformat(),
-                "duration_seconds": int(duration),
-                "listings_processed": stats.get("posts_found", 0),
-                "listings_added": stats.get("added", 0),
-                "listings_updated": stats.get("updated", 0),
-            }
-            supabase.table("marketplace_sync_jobs").update(update_data).eq("id", job_id).execute()
-
+        stats = _run_tracked_sync(
+            "reddit", sync_reddit_posts, keywords, limit, self.request.id, processed_key="posts_found"
+        )
         logger.info(f"Reddit sync completed: {stats}")
         return stats
 
     except Exception as e:
         logger.error(f"Reddit sync failed: {e}")
 
-        # Update job record with error
-        if job_id:
-            error_data = {
-                "status": "failed",
-                "completed_at": datetime.now().isoformat(),
-                "error_message": str(e),
-                "error_details": {"exception_type": type(e).__name__}
-            }
-            supabase.table("marketplace_sync_jobs").update(error_data).eq("id", job_id).execute()
-
         # Retry task
         raise self.retry(exc=e)
 
 
-@app.task(name="tasks.marketplace_tasks.sync_all_marketplaces")
-def sync_all_marketplaces_task(keywords: str = "vintage jeans", limit: int = 100) -> Dict[str, Any]:
+@app.task(bind=True, name="tasks.marketplace_tasks.sync_all_marketplaces")
+def sync_all_marketplaces_task(self, keywords: str = "vintage jeans", limit: int = 100) -> Dict[str, Any]:
     """
-    Sync all marketplaces in parallel using Celery groups.
+    Sync all marketplaces concurrently within a single task.
+
+    The three platform syncs run side by side in this worker (one broker
+    message per interval instead of three), each recorded as its own
+    marketplace_sync_jobs row. A failing platform does not stop the others.
 
     Args:
         keywords: Search keywords
@@ -247,40 +218,42 @@ def sync_all_marketplaces_task(keywords: str = "vintage jeans", limit: int = 100
     Returns:
         Combined statistics from all marketplaces
     """
-    from celery import group
-
     logger.info(f"Starting full marketplace sync: {keywords}")
 
-    # Create group of tasks to run in parallel
-    job = group([
-        sync_ebay_task.s(keywords, limit),
-        sync_etsy_task.s(keywords, limit),
-        sync_reddit_task.s(keywords, limit)
-    ])
-
-    # Execute tasks in parallel
-    result = job.apply_async()
-
-    # Wait for all tasks to complete (with timeout)
-    results = result.get(timeout=600)  # 10 minute timeout
+    syncs = [
+        ("ebay", sync_ebay_listings, "listings_found"),
+        ("etsy", sync_etsy_listings, "listings_found"),
+        ("reddit", sync_reddit_posts, "posts_found"),
+    ]
+
+    # Plain threads (greenlets on the gevent io worker), not an event loop:
+    # the eBay and Etsy syncs start their own loops via run_coroutine
+    with ThreadPoolExecutor(max_workers=len(syncs)) as executor:
+        futures = [
+            executor.submit(
+                _run_tracked_sync, platform, sync_fn, keywords, limit, self.request.id, processed_key
+            )
+            for platform, sync_fn, processed_key in syncs
+        ]
+    results = [future.exception() or future.result() for future in futures]
 
     # Combine statistics
-    combined_stats = {
-        "ebay": results[0] if len(results) > 0 else {},
-        "etsy": results[1] if len(results) > 1 else {},
-        "reddit": results[2] if len(results) > 2 else {},
-        "total_listings": sum([
-            results[0].get("listings_found", 0) if len(results) > 0 else 0,
-            results[1].get("listings_found", 0) if len(results) > 1 else 0,
-            results[2].get("posts_found", 0) if len(results) > 2 else 0
-        ])
-    }
+    combined_stats: Dict[str, Any] = {}
+    total_listings = 0
+    for (platform, _, processed_key), result in zip(syncs, results):
+        if isinstance(result, Exception):
+            logger.error(f"{platform} sync failed: {result}")
+            combined_stats[platform] = {"status": "failed", "error": str(result)}
+        else:
+            combined_stats[platform] = result
+            total_listings += result.get(processed_key, 0)
+    combined_stats["total_listings"] = total_listings
 
     logger.info(f"Full marketplace sync completed: {combined_stats}")
     return combined_stats
 
 
-@app.task(name="tasks.marketplace_tasks.cleanup_old_sync_jobs")
+@app.task(name="tasks.marketplace_tasks.cleanup_old_sync_jobs", ignore_result=True)
 def cleanup_old_sync_jobs(days_to_keep: int = 30) -> Dict[str, int]:
     """
     Clean up old sync job records.
@@ -297,12 +270,14 @@ def cleanup_old_sync_jobs(days_to_keep: int = 30) -> Dict[str, int]:
     cutoff_date = datetime.now() - timedelta(days=days_to_keep)
 
     try:
-        # Delete old job records
-        result = supabase.table("marketplace_sync_jobs").delete().lt(
+        # Delete old job records (count only, the deleted rows aren't sent back)
+        result = supabase.table("marketplace_sync_jobs").delete(
+            count="exact", returning=ReturnMethod.minimal
+        ).lt(
             "created_at", cutoff_date.isoformat()
         ).execute()
 
-        deleted_count = len(result.data) if result.data else 0
+        deleted_count = result.count or 0
         logger.info(f"Cleaned up {deleted_count} old sync job records")
 
         return {"deleted": deleted_count, "cutoff_date": cutoff_date.isoformat()}
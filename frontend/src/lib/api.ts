@@ -108,7 +108,7 @@ export interface BlogPost {
   meta_description?: string
   meta_keywords?: string
   category: string
-  tags?: string
+  tags?: string[]
   author: string
   author_id?: string  // UUID
   status: string
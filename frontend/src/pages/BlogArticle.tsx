@@ -111,10 +111,10 @@ export default function BlogArticle() {
             </div>
 
             {/* Tags */}
-            {post.tags && (
+            {post.tags && post.tags.length > 0 && (
               <div className="mt-12 pt-8 border-t">
                 <div className="flex flex-wrap gap-2">
-                  {JSON.parse(post.tags).map((tag: string, index: number) => (
+                  {post.tags.map((tag: string, index: number) => (
                     <span
                       key={index}
                       className="px-3 py-1 bg-indigo-50 text-indigo-600 text-sm rounded-full"